@@ -338,6 +338,111 @@ class Board(ABC):
         
         pass
 
+    def getAlignmentStrengths(self, alignLength: int) -> list[int]:
+        
+        """
+        Returns the alignment strength of each player, on which the win conditions base their evaluation.
+        The strength of a player is the sum, for each piece count k from 2 to alignLength - 1,
+        of 2 * k times the number of lines holding at least k of its pieces and no opponent piece.
+        
+        Parameters:
+            alignLength (int): The length of the lines.
+        
+        Returns:
+            list[int]: The alignment strength of each player, indexed by player index.
+        """
+        
+        return [sum(2 * pieceCount * self.countAvaillableLineOfAtLeastGivenPiece(playerIndex, alignLength, pieceCount) for pieceCount in range(2, alignLength)) for playerIndex in range(len(self.__playerEntities__))]
+
+    def hasOpenLine(self, alignLength: int) -> bool:
+        
+        """
+        Returns whether a line of the given length can still be completed by a player,
+        that is a line holding no blocked case and pieces of at most one player.
+        A board that can not tell considers that a line is still open.
+        
+        Parameters:
+            alignLength (int): The length of the lines.
+        
+        Returns:
+            bool: True if a line is open for a player.
+        """
+        
+        return True
+
+    def getOpenLineCasesMask(self, alignLength: int) -> int:
+        
+        """
+        Returns the mask of the cases (bit line * width + column) lying on at least one line of the given length that a player can still complete.
+        A board that can not tell considers that every case lies on an open line.
+        
+        Parameters:
+            alignLength (int): The length of the lines.
+        
+        Returns:
+            int: The mask of the cases of the open lines.
+        """
+        
+        return (1 << (self.__width__ * self.__height__)) - 1
+
+    def clearSquareAround(self, line: int, column: int) -> tuple:
+
+        """
+        Removes the entities and unblocks the cases of the 3x3 square centered on a case, cut by the borders of the board.
+        The returned state is what restoreSquareAround needs to put the square back as it was.
+
+        Parameters:
+            line (int): The line number of the center case.
+            column (int): The column number of the center case.
+
+        Returns:
+            tuple: The entity and whether the case was blocked, for each case of the square.
+        """
+
+        clearedCases : list[tuple[Entity, bool]] = []
+
+        for currentLine in range(line - 1, line + 2):
+            for currentColumn in range(column - 1, column + 2):
+
+                if(0 <= currentLine < self.__height__ and 0 <= currentColumn < self.__width__):
+
+                    clearedCases.append((self.getEntityAt(currentLine, currentColumn), self.isCaseBlocked(currentLine, currentColumn)))
+
+                    self.setIsCaseBlocked(currentLine, currentColumn, False)
+                    self.removeEntityAt(currentLine, currentColumn)
+
+        return tuple(clearedCases)
+
+    def restoreSquareAround(self, line: int, column: int, clearedCases: tuple) -> bool:
+
+        """
+        Puts back the 3x3 square centered on a case as it was before clearSquareAround.
+
+        Parameters:
+            line (int): The line number of the center case.
+            column (int): The column number of the center case.
+            clearedCases (tuple): The state returned by clearSquareAround.
+
+        Returns:
+            bool: True if the square is restored.
+        """
+
+        clearedCaseIndex : int = 0
+
+        for currentLine in range(line - 1, line + 2):
+            for currentColumn in range(column - 1, column + 2):
+
+                if(0 <= currentLine < self.__height__ and 0 <= currentColumn < self.__width__):
+
+                    entity, wasCaseBlocked = clearedCases[clearedCaseIndex]
+
+                    if(entity != None) : self.addEntityAt(currentLine, currentColumn, entity)
+                    self.setIsCaseBlocked(currentLine, currentColumn, wasCaseBlocked)
+
+                    clearedCaseIndex += 1
+
+        return True
+
     @abstractmethod
     def isFull(self) -> bool:
         
@@ -386,6 +491,19 @@ class Board(ABC):
 
         pass
 
+    @abstractmethod
+    def getAvaillableCasesMask(self) -> int:
+        
+        """
+        Returns a mask of the availlable cases on the board.
+        The bit (line * width + column) of the mask is set if the case at this line and column is availlable.
+        
+        Returns:
+            availlableCasesMask (int) : the mask of the availlable cases on the board.
+        """
+
+        pass
+
     def getWidth(self) -> int:
         
         """
@@ -419,6 +537,91 @@ class Board(ABC):
         
         return self.__playerEntities__
 
+    def getPositionSymmetries(self) -> list[list[int]]:
+        
+        """
+        Returns the symmetries of the board leaving the current position unchanged, the identity aside.
+        Each symmetry is given by the image of each bit position (line * width + column), so that the moves on symmetric cases can be told apart.
+        A board knowing nothing of its symmetries has none.
+        
+        Returns:
+            list[list[int]]: The image of each bit position by each symmetry keeping the position.
+        """
+        
+        return []
+
+    def getCanonicalKey(self) -> int:
+        
+        """
+        Returns a key shared by the current position and all its symmetric positions.
+        A board knowing nothing of its symmetries uses its hash.
+        
+        Returns:
+            int: The canonical key of the position.
+        """
+        
+        return hash(self)
+
+    def getCompactState(self) -> tuple:
+        
+        """
+        Returns a compact description of the board, made to be sent to another process and rebuilt there with fromCompactState.
+        Each case is described by a code: -1 for a blocked case, 0 for an empty case, and the player index plus one for a player piece.
+        
+        Returns:
+            tuple: The board class, its width, its height, its player entities and the code of each case, line by line.
+        """
+        
+        caseCodes : list[int] = []
+        
+        # Get the code of each case
+        for line in range(self.__height__):
+            for column in range(self.__width__):
+                
+                if self.isCaseBlocked(line, column) : caseCodes.append(-1)
+                elif self.isEntityAt(line, column) : caseCodes.append(self.__playerEntities__.index(self.getEntityAt(line, column)) + 1)
+                else : caseCodes.append(0)
+        
+        return (type(self), self.__width__, self.__height__, self.__playerEntities__, tuple(caseCodes))
+
+    @staticmethod
+    def fromCompactState(compactState: tuple) -> Board:
+        
+        """
+        Rebuilds a board from the compact description returned by getCompactState.
+        
+        Parameters:
+            compactState (tuple): The compact description of the board.
+        
+        Raises:
+            TypeError: If compactState is not a tuple.
+            ValueError: If compactState does not describe a board.
+        
+        Returns:
+            Board: The rebuilt board.
+        """
+        
+        # Check if compactState is a tuple describing a board
+        if not isinstance(compactState, tuple):
+            raise TypeError("compactState must be a tuple")
+        
+        if len(compactState) != 5 or not isinstance(compactState[0], type) or not issubclass(compactState[0], Board):
+            raise ValueError("compactState must describe a board")
+        
+        boardType, width, height, playerEntities, caseCodes = compactState
+        
+        # Build an empty board and fill each case
+        board : Board = boardType(width, height, playerEntities)
+        
+        for bitPosition, caseCode in enumerate(caseCodes):
+            
+            line, column = divmod(bitPosition, width)
+            
+            if caseCode == -1 : board.setIsCaseBlocked(line, column, True)
+            elif caseCode > 0 : board.addPlayerEntityAt(line, column, caseCode - 1)
+        
+        return board
+
     @abstractmethod
     def copy(self) -> Board:
         
@@ -3,8 +3,12 @@ from __future__ import annotations
 from modules.models.board_game.board.boards.simple_board import SimpleBoard
 from modules.models.board_game.board.boards.optimized_board import OptimizedBoard
 from modules.models.board_game.board.components.board_shape import BoardShape
+from modules.models.board_game.board.components.optimized_board_components.bitboard import BitBoard
+from modules.models.board_game.board.components.optimized_board_components.bitboards.simple_bit_board import SimpleBitBoard
 from modules.models.board_game.components.entity import Entity
 
+from typing import Type
+
 # ************************************************
 # Class BoardBuilder
 # ************************************************
@@ -65,6 +69,7 @@ class BoardBuilder:
         self.__height__: int = height
         self.__shape__: BoardShape = None
         self.__randomlyBlockedCases__: int = 0
+        self.__bitBoardType__: Type[BitBoard] = SimpleBitBoard
 
         return None
     
@@ -176,6 +181,30 @@ class BoardBuilder:
         
         return self
     
+    def setBitBoardBackend(self, bitBoardType: Type[BitBoard]) -> BoardBuilder:
+        
+        """
+        Set the bitboard implementation used by the optimized board for each of its layers.
+        
+        Parameters:
+            bitBoardType (Type[BitBoard]): The bitboard implementation.
+        
+        Raises:
+            TypeError: If bitBoardType is not a BitBoard subclass.
+        
+        Returns:
+            BoardBuilder: The current instance of the BoardBuilder class.
+        """
+        
+        # Check if bitBoardType is a BitBoard subclass
+        if not isinstance(bitBoardType, type) or not issubclass(bitBoardType, BitBoard):
+            raise TypeError("bitBoardType must be a BitBoard subclass")
+        
+        # Set the bitboard implementation
+        self.__bitBoardType__ = bitBoardType
+        
+        return self
+    
     def build(self) -> SimpleBoard:
         
         """
@@ -228,7 +257,7 @@ class BoardBuilder:
             raise ValueError(f"Width can't be outside range {MIN_WIDTH} - {MAX_WIDTH}")
         
         # Create an optimized board
-        board = OptimizedBoard(self.__width__, self.__height__, self.__playerEntities__)
+        board = OptimizedBoard(self.__width__, self.__height__, self.__playerEntities__, self.__bitBoardType__)
 
         # Apply the shape if specified
         if self.__shape__:
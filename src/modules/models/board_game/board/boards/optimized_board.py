@@ -1,10 +1,15 @@
 from modules.models.board_game.board.board import Board
 from modules.models.board_game.components.entity import Entity
 from modules.models.board_game.board.components.optimized_board_components.bitboard import BitBoard
-from modules.models.board_game.board.components.optimized_board_components.bitboards.numpy_bit_board import NumpyBitBoard
+from modules.models.board_game.board.components.optimized_board_components.bitboards.simple_bit_board import SimpleBitBoard
+from modules.models.board_game.board.components.optimized_board_components.zobrist_keys import ZobristKeys
+from modules.models.board_game.board.components.optimized_board_components.board_geometry import BoardGeometry
+from modules.models.board_game.board.components.optimized_board_components.line_tracker import LineTracker
 from modules.utils.decorator import privatemethod, override
 
+from typing import Type
 import random
+from modules.utils.trusted_mode import isTrustedModeOn
 
 # ************************************************
 # Class OptimizedBoard
@@ -22,7 +27,7 @@ class OptimizedBoard(Board):
     Represents a game board.
     """
 
-    def __init__(self, width : int, height : int, playerEntities : list[Entity]) -> None :
+    def __init__(self, width : int, height : int, playerEntities : list[Entity], bitBoardType : Type[BitBoard] = SimpleBitBoard) -> None :
         
         """
         Initializes a new instance of the Board class.
@@ -31,12 +36,14 @@ class OptimizedBoard(Board):
             width (int): The width of the board.
             height (int): The height of the board.
             player_entities (list[Entity]): A list of player entities to initialize the board with.
+            bitBoardType (Type[BitBoard]): The bitboard implementation used for each layer of the board (default is SimpleBitBoard).
             
         Raises:
             TypeError: If width or height is not an integer.
             ValueError: If width or height is less than or equal to 0.
             ValueError: If the board size is greater than 64.
             TypeError: If playerEntities is not a list of Entity instances.
+            TypeError: If bitBoardType is not a BitBoard subclass.
         
         Returns:
             None
@@ -56,19 +63,42 @@ class OptimizedBoard(Board):
         if not isinstance(playerEntities, list) and not all(isinstance(entity, Entity) for entity in playerEntities) :
             raise TypeError("playerEntities must be a list of Entity instances")
         
+        # Check if bitBoardType is a BitBoard subclass
+        if not isinstance(bitBoardType, type) or not issubclass(bitBoardType, BitBoard) :
+            raise TypeError("bitBoardType must be a BitBoard subclass")
+        
         # Call the parent constructor
         super().__init__(width, height, playerEntities)
         
         # Initialize the player boards and blocked cases
-        self.__playerBoards__ : list[BitBoard] = [NumpyBitBoard(width, height) for _ in range(len(playerEntities))]
-        self.__blockedCases__ : BitBoard = NumpyBitBoard(width, height)
+        self.__bitBoardType__ : Type[BitBoard] = bitBoardType
+        self.__playerBoards__ : list[BitBoard] = [bitBoardType(width, height) for _ in range(len(playerEntities))]
+        self.__blockedCases__ : BitBoard = bitBoardType(width, height)
         
         # Initialize the piece count
         self.__blockedCaseCount__ : int = 0
         self.__pieceCount__ : int = 0
 
-        # Generate the masks for checking alignments
-        self.__generateCheckWinMasks__()
+        # Get the geometry shared by every board of this size
+        self.__geometry__ : BoardGeometry = BoardGeometry.getGeometry(width, height)
+        
+        # Initialize the masks of the taken and free cases, kept up to date by each modification of the board
+        self.__fullMask__ : int = self.__geometry__.getFullMask()
+        self.__takenCases__ : int = 0
+        self.__freeCases__ : int = self.__fullMask__
+
+        # Initialize the zobrist key of the empty board
+        self.__zobristKeys__ : ZobristKeys = ZobristKeys.getKeys(width, height, len(playerEntities))
+        self.__zobristKey__ : int = 0
+
+        # Get the masks for checking alignments from the geometry
+        self.__lineMasks__ : list[int] = self.__geometry__.getLineMasks()
+        self.__columnMasks__ : list[int] = self.__geometry__.getColumnMasks()
+        self.__ascendantDiagonalMasks__ : list[int] = self.__geometry__.getAscendantDiagonalMasks()
+        self.__descendantDiagonalMasks__ : list[int] = self.__geometry__.getDescendantDiagonalMasks()
+        
+        # Initialize the line trackers, only built for the lengths the alignment strengths are asked for
+        self.__lineTrackers__ : dict[int, LineTracker] = {}
         
         return None
 
@@ -90,61 +120,42 @@ class OptimizedBoard(Board):
             int: The bit index.
         """
         
-        # Check if line and column are integers and within the board dimensions
-        if not isinstance(line, int) or not isinstance(column, int):
-            raise TypeError("Line and column must be integers")
-        
-        if line < 0 or line >= self.getHeight():
-            raise ValueError(f"Line must be between 0 and {self.getHeight() - 1}")
-        
-        if column < 0 or column >= self.getWidth():
-            raise ValueError(f"Column must be between 0 and {self.getWidth() - 1}")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if line and column are integers and within the board dimensions
+            if not isinstance(line, int) or not isinstance(column, int):
+                raise TypeError("Line and column must be integers")
+
+            if line < 0 or line >= self.getHeight():
+                raise ValueError(f"Line must be between 0 and {self.getHeight() - 1}")
+
+            if column < 0 or column >= self.getWidth():
+                raise ValueError(f"Column must be between 0 and {self.getWidth() - 1}")
         
         return line * self.__width__ + column
 
     @privatemethod
-    def __generateCheckWinMasks__(self) -> bool:
+    def __setIsCaseTaken__(self, bitPosition : int, isTaken : bool) -> bool:
         
         """
-        This method allow initializing masks foreach possible line lenght, that allow then finding correctly 
-        if there is alignments in any positions, for any given line length
+        Updates the masks of the taken and free cases for a case.
+        A case is never both blocked and holding a piece, so a case is freed as soon as its piece is removed or it is unblocked.
+        
+        Parameters:
+            bitPosition (int): The bit position of the case.
+            isTaken (bool): True if the case is now taken, False if it is now free.
         
         Returns:
-            bool: True if the masks are generated successfully.
+            bool: True if the masks are updated.
         """
-
-        # Initialize the masks for checking alignments with empty lists
-        self.__lineMasks__ : list[int] = []
-        self.__columnMasks__ : list[int] = []
-        self.__ascendantDiagonalMasks__ : list[int] = []
-        self.__descendantDiagonalMasks__ : list[int] = []
-
-        # Generate the masks for checking alignments
-        for alinmentLength in range(0, max(self.__width__, self.__height__) + 1):
-
-            # Add a mask for each alignment length
-            self.__lineMasks__.append(0)
-            self.__columnMasks__.append(0)
-            self.__ascendantDiagonalMasks__.append(0)
-            self.__descendantDiagonalMasks__.append(0)
-
-            # Set the bits for each alignment length
-            for lineIndex in range(0, self.__height__) :
-                for columnIndex in range(0, self.__width__) :
-
-                    # Set the bits depending on the alignment length
-                    if(lineIndex <= self.__height__ - alinmentLength) : 
-                        self.__columnMasks__[alinmentLength] += (1 << self.__getBitPosition__(lineIndex, columnIndex))
-                        
-                    if(columnIndex <= self.__width__ - alinmentLength) : 
-                        self.__lineMasks__[alinmentLength] += (1 << self.__getBitPosition__(lineIndex, columnIndex))
-                        
-                    if(lineIndex <= self.__height__ - alinmentLength and columnIndex <= self.__width__ - alinmentLength) : 
-                        self.__descendantDiagonalMasks__[alinmentLength] += (1 << self.__getBitPosition__(lineIndex, columnIndex))
-                        
-                    if(lineIndex <= self.__height__ - alinmentLength and columnIndex >= alinmentLength - 1) : 
-                        self.__ascendantDiagonalMasks__[alinmentLength] += (1 << self.__getBitPosition__(lineIndex, columnIndex))
-                        
+        
+        # Update the taken cases, the free cases being their complement
+        if isTaken : self.__takenCases__ |= (1 << bitPosition)
+        else : self.__takenCases__ &= ~(1 << bitPosition)
+        
+        self.__freeCases__ = self.__fullMask__ & ~self.__takenCases__
+        
         return True
 
     @override
@@ -165,25 +176,23 @@ class OptimizedBoard(Board):
             bool: True if the case is available, False otherwise.
         """
         
-        # Check if line and column are integers and within the board dimensions
-        if not isinstance(line, int) or not isinstance(column, int): 
-            raise TypeError("Line and column must be integers")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if line and column are integers and within the board dimensions
+            if not isinstance(line, int) or not isinstance(column, int): 
+                raise TypeError("Line and column must be integers")
 
-        if(line < 0 or line >= self.getHeight()): 
-            raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
-        
-        if(column < 0 or column >= self.getWidth()): 
-            raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
+            if(line < 0 or line >= self.getHeight()): 
+                raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
+
+            if(column < 0 or column >= self.getWidth()): 
+                raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
 
         # Get the bit position of the case
         bit_position = self.__getBitPosition__(line, column)
 
-        # Check if the case is available
-        takenCases = 0
-        for player_board in self.__playerBoards__ : takenCases |= player_board.getValue()
-        takenCases |= self.__blockedCases__.getValue()
-
-        return (takenCases & (1 << bit_position)) == 0
+        return (self.__freeCases__ & (1 << bit_position)) != 0
     
     @override
     def isCaseBlocked(self, line : int, column : int) -> bool:
@@ -203,15 +212,18 @@ class OptimizedBoard(Board):
             bool: True if the case is blocked, False otherwise.
         """
         
-        # Check if line and column are integers and within the board dimensions
-        if not isinstance(line, int) or not isinstance(column, int): 
-            raise TypeError("Line and column must be integers")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if line and column are integers and within the board dimensions
+            if not isinstance(line, int) or not isinstance(column, int): 
+                raise TypeError("Line and column must be integers")
 
-        if(line < 0 or line >= self.getHeight()): 
-            raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
-        
-        if(column < 0 or column >= self.getWidth()): 
-            raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
+            if(line < 0 or line >= self.getHeight()): 
+                raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
+
+            if(column < 0 or column >= self.getWidth()): 
+                raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
 
         # Get the bit position of the case and check if it is blocked
         bit_position = self.__getBitPosition__(line, column)
@@ -237,15 +249,18 @@ class OptimizedBoard(Board):
             bool: True if the case is blocked.
         """        
 
-        # Check if line and column are integers and within the board dimensions
-        if not isinstance(line, int) or not isinstance(column, int): 
-            raise TypeError("Line and column must be integers")
-        
-        if(line < 0 or line >= self.getHeight()): 
-            raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
-        
-        if(column < 0 or column >= self.getWidth()): 
-            raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if line and column are integers and within the board dimensions
+            if not isinstance(line, int) or not isinstance(column, int): 
+                raise TypeError("Line and column must be integers")
+
+            if(line < 0 or line >= self.getHeight()): 
+                raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
+
+            if(column < 0 or column >= self.getWidth()): 
+                raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
 
         # Get the bit position of the case
         bit_position = self.__getBitPosition__(line, column)
@@ -255,11 +270,17 @@ class OptimizedBoard(Board):
              
             self.__blockedCaseCount__ += 1
             self.__blockedCases__.applyOr(1 << bit_position)
+            self.__zobristKey__ ^= self.__zobristKeys__.getBlockedKey(bit_position)
+            self.__setIsCaseTaken__(bit_position, True)
+            for lineTracker in self.__lineTrackers__.values() : lineTracker.blockCase(bit_position)
             
         elif(self.__blockedCases__.getValue() & (1 << bit_position) != 0 and not isBlocked) :
             
             self.__blockedCaseCount__ -= 1
             self.__blockedCases__.applyXor(1 << bit_position)
+            self.__zobristKey__ ^= self.__zobristKeys__.getBlockedKey(bit_position)
+            self.__setIsCaseTaken__(bit_position, False)
+            for lineTracker in self.__lineTrackers__.values() : lineTracker.unblockCase(bit_position)
             
         return True
 
@@ -281,15 +302,18 @@ class OptimizedBoard(Board):
             Entity: The entity at the specified location.
         """
         
-        # Check if line and column are integers and within the board dimensions
-        if not isinstance(line, int) or not isinstance(column, int): 
-            raise TypeError("Line and column must be integers")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if line and column are integers and within the board dimensions
+            if not isinstance(line, int) or not isinstance(column, int): 
+                raise TypeError("Line and column must be integers")
 
-        if(line < 0 or line >= self.getHeight()): 
-            raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
-        
-        if(column < 0 or column >= self.getWidth()): 
-            raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
+            if(line < 0 or line >= self.getHeight()): 
+                raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
+
+            if(column < 0 or column >= self.getWidth()): 
+                raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
 
         # Get the bit position of the case
         bit_position = self.__getBitPosition__(line, column)
@@ -319,15 +343,18 @@ class OptimizedBoard(Board):
             bool: True if there is an entity at the specified location, False otherwise.
         """
 
-        # Check if line and column are integers and within the board dimensions
-        if not isinstance(line, int) or not isinstance(column, int): 
-            raise TypeError("Line and column must be integers")
-        
-        if(line < 0 or line >= self.getHeight()): 
-            raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
-        
-        if(column < 0 or column >= self.getWidth()): 
-            raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if line and column are integers and within the board dimensions
+            if not isinstance(line, int) or not isinstance(column, int): 
+                raise TypeError("Line and column must be integers")
+
+            if(line < 0 or line >= self.getHeight()): 
+                raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
+
+            if(column < 0 or column >= self.getWidth()): 
+                raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
 
         # Get the bit position of the case
         bit_position = self.__getBitPosition__(line, column)
@@ -359,26 +386,35 @@ class OptimizedBoard(Board):
             bool: True if the entity is added successfully.
         """
         
-        # Check if line and column are integers and within the board dimensions
-        if not isinstance(line, int) or not isinstance(column, int): 
-            raise TypeError("Line and column must be integers")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if line and column are integers and within the board dimensions
+            if not isinstance(line, int) or not isinstance(column, int): 
+                raise TypeError("Line and column must be integers")
 
-        if(line < 0 or line >= self.getHeight()): 
-            raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
-        
-        if(column < 0 or column >= self.getWidth()): 
-            raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
-        
-        # Check if playerIndex is an integer
-        if not isinstance(playerIndex, int): 
-            raise TypeError("Player index must be an integer")
+            if(line < 0 or line >= self.getHeight()): 
+                raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
+
+            if(column < 0 or column >= self.getWidth()): 
+                raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
+
+            # Check if playerIndex is an integer
+            if not isinstance(playerIndex, int): 
+                raise TypeError("Player index must be an integer")
 
         # Get the bit position of the case
         bit_position = self.__getBitPosition__(line, column)
         
+        # Update the zobrist key and the line trackers if the case was not already taken by the player
+        if self.__playerBoards__[playerIndex].getValue() & (1 << bit_position) == 0:
+            self.__zobristKey__ ^= self.__zobristKeys__.getPlayerKey(playerIndex, bit_position)
+            for lineTracker in self.__lineTrackers__.values() : lineTracker.addPiece(playerIndex, bit_position)
+
         # Add the player's entity to the specified location
         self.__playerBoards__[playerIndex].applyOr(1 << bit_position)
         self.__pieceCount__ += 1
+        self.__setIsCaseTaken__(bit_position, True)
 
         return True
     
@@ -403,19 +439,22 @@ class OptimizedBoard(Board):
             bool: True if the entity is added successfully.
         """
         
-        # Check if line and column are integers and within the board dimensions
-        if not isinstance(line, int) or not isinstance(column, int): 
-            raise TypeError("Line and column must be integers")
-        
-        if(line < 0 or line >= self.getHeight()): 
-            raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
-        
-        if(column < 0 or column >= self.getWidth()): 
-            raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
-        
-        # Check if entity is an instance of Entity
-        if not isinstance(entity, Entity):
-            raise TypeError("Entity must be an instance of Entity")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if line and column are integers and within the board dimensions
+            if not isinstance(line, int) or not isinstance(column, int): 
+                raise TypeError("Line and column must be integers")
+
+            if(line < 0 or line >= self.getHeight()): 
+                raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
+
+            if(column < 0 or column >= self.getWidth()): 
+                raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
+
+            # Check if entity is an instance of Entity
+            if not isinstance(entity, Entity):
+                raise TypeError("Entity must be an instance of Entity")
 
         # Initialize the player index and boolean to check if the entity is found
         playerIndex : int = 0
@@ -435,9 +474,15 @@ class OptimizedBoard(Board):
         # Get the bit position of the case
         bit_position = self.__getBitPosition__(line, column)
         
+        # Update the zobrist key and the line trackers if the case was not already taken by the player
+        if self.__playerBoards__[playerIndex].getValue() & (1 << bit_position) == 0:
+            self.__zobristKey__ ^= self.__zobristKeys__.getPlayerKey(playerIndex, bit_position)
+            for lineTracker in self.__lineTrackers__.values() : lineTracker.addPiece(playerIndex, bit_position)
+
         # Add the entity to the specified location
         self.__playerBoards__[playerIndex].applyOr(1 << bit_position)
         self.__pieceCount__ += 1
+        self.__setIsCaseTaken__(bit_position, True)
 
         return True
 
@@ -455,15 +500,18 @@ class OptimizedBoard(Board):
             bool: True if the entity is removed successfully.
         """
         
-        # Check if line and column are integers and within the board dimensions
-        if not isinstance(line, int) or not isinstance(column, int):
-            raise TypeError("Line and column must be integers")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if line and column are integers and within the board dimensions
+            if not isinstance(line, int) or not isinstance(column, int):
+                raise TypeError("Line and column must be integers")
 
-        if(line < 0 or line >= self.getHeight()): 
-            raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
-        
-        if(column < 0 or column >= self.getWidth()): 
-            raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
+            if(line < 0 or line >= self.getHeight()): 
+                raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
+
+            if(column < 0 or column >= self.getWidth()): 
+                raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
 
         # Get the bit position of the case
         bit_position = self.__getBitPosition__(line, column)
@@ -481,6 +529,9 @@ class OptimizedBoard(Board):
             if self.__playerBoards__[playerIndex].getValue() & (1 << bit_position) != 0:
                 self.__playerBoards__[playerIndex].applyAnd(bitToRemove)
                 self.__pieceCount__ -= 1
+                self.__zobristKey__ ^= self.__zobristKeys__.getPlayerKey(playerIndex, bit_position)
+                self.__setIsCaseTaken__(bit_position, False)
+                for lineTracker in self.__lineTrackers__.values() : lineTracker.removePiece(playerIndex, bit_position)
 
         return True
 
@@ -488,7 +539,9 @@ class OptimizedBoard(Board):
     def checkAlignmentOnCaseForPlayer(self, line : int, column : int, playerIndex : int, alignLength : int) -> bool:
         
         """
-        Checks if any player has an alignment of the specified length, on the given case.
+        Checks if the player has an alignment of the specified length passing through the given case.
+        Only the lines passing through the case are examined, so this is much cheaper than checkAlignmentForPlayer
+        when the case is the one of the last piece played.
 
         Parameters:
             line (int): The line number of the case.
@@ -504,34 +557,43 @@ class OptimizedBoard(Board):
             TypeError: If alignLength is not an integer.
 
         Returns:
-            int: The index of the player with the alignment, or -1 if no alignment exists.
+            bool: True if the player has an alignment passing through the case, False otherwise.
         """
         
-        # Check if line and column are integers and within the board dimensions
-        if not isinstance(line, int) or not isinstance(column, int):
-            raise TypeError("Line and column must be integers")
-        
-        if(line < 0 or line >= self.getHeight()):
-            raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
-        
-        if(column < 0 or column >= self.getWidth()):
-            raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
-        
-        # Check if playerIndex is an integer and within the player boards range
-        if not isinstance(playerIndex, int):
-            raise TypeError("Player index must be an integer")
-        
-        if(playerIndex < 0 or playerIndex >= len(self.__playerBoards__)):
-            raise ValueError(f"Player index is out of range. Should be from 0 to {len(self.__playerBoards__)} but was <{playerIndex}>")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if line and column are integers and within the board dimensions
+            if not isinstance(line, int) or not isinstance(column, int):
+                raise TypeError("Line and column must be integers")
+
+            if(line < 0 or line >= self.getHeight()):
+                raise ValueError(f"Line is out of range. Should be from 0 to {self.getHeight()} but was <{line}>")
+
+            if(column < 0 or column >= self.getWidth()):
+                raise ValueError(f"Column is out of range. Should be from 0 to {self.getWidth()} but was <{column}>")
+
+            # Check if playerIndex is an integer and within the player boards range
+            if not isinstance(playerIndex, int):
+                raise TypeError("Player index must be an integer")
+
+            if(playerIndex < 0 or playerIndex >= len(self.__playerBoards__)):
+                raise ValueError(f"Player index is out of range. Should be from 0 to {len(self.__playerBoards__)} but was <{playerIndex}>")
+
+            # Check if alignLength is an integer, greater than 0 and less than the board dimensions
+            if not isinstance(alignLength, int):
+                raise TypeError("Alignment length must be an integer")
+
+            if(alignLength <= 0 and alignLength > self.__width__ and alignLength > self.__height__):
+                raise ValueError("Alignment length must be greater than 0 and less than the board dimensions")
+
+        # Check if one of the lines passing through the case is fully taken by the player
+        playerPieces : int = self.__playerBoards__[playerIndex].getValue()
         
-        # Check if alignLength is an integer, greater than 0 and less than the board dimensions
-        if not isinstance(alignLength, int):
-            raise TypeError("Alignment length must be an integer")
+        for lineMask in self.__geometry__.getCaseLineMasks(alignLength)[self.__getBitPosition__(line, column)] :
+            if playerPieces & lineMask == lineMask : return True
         
-        if(alignLength <= 0 and alignLength > self.__width__ and alignLength > self.__height__):
-            raise ValueError("Alignment length must be greater than 0 and less than the board dimensions")
-
-        return self.checkAlignmentForPlayer(playerIndex, alignLength)
+        return False
     
     @override
     def checkAlignmentForPlayer(self, playerIndex : int, alignLength : int) -> bool:
@@ -558,19 +620,22 @@ class OptimizedBoard(Board):
             bool: True if the player's entities are aligned, False otherwise.
         """
         
-        # Check if playerIndex is an integer and within the player boards range
-        if not isinstance(playerIndex, int):
-            raise TypeError("Player index must be an integer")
-        
-        if(playerIndex < 0 or playerIndex >= len(self.__playerBoards__)):
-            raise ValueError(f"Player index is out of range. Should be from 0 to {len(self.__playerBoards__)} but was <{playerIndex}>")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if playerIndex is an integer and within the player boards range
+            if not isinstance(playerIndex, int):
+                raise TypeError("Player index must be an integer")
 
-        # Check if alignLength is an integer, greater than 0 and less than the board dimensions
-        if not isinstance(alignLength, int):
-            raise TypeError("Alignment length must be an integer")
-        
-        if(alignLength <= 0 and alignLength > self.__width__ and alignLength > self.__height__):
-            raise ValueError("Alignment length must be greater than 0 and less than the board dimensions")
+            if(playerIndex < 0 or playerIndex >= len(self.__playerBoards__)):
+                raise ValueError(f"Player index is out of range. Should be from 0 to {len(self.__playerBoards__)} but was <{playerIndex}>")
+
+            # Check if alignLength is an integer, greater than 0 and less than the board dimensions
+            if not isinstance(alignLength, int):
+                raise TypeError("Alignment length must be an integer")
+
+            if(alignLength <= 0 and alignLength > self.__width__ and alignLength > self.__height__):
+                raise ValueError("Alignment length must be greater than 0 and less than the board dimensions")
 
         # Initialize the player's pieces
         playerPieces : int = self.__playerBoards__[playerIndex].getValue()
@@ -618,12 +683,15 @@ class OptimizedBoard(Board):
             int: The index of the player with the alignment, or -1 if no alignment exists.
         """
         
-        # Check if alignLength is an integer, greater than 0 and less than the board dimensions
-        if not isinstance(alignLength, int):
-            raise TypeError("Alignment length must be an integer")
-        
-        if(alignLength <= 0 and alignLength > self.__width__ and alignLength > self.__height__):
-            raise ValueError("Alignment length must be greater than 0 and less than the board dimensions")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if alignLength is an integer, greater than 0 and less than the board dimensions
+            if not isinstance(alignLength, int):
+                raise TypeError("Alignment length must be an integer")
+
+            if(alignLength <= 0 and alignLength > self.__width__ and alignLength > self.__height__):
+                raise ValueError("Alignment length must be greater than 0 and less than the board dimensions")
 
         # Check if any player has an alignment of the specified length
         for playerIndex in range(0, len(self.__playerBoards__)):
@@ -632,15 +700,19 @@ class OptimizedBoard(Board):
         return -1
 
     @override
-    def checkIfPlayerHaveAlignmentOnCase(self, alignLength: int) -> int:
+    def checkIfPlayerHaveAlignmentOnCase(self, line: int, column: int, alignLength: int) -> int:
         
         """
-        Checks if any player has a sequence of aligned entities of the specified length on a case.
+        Checks if any player has a sequence of aligned entities of the specified length passing through a case.
 
         Parameters:
+            line (int): The line number of the case.
+            column (int): The column number of the case.
             alignLength (int): Required alignment length.
             
         Raises:
+            TypeError: If line or column is not an integer.
+            ValueError: If line or column is out of range.
             TypeError: If alignLength is not an integer.
             ValueError: If alignLength is less than 0 or greater than the board dimensions.
 
@@ -648,16 +720,19 @@ class OptimizedBoard(Board):
             int: Player index if alignment exists, -1 otherwise.
         """
         
-        # Check if alignLength is an integer, greater than 0 and less than the board dimensions
-        if not isinstance(alignLength, int):
-            raise TypeError("Alignment length must be an integer")
-        
-        if(alignLength <= 0 and alignLength > self.__width__ and alignLength > self.__height__):
-            raise ValueError("Alignment length must be greater than 0 and less than the board dimensions")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if alignLength is an integer, greater than 0 and less than the board dimensions
+            if not isinstance(alignLength, int):
+                raise TypeError("Alignment length must be an integer")
+
+            if(alignLength <= 0 and alignLength > self.__width__ and alignLength > self.__height__):
+                raise ValueError("Alignment length must be greater than 0 and less than the board dimensions")
 
         # Check if any player has an alignment of the specified length on a case
         for playerIndex in range(0, len(self.__playerBoards__)):
-            if(self.checkAlignmentOnCaseForPlayer(playerIndex, alignLength)) : return playerIndex
+            if(self.checkAlignmentOnCaseForPlayer(line, column, playerIndex, alignLength)) : return playerIndex
         
         return -1
 
@@ -665,7 +740,9 @@ class OptimizedBoard(Board):
     def countAvaillableLineOfAtLeastGivenPiece(self, playerIndex: int, alignLength: int, pieceCount: int) -> int:
         
         """
-        Returns the number of lines that contain at least a given amount of the player's pieces and no opponent pieces.
+        Returns the number of lines that contain at least a given amount of the player's pieces, no opponent pieces and no blocked case.
+        The lines are taken from the list the geometry keeps for each length and each set of blocked cases,
+        and the player's pieces of each line are counted at once with a popcount.
 
         Parameters:
             playerIndex (int): The player's index.
@@ -682,98 +759,256 @@ class OptimizedBoard(Board):
             int: The number of valid lines.
         """
         
-        # Check if playerIndex is an integer and within the player boards range
-        if not isinstance(playerIndex, int): 
-            raise TypeError("Player index must be an integer")
-        
-        if playerIndex < 0 or playerIndex >= len(self.__playerBoards__):
-            raise ValueError(f"Player index is out of range. Should be from 0 to {len(self.__playerBoards__)} but was <{playerIndex}>")
-        
-        # Check if alignLength is an integer, greater than 0 and less than the board dimensions
-        if not isinstance(alignLength, int):
-            raise TypeError("Alignment length must be an integer")
-        
-        if(alignLength <= 0 and alignLength > self.__width__ and alignLength > self.__height__):
-            raise ValueError("Alignment length must be greater than 0 and less than the board dimensions")
-        
-        # Check if pieceCount is an integer and greater than 0
-        if not isinstance(pieceCount, int):
-            raise TypeError("Piece count must be an integer")
-        
-        if pieceCount <= 0:
-            raise ValueError("Piece count must be greater than 0")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if playerIndex is an integer and within the player boards range
+            if not isinstance(playerIndex, int): 
+                raise TypeError("Player index must be an integer")
+
+            if playerIndex < 0 or playerIndex >= len(self.__playerBoards__):
+                raise ValueError(f"Player index is out of range. Should be from 0 to {len(self.__playerBoards__)} but was <{playerIndex}>")
+
+            # Check if alignLength is an integer, greater than 0 and less than the board dimensions
+            if not isinstance(alignLength, int):
+                raise TypeError("Alignment length must be an integer")
+
+            if(alignLength <= 0 and alignLength > self.__width__ and alignLength > self.__height__):
+                raise ValueError("Alignment length must be greater than 0 and less than the board dimensions")
+
+            # Check if pieceCount is an integer and greater than 0
+            if not isinstance(pieceCount, int):
+                raise TypeError("Piece count must be an integer")
 
-        # Initialize the player's and opponent's pieces
+            if pieceCount <= 0:
+                raise ValueError("Piece count must be greater than 0")
+
+        # Get the player's and opponents' pieces
         playerPieces : int = self.__playerBoards__[playerIndex].getValue()
-        opponentPieces: int = 0
+        opponentPieces : int = 0
         
-        # Get the opponent's pieces
         for index, board in enumerate(self.__playerBoards__):
             if index != playerIndex : opponentPieces |= board.getValue()
 
-        def countInDirection(mask: int, shift: int) -> int:
-            
-            """
-            Count the number of lines that contain at least a given amount of the player's pieces and no opponent pieces.
-            
-            Parameters:
-                mask (int): The mask to use.
-                shift (int): The shift to use.
-                
-            Raises:
-                TypeError: If mask or shift is not an integer.
-
-            Returns:
-                int: The number of valid lines.
-            """
-            
-            # Check if mask and shift are integers
-            if not isinstance(mask, int) or not isinstance(shift, int):
-                raise TypeError("Mask and shift must be integers")
-            
-            # Initialize the result
-            result : int = 0
-            
-            # Check if the player has a line of the specified length
-            oponentBlockedAlignments : int = opponentPieces
-            for _ in range(alignLength - 1): oponentBlockedAlignments |= (oponentBlockedAlignments >> shift)
-
-            # Check if the player has a line of the specified length on the board
-            for line in range(self.__height__):
-                for column in range(self.__width__):
-                    
-                    # Get the bit to check
-                    bitToCheck : int = 1 << self.__getBitPosition__(line, column)
-
-                    # Check if the player has a line of the specified length
-                    if(bitToCheck & mask & ~oponentBlockedAlignments) != 0:
-                        
-                        # Initialize the count, shifted bit and bit index
-                        count : int = 0
-                        shiftedBit : int = bitToCheck
-                        bitIndex : int = 0   
-                        
-                        # Count the number of player's pieces in the line
-                        while(bitIndex < alignLength and count < pieceCount):
-                            
-                            if(shiftedBit & playerPieces) : count += 1
-                            shiftedBit = shiftedBit << shift
-                            bitIndex += 1
-                        
-                        # Increment the result if the count is greater than or equal to the piece count
-                        if(count >= pieceCount) : result += 1
-
-            return result
-
-        # Count the number of lines that contain at least a given amount of the player's pieces and no opponent pieces
+        # Count the lines holding no blocked case, no opponent piece and enough of the player's pieces
         result : int = 0
-        result += countInDirection(self.__lineMasks__[alignLength], 1)
-        result += countInDirection(self.__columnMasks__[alignLength], self.__width__)
-        result += countInDirection(self.__ascendantDiagonalMasks__[alignLength], self.__width__ - 1)
-        result += countInDirection(self.__descendantDiagonalMasks__[alignLength], self.__width__ + 1)
+        
+        for lineMask in self.__geometry__.getOpenLineMasks(alignLength, self.__blockedCases__.getValue()) :
+            if lineMask & opponentPieces == 0 and (lineMask & playerPieces).bit_count() >= pieceCount : result += 1
 
         return result
 
+    @override
+    def getAlignmentStrengths(self, alignLength : int) -> list[int]:
+        
+        """
+        Returns the alignment strength of each player, on which the win conditions base their evaluation.
+        The strengths are read from a line tracker, built the first time they are asked for a given length
+        and then kept up to date by each piece added or removed, so that no line has to be scanned.
+        
+        Parameters:
+            alignLength (int): The length of the lines.
+        
+        Raises:
+            TypeError: If alignLength is not an integer.
+            ValueError: If alignLength is less than or equal to 0.
+        
+        Returns:
+            list[int]: The alignment strength of each player, indexed by player index.
+        """
+        
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if alignLength is an integer greater than 0
+            if not isinstance(alignLength, int):
+                raise TypeError("Alignment length must be an integer")
+            
+            if alignLength <= 0:
+                raise ValueError("Alignment length must be greater than 0")
+        
+        return self.__getLineTracker__(alignLength).getStrengths()
+
+    @override
+    def hasOpenLine(self, alignLength : int) -> bool:
+        
+        """
+        Returns whether a line of the given length can still be completed by a player,
+        that is a line holding no blocked case and pieces of at most one player.
+        The answer is read from the line tracker of this length, which counts the closed lines.
+        
+        Parameters:
+            alignLength (int): The length of the lines.
+        
+        Raises:
+            TypeError: If alignLength is not an integer.
+            ValueError: If alignLength is less than or equal to 0.
+        
+        Returns:
+            bool: True if a line is open for a player.
+        """
+        
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if alignLength is an integer greater than 0
+            if not isinstance(alignLength, int):
+                raise TypeError("Alignment length must be an integer")
+            
+            if alignLength <= 0:
+                raise ValueError("Alignment length must be greater than 0")
+        
+        return self.__getLineTracker__(alignLength).hasOpenLine()
+
+    @override
+    def getOpenLineCasesMask(self, alignLength : int) -> int:
+        
+        """
+        Returns the mask of the cases lying on at least one line of the given length that a player can still complete.
+        The open lines are read from the line tracker of this length.
+        
+        Parameters:
+            alignLength (int): The length of the lines.
+        
+        Raises:
+            TypeError: If alignLength is not an integer.
+            ValueError: If alignLength is less than or equal to 0.
+        
+        Returns:
+            int: The mask of the cases of the open lines.
+        """
+        
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if alignLength is an integer greater than 0
+            if not isinstance(alignLength, int):
+                raise TypeError("Alignment length must be an integer")
+            
+            if alignLength <= 0:
+                raise ValueError("Alignment length must be greater than 0")
+        
+        return self.__getLineTracker__(alignLength).getOpenLineCasesMask()
+
+    @privatemethod
+    def __getLineTracker__(self, alignLength : int) -> LineTracker:
+        
+        """
+        Returns the tracker of the lines of a given length, building it from the current pieces the first time it is asked for.
+        
+        Parameters:
+            alignLength (int): The length of the lines.
+        
+        Returns:
+            LineTracker: The line tracker, kept up to date by each modification of the board.
+        """
+        
+        if alignLength not in self.__lineTrackers__ :
+            self.__lineTrackers__[alignLength] = LineTracker(self.__geometry__, alignLength, [playerBoard.getValue() for playerBoard in self.__playerBoards__], self.__blockedCases__.getValue())
+        
+        return self.__lineTrackers__[alignLength]
+
+    @privatemethod
+    def __toggleLayerCases__(self, layerMasks : tuple[int, ...], isAdded : bool) -> bool:
+
+        """
+        Updates the zobrist key and the line trackers for cases of each layer that are added or removed at once.
+        The layers are the pieces of each player, then the blocked cases.
+
+        Parameters:
+            layerMasks (tuple[int, ...]): The mask of the cases of each layer.
+            isAdded (bool): True if the cases are added, False if they are removed.
+
+        Returns:
+            bool: True if the key and the trackers are updated.
+        """
+
+        playerCount : int = len(self.__playerBoards__)
+
+        for layerIndex, layerMask in enumerate(layerMasks) :
+
+            while layerMask :
+
+                # Get the lowest case of the layer
+                bitPosition : int = (layerMask & -layerMask).bit_length() - 1
+                layerMask &= layerMask - 1
+
+                if layerIndex < playerCount : self.__zobristKey__ ^= self.__zobristKeys__.getPlayerKey(layerIndex, bitPosition)
+                else : self.__zobristKey__ ^= self.__zobristKeys__.getBlockedKey(bitPosition)
+
+                for lineTracker in self.__lineTrackers__.values() :
+                    if isAdded : lineTracker.addPiece(layerIndex, bitPosition)
+                    else : lineTracker.removePiece(layerIndex, bitPosition)
+
+        return True
+
+    @override
+    def clearSquareAround(self, line : int, column : int) -> tuple[int, ...]:
+
+        """
+        Removes the entities and unblocks the cases of the 3x3 square centered on a case, cut by the borders of the board.
+        The square is cleared with one AND on each layer, using the neighbour mask of the case.
+
+        Parameters:
+            line (int): The line number of the center case.
+            column (int): The column number of the center case.
+
+        Raises:
+            TypeError: If line or column is not an integer.
+            ValueError: If line or column is out of range.
+
+        Returns:
+            tuple[int, ...]: The cases of the square that were taken in each layer: the pieces of each player, then the blocked cases.
+        """
+
+        squareMask : int = self.__geometry__.getNeighbourMask(self.__getBitPosition__(line, column))
+        keptMask : int = self.__fullMask__ & ~squareMask
+
+        # Save the cases of the square taken in each layer
+        clearedMasks : tuple[int, ...] = tuple(playerBoard.getValue() & squareMask for playerBoard in self.__playerBoards__) + (self.__blockedCases__.getValue() & squareMask,)
+        clearedPieceCount : int = sum(clearedMask.bit_count() for clearedMask in clearedMasks[:-1])
+
+        # Clear the square in each layer
+        for playerBoard in self.__playerBoards__ : playerBoard.applyAnd(keptMask)
+        self.__blockedCases__.applyAnd(keptMask)
+
+        self.__pieceCount__ -= clearedPieceCount
+        self.__blockedCaseCount__ -= clearedMasks[-1].bit_count()
+        self.__takenCases__ &= keptMask
+        self.__freeCases__ = self.__fullMask__ & ~self.__takenCases__
+
+        self.__toggleLayerCases__(clearedMasks, False)
+
+        return clearedMasks
+
+    @override
+    def restoreSquareAround(self, line : int, column : int, clearedCases : tuple[int, ...]) -> bool:
+
+        """
+        Puts back the 3x3 square centered on a case as it was before clearSquareAround, with one OR on each layer.
+
+        Parameters:
+            line (int): The line number of the center case.
+            column (int): The column number of the center case.
+            clearedCases (tuple[int, ...]): The masks returned by clearSquareAround.
+
+        Returns:
+            bool: True if the square is restored.
+        """
+
+        # Put back the saved cases in each layer
+        for playerBoard, clearedMask in zip(self.__playerBoards__, clearedCases) : playerBoard.applyOr(clearedMask)
+        self.__blockedCases__.applyOr(clearedCases[-1])
+
+        for clearedMask in clearedCases[:-1] : self.__pieceCount__ += clearedMask.bit_count()
+        self.__blockedCaseCount__ += clearedCases[-1].bit_count()
+        for clearedMask in clearedCases : self.__takenCases__ |= clearedMask
+        self.__freeCases__ = self.__fullMask__ & ~self.__takenCases__
+
+        self.__toggleLayerCases__(clearedCases, True)
+
+        return True
+
     @override
     def isFull(self) -> bool:
         
@@ -799,18 +1034,8 @@ class OptimizedBoard(Board):
             bool: True if the case is blocked successfully.
         """
 
-        # Get the taken cases
-        takenCases = 0
-        for player_board in self.__playerBoards__: takenCases |= player_board.getValue()
-        takenCases |= self.__blockedCases__.getValue()
-
         # Get the available cases to block
-        available_cases = []
-        
-        for line in range(self.__height__):
-            for column in range(self.__width__):
-                bit_position = self.__getBitPosition__(line, column)
-                if (takenCases & (1 << bit_position)) == 0: available_cases.append(bit_position)
+        available_cases = [bit_position for bit_position in range(self.__width__ * self.__height__) if (self.__freeCases__ & (1 << bit_position)) != 0]
 
         # Check if there are available cases to block
         if len(available_cases) == 0: 
@@ -819,6 +1044,10 @@ class OptimizedBoard(Board):
         # Block a random case
         chosen_case = random.choice(available_cases)
         self.__blockedCases__.applyOr(1 << chosen_case)
+        self.__blockedCaseCount__ += 1
+        self.__zobristKey__ ^= self.__zobristKeys__.getBlockedKey(chosen_case)
+        self.__setIsCaseTaken__(chosen_case, True)
+        for lineTracker in self.__lineTrackers__.values() : lineTracker.blockCase(chosen_case)
         
         return True
         
@@ -858,6 +1087,119 @@ class OptimizedBoard(Board):
         
         return self.__width__ * self.__height__ - self.__pieceCount__ - self.__blockedCaseCount__
     
+    @override
+    def getAvaillableCasesMask(self) -> int:
+        
+        """
+        Return a mask of the availlable cases on the board.
+        The bit (line * width + column) of the mask is set if the case at this line and column is availlable.
+        
+        Returns:
+            availlableCasesMask (int) : the mask of the availlable cases on the board.
+        """
+        
+        return self.__freeCases__
+    
+    def getTakenCasesMask(self) -> int:
+        
+        """
+        Return a mask of the taken cases on the board, that is the cases holding a piece or blocked.
+        The bit (line * width + column) of the mask is set if the case at this line and column is taken.
+        
+        Returns:
+            takenCasesMask (int) : the mask of the taken cases on the board.
+        """
+        
+        return self.__takenCases__
+    
+    def getPlayerCasesMask(self, playerIndex : int) -> int:
+        
+        """
+        Return a mask of the cases holding a piece of a player.
+        The bit (line * width + column) of the mask is set if the case at this line and column holds a piece of the player.
+        
+        Parameters:
+            playerIndex (int): The index of the player.
+        
+        Raises:
+            TypeError: If playerIndex is not an integer.
+            ValueError: If playerIndex is out of bounds.
+        
+        Returns:
+            playerCasesMask (int) : the mask of the cases of the player.
+        """
+        
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if playerIndex is an integer and in bounds
+            if not isinstance(playerIndex, int):
+                raise TypeError("playerIndex must be an integer")
+            
+            if playerIndex < 0 or playerIndex >= len(self.__playerBoards__):
+                raise ValueError("playerIndex is out of bounds")
+        
+        return self.__playerBoards__[playerIndex].getValue()
+    
+    def getBlockedCasesMask(self) -> int:
+        
+        """
+        Return a mask of the blocked cases on the board.
+        The bit (line * width + column) of the mask is set if the case at this line and column is blocked.
+        
+        Returns:
+            blockedCasesMask (int) : the mask of the blocked cases on the board.
+        """
+        
+        return self.__blockedCases__.getValue()
+    
+    @override
+    def getPositionSymmetries(self) -> list[list[int]]:
+        
+        """
+        Returns the symmetries of the board leaving the current position unchanged, the identity aside.
+        Only the symmetries keeping the blocked cases are looked at, so a shaped or randomly blocked board has fewer of them,
+        and those left must also keep the pieces of each player.
+        
+        Returns:
+            list[list[int]]: The image of each bit position by each symmetry keeping the position.
+        """
+        
+        positionSymmetries : list[list[int]] = []
+        
+        for symmetryIndex in self.__geometry__.getSymmetriesKeepingMask(self.__blockedCases__.getValue()) :
+            
+            if all(self.__geometry__.transformMask(symmetryIndex, playerBoard.getValue()) == playerBoard.getValue() for playerBoard in self.__playerBoards__) :
+                positionSymmetries.append(self.__geometry__.getSymmetryPositionMap(symmetryIndex))
+        
+        return positionSymmetries
+    
+    @override
+    def getCanonicalKey(self) -> int:
+        
+        """
+        Returns a key shared by the current position and all its symmetric positions.
+        The key of a position packs the mask of the blocked cases, then the mask of each player, from the highest bits to the lowest.
+        The canonical key is the smallest key among the images of the position by every symmetry of the board.
+        
+        Returns:
+            int: The canonical key of the position.
+        """
+        
+        caseCount : int = self.__width__ * self.__height__
+        masks : list[int] = [self.__blockedCases__.getValue()] + [playerBoard.getValue() for playerBoard in self.__playerBoards__]
+        canonicalKey : int = -1
+        
+        # Keep the smallest key among the images of the position
+        for symmetryIndex in range(self.__geometry__.getSymmetryCount()) :
+            
+            key : int = 0
+            for mask in masks : key = (key << caseCount) | self.__geometry__.transformMask(symmetryIndex, mask)
+            
+            if canonicalKey == -1 or key < canonicalKey : canonicalKey = key
+        
+        return canonicalKey
+    
     def getCountCaseBlocked(self):
         
         """
@@ -879,30 +1221,42 @@ class OptimizedBoard(Board):
             Board: A copied instance.
         """
 
-        # Get the copied board
-        board : Board = OptimizedBoard(self.__width__, self.__height__, self.__playerEntities__)
+        # Get the copied board, its geometry and zobrist keys being shared with this board
+        board : Board = OptimizedBoard(self.__width__, self.__height__, self.__playerEntities__, self.__bitBoardType__)
 
         # Copy the player boards, blocked cases and piece count
-        board.__playerBoards__ = self.__playerBoards__
-        board.__blockedCases__ = self.__blockedCases__
+        board.__playerBoards__ = [playerBoard.copy() for playerBoard in self.__playerBoards__]
+        board.__blockedCases__ = self.__blockedCases__.copy()
         board.__pieceCount__ = self.__pieceCount__
+        board.__blockedCaseCount__ = self.__blockedCaseCount__
+        board.__zobristKey__ = self.__zobristKey__
+        board.__takenCases__ = self.__takenCases__
+        board.__freeCases__ = self.__freeCases__
 
         return board
     
+    def getZobristKey(self) -> int:
+        
+        """
+        Returns the zobrist key of the board, that is the XOR of the keys of every piece and blocked case.
+        The key is maintained by each modification of the board, so reading it costs nothing.
+        
+        Returns:
+            int: The zobrist key of the board.
+        """
+
+        return self.__zobristKey__
+
     @override
     def __hash__(self) -> int:
 
         """
         Computes a hash for the board.
+        The hash is the zobrist key of the board, so two different positions (even symmetrical ones,
+        or ones with the players swapped) do not share the same hash, and it is read in constant time.
 
         Returns:
             int: The hash value.
         """
 
-        # Initialize the hash sum
-        hashSum : int = 0
-
-        # Compute the hash sum for the player boards
-        for playerIndex in range(0, len(self.__playerBoards__)): hashSum += hash(self.__playerBoards__[playerIndex])
-
-        return hash(hashSum)
\ No newline at end of file
+        return self.__zobristKey__
@@ -0,0 +1,137 @@
+from __future__ import annotations
+from modules.models.board_game.board.components.optimized_board_components.board_geometry import BoardGeometry
+from modules.models.board_game.board.components.optimized_board_components.line_tracker import getLineStrengths
+
+import numpy as np
+
+# ************************************************
+# Class BatchEvaluator
+# ************************************************
+# ROLE : This module computes the alignments and alignment strengths of many positions of a bitboard based board at once
+# ************************************************
+# VERSION : 1.0
+# AUTHOR : Nathan PINHEIRO
+# DATE : 13/01/2025
+# ************************************************
+
+# The amount of set bits of each byte, used to count the bits of the masks when NumPy has no bitwise_count
+BYTE_BIT_COUNTS = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+def countBits(masks : np.ndarray) -> np.ndarray:
+    
+    """
+    Counts the set bits of each mask of an array.
+    
+    Parameters:
+        masks (np.ndarray): The masks, as unsigned 64 bits integers.
+    
+    Returns:
+        np.ndarray: The amount of set bits of each mask, with the shape of the masks.
+    """
+
+    if hasattr(np, "bitwise_count") : return np.bitwise_count(masks)
+
+    return BYTE_BIT_COUNTS[np.ascontiguousarray(masks).view(np.uint8)].reshape(masks.shape + (8,)).sum(axis=-1)
+
+class BatchEvaluator:
+    
+    """
+    Computes, for many positions of a board size at once, which players have a line of a given length,
+    the alignment strength of each player, the same one Board.getAlignmentStrengths gives, and whether a line is still open.
+    
+    The positions are given as NumPy arrays of masks, one row per player, and every line of the board is matched against
+    all of them with array operations. It is made for the many leaves of a search, where evaluating the positions
+    one by one would cost a lot of Python bytecode for each of them.
+    An evaluator is built once for each board size and line length and then shared.
+    """
+
+    __cache__ : dict[tuple[int, int, int], BatchEvaluator] = {}
+
+    def __init__(self, geometry : BoardGeometry, alignLength : int) -> None:
+        
+        """
+        Initializes the evaluator of the lines of a given length of a board.
+        
+        Parameters:
+            geometry (BoardGeometry): The geometry of the board.
+            alignLength (int): The length of the lines.
+        
+        Raises:
+            TypeError: If geometry is not a BoardGeometry.
+            TypeError: If alignLength is not an integer.
+            ValueError: If alignLength is less than or equal to 0.
+        
+        Returns:
+            None
+        """
+
+        # Check if geometry is a BoardGeometry
+        if not isinstance(geometry, BoardGeometry):
+            raise TypeError("geometry must be a BoardGeometry")
+
+        # Check if alignLength is an integer greater than 0
+        if not isinstance(alignLength, int):
+            raise TypeError("alignLength must be an integer")
+
+        if alignLength <= 0:
+            raise ValueError("alignLength must be greater than 0")
+
+        # Get the masks of the lines and the strength of a line for each amount of pieces of its owner
+        self.__lineMasks__ : np.ndarray = np.array(geometry.getAlignmentLineMasks(alignLength), dtype=np.uint64)
+        self.__lineStrengths__ : np.ndarray = np.array(getLineStrengths(alignLength), dtype=np.int64)
+
+        return None
+
+    @classmethod
+    def getEvaluator(cls, geometry : BoardGeometry, alignLength : int) -> BatchEvaluator:
+        
+        """
+        Returns the evaluator of the lines of a given length of a board, building it only the first time it is asked for.
+        
+        Parameters:
+            geometry (BoardGeometry): The geometry of the board.
+            alignLength (int): The length of the lines.
+        
+        Returns:
+            BatchEvaluator: The shared evaluator.
+        """
+
+        specifications : tuple[int, int, int] = (geometry.getWidth(), geometry.getHeight(), alignLength)
+        if specifications not in cls.__cache__ : cls.__cache__[specifications] = BatchEvaluator(geometry, alignLength)
+
+        return cls.__cache__[specifications]
+
+    def evaluate(self, playerMasks : np.ndarray, blockedMasks : np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        
+        """
+        Finds the players having a line, computes the alignment strength of each player
+        and tells whether a line can still be completed by a player, for each position.
+        
+        Parameters:
+            playerMasks (np.ndarray): The masks of the pieces of each player in each position, as unsigned 64 bits integers of shape (player count, position count).
+            blockedMasks (np.ndarray): The mask of the blocked cases of each position, as unsigned 64 bits integers of shape (position count,).
+        
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: Whether each player has a line in each position, and the alignment strength of each player in each position,
+            both of shape (player count, position count), then whether a line is open for a player in each position, of shape (position count,).
+        """
+
+        lineMasks : np.ndarray = self.__lineMasks__[np.newaxis, :]
+        takenMasks : np.ndarray = np.bitwise_or.reduce(playerMasks, axis=0) | blockedMasks
+
+        isAligned : np.ndarray = np.empty(playerMasks.shape, dtype=bool)
+        strengths : np.ndarray = np.empty(playerMasks.shape, dtype=np.int64)
+        hasOpenLine : np.ndarray = np.zeros(playerMasks.shape[1], dtype=bool)
+
+        for playerIndex, masks in enumerate(playerMasks) :
+
+            # Get the pieces of the player on each line of each position
+            playerLines : np.ndarray = masks[:, np.newaxis] & lineMasks
+            isAligned[playerIndex] = (playerLines == lineMasks).any(axis=1)
+
+            # Sum the strength of the lines holding no opponent piece and no blocked case
+            isLineOpen : np.ndarray = ((takenMasks & ~masks)[:, np.newaxis] & lineMasks) == 0
+            strengths[playerIndex] = np.where(isLineOpen, self.__lineStrengths__[countBits(playerLines)], 0).sum(axis=1)
+            hasOpenLine |= isLineOpen.any(axis=1)
+
+        return isAligned, strengths, hasOpenLine
@@ -1,3 +1,4 @@
+from __future__ import annotations
 from modules.utils.decorator import privatemethod
 from abc import ABC, abstractmethod
 
@@ -114,6 +115,18 @@ class BitBoard(ABC) :
 
         pass
     
+    @abstractmethod
+    def copy(self) -> BitBoard:
+        
+        """
+        Creates a duplicate of the bitboard, sharing nothing with it.
+        
+        Returns:
+            BitBoard: A copied instance.
+        """
+
+        pass
+    
     @abstractmethod
     @privatemethod
     def __hash__(self) -> int:
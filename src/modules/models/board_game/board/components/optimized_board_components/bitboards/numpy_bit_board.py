@@ -1,7 +1,9 @@
+from __future__ import annotations
 from modules.models.board_game.board.components.optimized_board_components.bitboard import BitBoard
 from modules.utils.decorator import privatemethod, override
 
 import numpy as np
+from modules.utils.trusted_mode import isTrustedModeOn
 
 # ************************************************
 # Class NumpyBitBoard
@@ -49,9 +51,6 @@ class NumpyBitBoard(BitBoard):
         # Define the bits array
         self.__bits__: np.ndarray = np.zeros((height, width), dtype=int)
         
-        # Generate the board quadrant masks
-        self.__generateBoardQuadrantMasks__()
-        
         return None
     
     @privatemethod
@@ -72,53 +71,21 @@ class NumpyBitBoard(BitBoard):
             position (int): the position index of the bit
         """
         
-        # Check if line and column are integers and within the board dimensions
-        if not isinstance(line, int) or not isinstance(column, int):
-            raise TypeError("line and column must be integers")
-        
-        if line < 0 or line >= self.__height__:
-            raise ValueError(f"line must be between 0 and {self.__height__ - 1}")
-        
-        if column < 0 or column >= self.__width__:
-            raise ValueError(f"column must be between 0 and {self.__width__ - 1}")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if line and column are integers and within the board dimensions
+            if not isinstance(line, int) or not isinstance(column, int):
+                raise TypeError("line and column must be integers")
+
+            if line < 0 or line >= self.__height__:
+                raise ValueError(f"line must be between 0 and {self.__height__ - 1}")
+
+            if column < 0 or column >= self.__width__:
+                raise ValueError(f"column must be between 0 and {self.__width__ - 1}")
         
         return line * self.__width__ + column
     
-    @privatemethod
-    def __generateBoardQuadrantMasks__(self) -> bool:
-        
-        """
-        This method allow initializing masks foreach part of board. (upper left, upper right, lower left, lower right).
-        This will then be useful to hash the BitBoard, having a hash code that have the same hash for symmetrical boards.
-        
-        Returns:
-            bool: True if the masks are generated successfully.
-        """
-        
-        # Initialize the masks
-        self.__upperLeftMask__: np.ndarray = np.zeros((self.__height__, self.__width__), dtype=int)
-        self.__upperRightMask__: np.ndarray = np.zeros((self.__height__, self.__width__), dtype=int)
-        self.__lowerLeftMask__: np.ndarray = np.zeros((self.__height__, self.__width__), dtype=int)
-        self.__lowerRightMask__: np.ndarray = np.zeros((self.__height__, self.__width__), dtype=int)
-        
-        # Define the center of the board
-        centerLine: float = (self.__height__ - 1) / 2
-        centerColumn: float = (self.__width__ - 1) / 2
-
-        # Generate the masks
-        for line in range(0, self.__height__):
-            for column in range(0, self.__width__):
-                if line <= centerLine and column <= centerColumn:
-                    self.__upperLeftMask__[line][column] = 1
-                if line <= centerLine and column >= centerColumn:
-                    self.__upperRightMask__[line][column] = 1
-                if line >= centerLine and column <= centerColumn:
-                    self.__lowerLeftMask__[line][column] = 1
-                if line >= centerLine and column >= centerColumn:
-                    self.__lowerRightMask__[line][column] = 1
-                
-        return True
-
     @privatemethod
     def __convertBitArrayToInt__(self, bitBoard: np.ndarray) -> int:
         
@@ -135,13 +102,16 @@ class NumpyBitBoard(BitBoard):
             bitboard_int (int): The integer representation of the bit array.
         """
         
-        # Check if bitBoard is a numpy ndarray
-        if not isinstance(bitBoard, np.ndarray):
-            raise TypeError("bitBoard must be a numpy ndarray")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if bitBoard is a numpy ndarray
+            if not isinstance(bitBoard, np.ndarray):
+                raise TypeError("bitBoard must be a numpy ndarray")
         
-        # Flatten the bit array and convert it to an integer
+        # Flatten the bit array and convert it to a Python integer, as the masks built from it only accept those
         flat_bitboard = bitBoard.ravel()
-        bitboard_int = np.dot(flat_bitboard, 1 << np.arange(flat_bitboard.size))
+        bitboard_int = int(np.dot(flat_bitboard, 1 << np.arange(flat_bitboard.size)))
         
         return bitboard_int
     
@@ -161,9 +131,12 @@ class NumpyBitBoard(BitBoard):
             bitboard (np.ndarray): The bit array representation of the integer.
         """
         
-        # Check if bitboard_int is an integer
-        if not isinstance(bitboard_int, int):
-            raise TypeError("bitboard_int must be an integer")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if bitboard_int is an integer
+            if not isinstance(bitboard_int, int):
+                raise TypeError("bitboard_int must be an integer")
         
         # Create a bit array from the integer
         bitboard = np.zeros((self.__height__, self.__width__), dtype=int)
@@ -235,9 +208,12 @@ class NumpyBitBoard(BitBoard):
             bool: True if the operation is applied successfully.
         """
         
-        # Check if value is an integer
-        if not isinstance(value, int):
-            raise TypeError("value must be an integer")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if value is an integer
+            if not isinstance(value, int):
+                raise TypeError("value must be an integer")
         
         # Apply the OR operation
         self.__bits__ |= self.__convertIntToBitArray__(value)
@@ -260,9 +236,12 @@ class NumpyBitBoard(BitBoard):
             bool: True if the operation is applied successfully.
         """
         
-        # Check if value is an integer
-        if not isinstance(value, int):
-            raise TypeError("value must be an integer")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if value is an integer
+            if not isinstance(value, int):
+                raise TypeError("value must be an integer")
         
         # Apply the XOR operation
         self.__bits__ ^= self.__convertIntToBitArray__(value)
@@ -285,15 +264,33 @@ class NumpyBitBoard(BitBoard):
             bool: True if the operation is applied successfully.
         """
         
-        # Check if value is an integer
-        if not isinstance(value, int):
-            raise TypeError("value must be an integer")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if value is an integer
+            if not isinstance(value, int):
+                raise TypeError("value must be an integer")
         
         # Apply the AND operation
         self.__bits__ &= self.__convertIntToBitArray__(value)
         
         return True
 
+    @override
+    def copy(self) -> NumpyBitBoard:
+        
+        """
+        Creates a duplicate of the bitboard.
+        
+        Returns:
+            NumpyBitBoard: A copied instance.
+        """
+        
+        bitBoard: NumpyBitBoard = NumpyBitBoard(self.__width__, self.__height__)
+        bitBoard.__bits__ = self.__bits__.copy()
+        
+        return bitBoard
+
     @override
     @privatemethod
     def __hash__(self) -> int:
@@ -307,9 +304,9 @@ class NumpyBitBoard(BitBoard):
 
         # Get the hash of the bitboard and its symmetrical boards
         normalHash: int = hash(self.__bits__.tobytes())
-        rotated90Hash: int = hash(self.__getRotatedBitBoardBy90Degree__(1).tobytes())
-        rotated180Hash: int = hash(self.__getRotatedBitBoardBy90Degree__(2).tobytes())
-        rotated270Hash: int = hash(self.__getRotatedBitBoardBy90Degree__(3).tobytes())
+        rotated90Hash: int = hash(self.__getRotatedBitBoardBy90Degree__(numberRotate=1).tobytes())
+        rotated180Hash: int = hash(self.__getRotatedBitBoardBy90Degree__(numberRotate=2).tobytes())
+        rotated270Hash: int = hash(self.__getRotatedBitBoardBy90Degree__(numberRotate=3).tobytes())
         
         # Get the hash of the vertically and horizontally flipped boards
         verticallyFlippedHash: int = hash(np.fliplr(self.__bits__).tobytes())
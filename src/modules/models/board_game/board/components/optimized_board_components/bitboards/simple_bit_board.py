@@ -1,5 +1,7 @@
+from __future__ import annotations
 from modules.utils.decorator import privatemethod, override
 from modules.models.board_game.board.components.optimized_board_components.bitboard import BitBoard
+from modules.utils.trusted_mode import isTrustedModeOn
 
 # ************************************************
 # Class SimpleBitBoard
@@ -14,7 +16,7 @@ from modules.models.board_game.board.components.optimized_board_components.bitbo
 class SimpleBitBoard(BitBoard):
     
     """
-    Represents a simple bitboard
+    Represents a simple bitboard, backed by a plain python integer
     """
     
     def __init__(self, width: int, height: int) -> None:
@@ -47,9 +49,6 @@ class SimpleBitBoard(BitBoard):
         # Initialize the bitboard value
         self.__value__: int = 0
         
-        # Generate the board quadrant masks
-        self.__generateBoardQuadrantMasks__()
-        
         return None
     
     @privatemethod
@@ -70,15 +69,18 @@ class SimpleBitBoard(BitBoard):
             position (int): the position index of the bit
         """
         
-        # Check if line and column are integers and within the board dimensions
-        if not isinstance(line, int) or not isinstance(column, int):
-            raise TypeError("line and column must be integers")
-        
-        if line < 0 or line >= self.__height__:
-            raise ValueError(f"line must be between 0 and {self.__height__ - 1}")
-        
-        if column < 0 or column >= self.__width__:
-            raise ValueError(f"column must be between 0 and {self.__width__ - 1}")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if line and column are integers and within the board dimensions
+            if not isinstance(line, int) or not isinstance(column, int):
+                raise TypeError("line and column must be integers")
+
+            if line < 0 or line >= self.__height__:
+                raise ValueError(f"line must be between 0 and {self.__height__ - 1}")
+
+            if column < 0 or column >= self.__width__:
+                raise ValueError(f"column must be between 0 and {self.__width__ - 1}")
         
         return line * self.__width__ + column
 
@@ -110,15 +112,46 @@ class SimpleBitBoard(BitBoard):
             bool: True if the operation is applied successfully.
         """
         
-        # Check if value is an integer
-        if not isinstance(value, int):
-            raise TypeError("value must be an integer")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if value is an integer
+            if not isinstance(value, int):
+                raise TypeError("value must be an integer")
         
         # Apply the OR operation
         self.__value__ |= value
         
         return True
     
+    @override
+    def applyXor(self, value: int) -> bool:
+        
+        """
+        Apply a bitwise XOR operation to the bitboard
+        
+        Parameters:
+            value (int): The value to apply the XOR operation with
+        
+        Raises:
+            TypeError: If value is not an integer.
+        
+        Returns:
+            bool: True if the operation is applied successfully.
+        """
+        
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if value is an integer
+            if not isinstance(value, int):
+                raise TypeError("value must be an integer")
+        
+        # Apply the XOR operation
+        self.__value__ ^= value
+        
+        return True
+    
     @override
     def applyAnd(self, value: int) -> bool:
         
@@ -135,15 +168,33 @@ class SimpleBitBoard(BitBoard):
             bool: True if the operation is applied successfully.
         """
         
-        # Check if value is an integer
-        if not isinstance(value, int):
-            raise TypeError("value must be an integer")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if value is an integer
+            if not isinstance(value, int):
+                raise TypeError("value must be an integer")
         
         # Apply the AND operation
         self.__value__ &= value
         
         return True 
 
+    @override
+    def copy(self) -> SimpleBitBoard:
+        
+        """
+        Creates a duplicate of the bitboard
+        
+        Returns:
+            SimpleBitBoard: A copied instance
+        """
+        
+        bitBoard : SimpleBitBoard = SimpleBitBoard(self.__width__, self.__height__)
+        bitBoard.__value__ = self.__value__
+        
+        return bitBoard
+
     @override
     @privatemethod
     def __hash__(self) -> int:
@@ -0,0 +1,497 @@
+from __future__ import annotations
+
+# ************************************************
+# Class BoardGeometry
+# ************************************************
+# ROLE : This module holds every mask that only depends on the size of a bitboard based board
+# ************************************************
+# VERSION : 1.0
+# AUTHOR : Nathan PINHEIRO
+# DATE : 13/01/2025
+# ************************************************
+
+class BoardGeometry:
+    
+    """
+    Holds the masks and positions that only depend on the width and height of a board.
+    A geometry is built once for each board size and then shared by reference by every board of this size,
+    so it must never be modified once built.
+    """
+
+    __cache__ : dict[tuple[int, int], BoardGeometry] = {}
+
+    def __init__(self, width : int, height : int) -> None:
+        
+        """
+        Builds the geometry of a board of the given size.
+        
+        Parameters:
+            width (int): The width of the board.
+            height (int): The height of the board.
+        
+        Raises:
+            TypeError: If width or height is not an integer.
+            ValueError: If width or height is less than or equal to 0.
+            ValueError: If the board size is greater than 64.
+        
+        Returns:
+            None
+        """
+
+        # Check if width and height are integers, greater than 0 and less than or equal to 64
+        if not isinstance(width, int) or not isinstance(height, int):
+            raise TypeError("Width and height must be integers")
+
+        if width <= 0 or height <= 0:
+            raise ValueError("Width and height must be greater than 0")
+
+        if width * height > 64:
+            raise ValueError("Board size must be less than or equal to 64")
+
+        # Define the size of the board
+        self.__width__ : int = width
+        self.__height__ : int = height
+        self.__fullMask__ : int = (1 << (width * height)) - 1
+
+        # Define the line and column of each bit position
+        self.__casePositions__ : list[tuple[int, int]] = [divmod(bitPosition, width) for bitPosition in range(width * height)]
+
+        # Generate the masks
+        self.__generateCheckWinMasks__()
+        self.__generateNeighbourMasks__()
+        self.__caseLineMasks__ : dict[int, list[list[int]]] = {}
+        self.__caseLineIndexes__ : dict[int, list[list[int]]] = {}
+        self.__alignmentLineMasks__ : dict[int, list[int]] = {}
+        self.__openLineMasks__ : dict[tuple[int, int], list[int]] = {}
+
+        # Generate the symmetries of the board
+        self.__generateSymmetries__()
+        self.__symmetriesKeepingMask__ : dict[int, list[int]] = {}
+
+        return None
+
+    @classmethod
+    def getGeometry(cls, width : int, height : int) -> BoardGeometry:
+        
+        """
+        Returns the geometry of a board of the given size, building it only the first time it is asked for.
+        
+        Parameters:
+            width (int): The width of the board.
+            height (int): The height of the board.
+        
+        Returns:
+            BoardGeometry: The shared geometry of the boards of this size.
+        """
+
+        # Build the geometry if it was never asked for this size
+        if (width, height) not in cls.__cache__ : cls.__cache__[(width, height)] = BoardGeometry(width, height)
+
+        return cls.__cache__[(width, height)]
+
+    def __generateCheckWinMasks__(self) -> bool:
+        
+        """
+        Generates, for each possible line length, the masks of the cases from which a line of this length
+        can start in each direction. They allow finding alignments of any length with shifts.
+        
+        Returns:
+            bool: True if the masks are generated successfully.
+        """
+
+        # Initialize the masks for checking alignments with empty lists
+        self.__lineMasks__ : list[int] = []
+        self.__columnMasks__ : list[int] = []
+        self.__ascendantDiagonalMasks__ : list[int] = []
+        self.__descendantDiagonalMasks__ : list[int] = []
+
+        # Generate the masks for checking alignments
+        for alignLength in range(0, max(self.__width__, self.__height__) + 1):
+
+            # Add a mask for each alignment length
+            self.__lineMasks__.append(0)
+            self.__columnMasks__.append(0)
+            self.__ascendantDiagonalMasks__.append(0)
+            self.__descendantDiagonalMasks__.append(0)
+
+            # Set the bits depending on the alignment length
+            for bitPosition, (lineIndex, columnIndex) in enumerate(self.__casePositions__):
+
+                if(lineIndex <= self.__height__ - alignLength) :
+                    self.__columnMasks__[alignLength] |= (1 << bitPosition)
+
+                if(columnIndex <= self.__width__ - alignLength) :
+                    self.__lineMasks__[alignLength] |= (1 << bitPosition)
+
+                if(lineIndex <= self.__height__ - alignLength and columnIndex <= self.__width__ - alignLength) :
+                    self.__descendantDiagonalMasks__[alignLength] |= (1 << bitPosition)
+
+                if(lineIndex <= self.__height__ - alignLength and columnIndex >= alignLength - 1) :
+                    self.__ascendantDiagonalMasks__[alignLength] |= (1 << bitPosition)
+
+        return True
+
+    def __generateNeighbourMasks__(self) -> bool:
+        
+        """
+        Generates, for each case, the mask of the case and of its (up to eight) neighbours.
+        
+        Returns:
+            bool: True if the masks are generated successfully.
+        """
+
+        self.__neighbourMasks__ : list[int] = []
+
+        for line, column in self.__casePositions__:
+
+            neighbourMask : int = 0
+
+            # Add each case of the 3x3 square centered on the case that is inside the board
+            for neighbourLine in range(max(line - 1, 0), min(line + 2, self.__height__)):
+                for neighbourColumn in range(max(column - 1, 0), min(column + 2, self.__width__)):
+                    neighbourMask |= 1 << (neighbourLine * self.__width__ + neighbourColumn)
+
+            self.__neighbourMasks__.append(neighbourMask)
+
+        return True
+
+    def __generateSymmetries__(self) -> bool:
+        
+        """
+        Generates the dihedral symmetries of the board: the identity, the two flips and the half turn for every board,
+        plus the two diagonal flips and the two quarter turns for square boards. Each symmetry is described by the image
+        of each bit position, and by tables giving the image of each byte of a mask, so that a whole mask is moved byte by byte.
+        The identity is always the first symmetry.
+        
+        Returns:
+            bool: True if the symmetries are generated successfully.
+        """
+
+        width : int = self.__width__
+        height : int = self.__height__
+
+        # Define the image of a case by each symmetry
+        caseTransforms : list = [
+            lambda line, column: (line, column),
+            lambda line, column: (line, width - 1 - column),
+            lambda line, column: (height - 1 - line, column),
+            lambda line, column: (height - 1 - line, width - 1 - column)
+        ]
+
+        if width == height :
+
+            caseTransforms += [
+                lambda line, column: (column, line),
+                lambda line, column: (width - 1 - column, height - 1 - line),
+                lambda line, column: (column, width - 1 - line),
+                lambda line, column: (width - 1 - column, line)
+            ]
+
+        # Get the image of each bit position by each symmetry
+        self.__symmetryPositionMaps__ : list[list[int]] = []
+
+        for caseTransform in caseTransforms :
+
+            positionMap : list[int] = []
+
+            for line, column in self.__casePositions__ :
+
+                imageLine, imageColumn = caseTransform(line, column)
+                positionMap.append(imageLine * width + imageColumn)
+
+            self.__symmetryPositionMaps__.append(positionMap)
+
+        # Get the image of each byte of a mask by each symmetry
+        byteCount : int = (width * height + 7) // 8
+        self.__symmetryByteTables__ : list[list[list[int]]] = []
+
+        for positionMap in self.__symmetryPositionMaps__ :
+
+            byteTables : list[list[int]] = []
+
+            for byteIndex in range(byteCount) :
+
+                byteTable : list[int] = [0] * 256
+
+                for byteValue in range(1, 256) :
+                    for bit in range(8) :
+                        bitPosition : int = byteIndex * 8 + bit
+                        if byteValue & (1 << bit) and bitPosition < width * height : byteTable[byteValue] |= 1 << positionMap[bitPosition]
+
+                byteTables.append(byteTable)
+
+            self.__symmetryByteTables__.append(byteTables)
+
+        return True
+
+    def getWidth(self) -> int:
+        
+        """
+        Returns the width of the boards using this geometry.
+        
+        Returns:
+            int: The width.
+        """
+
+        return self.__width__
+
+    def getHeight(self) -> int:
+        
+        """
+        Returns the height of the boards using this geometry.
+        
+        Returns:
+            int: The height.
+        """
+
+        return self.__height__
+
+    def getFullMask(self) -> int:
+        
+        """
+        Returns the mask with a bit set for every case of the board.
+        
+        Returns:
+            int: The full mask.
+        """
+
+        return self.__fullMask__
+
+    def getCasePosition(self, bitPosition : int) -> tuple[int, int]:
+        
+        """
+        Returns the line and column of a bit position.
+        
+        Parameters:
+            bitPosition (int): The bit position of the case.
+        
+        Returns:
+            tuple[int, int]: The line and column of the case.
+        """
+
+        return self.__casePositions__[bitPosition]
+
+    def getLineMasks(self) -> list[int]:
+        
+        """
+        Returns, for each length, the mask of the cases from which a horizontal line of this length can start.
+        
+        Returns:
+            list[int]: The masks, indexed by length.
+        """
+
+        return self.__lineMasks__
+
+    def getColumnMasks(self) -> list[int]:
+        
+        """
+        Returns, for each length, the mask of the cases from which a vertical line of this length can start.
+        
+        Returns:
+            list[int]: The masks, indexed by length.
+        """
+
+        return self.__columnMasks__
+
+    def getAscendantDiagonalMasks(self) -> list[int]:
+        
+        """
+        Returns, for each length, the mask of the cases from which an ascendant diagonal of this length can start.
+        
+        Returns:
+            list[int]: The masks, indexed by length.
+        """
+
+        return self.__ascendantDiagonalMasks__
+
+    def getDescendantDiagonalMasks(self) -> list[int]:
+        
+        """
+        Returns, for each length, the mask of the cases from which a descendant diagonal of this length can start.
+        
+        Returns:
+            list[int]: The masks, indexed by length.
+        """
+
+        return self.__descendantDiagonalMasks__
+
+    def getNeighbourMask(self, bitPosition : int) -> int:
+        
+        """
+        Returns the mask of a case and of its neighbours.
+        
+        Parameters:
+            bitPosition (int): The bit position of the case.
+        
+        Returns:
+            int: The mask of the 3x3 square centered on the case, cut by the borders of the board.
+        """
+
+        return self.__neighbourMasks__[bitPosition]
+
+    def getCaseLineMasks(self, alignLength : int) -> list[list[int]]:
+        
+        """
+        Returns, for each case, the masks of every line of the given length passing through this case.
+        The masks are generated the first time they are asked for a given length.
+        
+        Parameters:
+            alignLength (int): The length of the lines.
+        
+        Returns:
+            list[list[int]]: The masks of the lines passing through each case, indexed by bit position.
+        """
+
+        # Generate the masks if they were never asked for this length
+        if alignLength not in self.__caseLineMasks__ :
+
+            caseLineMasks : list[list[int]] = [[] for _ in range(self.__width__ * self.__height__)]
+
+            # Go through each line, column, descendant diagonal and ascendant diagonal of the given length
+            for lineStep, columnStep in ((0, 1), (1, 0), (1, 1), (1, -1)) :
+                for startLine, startColumn in self.__casePositions__ :
+
+                    endLine : int = startLine + lineStep * (alignLength - 1)
+                    endColumn : int = startColumn + columnStep * (alignLength - 1)
+
+                    # Skip the lines going out of the board
+                    if not (0 <= endLine < self.__height__ and 0 <= endColumn < self.__width__) : continue
+
+                    # Get the cases of the line and its mask
+                    lineCases : list[int] = [(startLine + lineStep * index) * self.__width__ + startColumn + columnStep * index for index in range(alignLength)]
+                    lineMask : int = sum(1 << bitPosition for bitPosition in lineCases)
+
+                    for bitPosition in lineCases : caseLineMasks[bitPosition].append(lineMask)
+
+            self.__caseLineMasks__[alignLength] = caseLineMasks
+
+        return self.__caseLineMasks__[alignLength]
+
+    def getCaseLineIndexes(self, alignLength : int) -> list[list[int]]:
+        
+        """
+        Returns, for each case, the indexes of every line of the given length passing through this case.
+        The lines are numbered in the order of their first appearance in getCaseLineMasks, so that counters can be kept for each of them.
+        The indexes are generated the first time they are asked for a given length.
+        
+        Parameters:
+            alignLength (int): The length of the lines.
+        
+        Returns:
+            list[list[int]]: The indexes of the lines passing through each case, indexed by bit position.
+        """
+
+        # Number the lines if they were never asked for this length
+        if alignLength not in self.__caseLineIndexes__ :
+
+            lineIndexes : dict[int, int] = {lineMask: lineIndex for lineIndex, lineMask in enumerate(self.getAlignmentLineMasks(alignLength))}
+            self.__caseLineIndexes__[alignLength] = [[lineIndexes[lineMask] for lineMask in lineMasks] for lineMasks in self.getCaseLineMasks(alignLength)]
+
+        return self.__caseLineIndexes__[alignLength]
+
+    def getAlignmentLineMasks(self, alignLength : int) -> list[int]:
+        
+        """
+        Returns the masks of every line of the given length on the board, in every direction, each line being given once.
+        The position of a line in the list is its index in getCaseLineIndexes.
+        The masks are generated the first time they are asked for a given length.
+        
+        Parameters:
+            alignLength (int): The length of the lines.
+        
+        Returns:
+            list[int]: The masks of the lines.
+        """
+
+        # List the lines in the order of their first appearance if they were never asked for this length
+        if alignLength not in self.__alignmentLineMasks__ :
+            self.__alignmentLineMasks__[alignLength] = list(dict.fromkeys(lineMask for lineMasks in self.getCaseLineMasks(alignLength) for lineMask in lineMasks))
+
+        return self.__alignmentLineMasks__[alignLength]
+
+    def getOpenLineMasks(self, alignLength : int, blockedMask : int) -> list[int]:
+        
+        """
+        Returns the masks of the lines of the given length holding no blocked case, that are the only ones a player can still complete.
+        The masks are only filtered the first time a length and a mask of blocked cases are asked for.
+        
+        Parameters:
+            alignLength (int): The length of the lines.
+            blockedMask (int): The mask of the blocked cases.
+        
+        Returns:
+            list[int]: The masks of the lines holding no blocked case.
+        """
+
+        if (alignLength, blockedMask) not in self.__openLineMasks__ :
+            self.__openLineMasks__[(alignLength, blockedMask)] = [lineMask for lineMask in self.getAlignmentLineMasks(alignLength) if lineMask & blockedMask == 0]
+
+        return self.__openLineMasks__[(alignLength, blockedMask)]
+
+    def getSymmetryCount(self) -> int:
+        
+        """
+        Returns the amount of dihedral symmetries of the board, the identity included: 8 for a square board, 4 otherwise.
+        
+        Returns:
+            int: The amount of symmetries.
+        """
+
+        return len(self.__symmetryPositionMaps__)
+
+    def getSymmetryPositionMap(self, symmetryIndex : int) -> list[int]:
+        
+        """
+        Returns the image of each bit position by a symmetry.
+        
+        Parameters:
+            symmetryIndex (int): The index of the symmetry, 0 being the identity.
+        
+        Returns:
+            list[int]: The image of each bit position.
+        """
+
+        return self.__symmetryPositionMaps__[symmetryIndex]
+
+    def transformMask(self, symmetryIndex : int, mask : int) -> int:
+        
+        """
+        Returns the image of a mask by a symmetry.
+        
+        Parameters:
+            symmetryIndex (int): The index of the symmetry, 0 being the identity.
+            mask (int): The mask to move.
+        
+        Returns:
+            int: The image of the mask.
+        """
+
+        transformedMask : int = 0
+
+        for byteTable in self.__symmetryByteTables__[symmetryIndex] :
+
+            if mask == 0 : break
+
+            transformedMask |= byteTable[mask & 0xFF]
+            mask >>= 8
+
+        return transformedMask
+
+    def getSymmetriesKeepingMask(self, mask : int) -> list[int]:
+        
+        """
+        Returns the symmetries, other than the identity, leaving a mask unchanged.
+        Used with the mask of the blocked cases, they are the symmetries valid on a shaped or randomly blocked board.
+        The symmetries are only looked for the first time a mask is asked for.
+        
+        Parameters:
+            mask (int): The mask.
+        
+        Returns:
+            list[int]: The indexes of the symmetries leaving the mask unchanged.
+        """
+
+        if mask not in self.__symmetriesKeepingMask__ :
+            self.__symmetriesKeepingMask__[mask] = [symmetryIndex for symmetryIndex in range(1, len(self.__symmetryPositionMaps__)) if self.transformMask(symmetryIndex, mask) == mask]
+
+        return self.__symmetriesKeepingMask__[mask]
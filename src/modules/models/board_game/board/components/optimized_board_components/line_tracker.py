@@ -0,0 +1,295 @@
+from __future__ import annotations
+from modules.models.board_game.board.components.optimized_board_components.board_geometry import BoardGeometry
+
+# ************************************************
+# Class LineTracker
+# ************************************************
+# ROLE : This module keeps the piece counts of every line of a bitboard based board up to date
+# ************************************************
+# VERSION : 1.0
+# AUTHOR : Nathan PINHEIRO
+# DATE : 13/01/2025
+# ************************************************
+
+# The owner of a line holding no piece, and of a line holding pieces of several players
+NO_OWNER = -1
+SEVERAL_OWNERS = -2
+
+def getLineStrengths(alignLength : int) -> list[int]:
+    
+    """
+    Returns the strength of a line owned by a player, for each amount of pieces of the player in it:
+    the sum of 2 * k for each k from 2 to this amount, without going up to the line length.
+    
+    Parameters:
+        alignLength (int): The length of the lines.
+    
+    Returns:
+        list[int]: The strength of a line, indexed by the amount of pieces of its owner in it.
+    """
+
+    return [sum(2 * pieceCount for pieceCount in range(2, min(linePieceCount, alignLength - 1) + 1)) for linePieceCount in range(alignLength + 1)]
+
+class LineTracker:
+    
+    """
+    Keeps, for every line of a given length, the amount of pieces of each player in it, and the player owning it,
+    that is the only player having pieces in it. A line owned by a player is still open for this player, as no opponent blocks it.
+    The blocked cases are counted as the pieces of one more player, so that a line holding a blocked case is never open.
+    
+    From these counters, the tracker also keeps the alignment strength of each player: the sum over the lines it owns of
+    2 * k for each k from 2 to the amount of its pieces in the line (without going up to the line length).
+    It is the strength the evaluation of the win conditions is based on.
+    It also counts the closed lines, that no player can complete anymore, to tell when no alignment is left to play for.
+    
+    Adding or removing a piece only updates the lines passing through its case, so reading the strengths costs nothing.
+    """
+
+    def __init__(self, geometry : BoardGeometry, alignLength : int, playerMasks : list[int], blockedMask : int = 0) -> None:
+        
+        """
+        Initializes the tracker of the lines of a given length, from the pieces already on the board.
+        
+        Parameters:
+            geometry (BoardGeometry): The geometry of the board.
+            alignLength (int): The length of the lines.
+            playerMasks (list[int]): The mask of the pieces of each player.
+            blockedMask (int): The mask of the blocked cases (default is 0).
+        
+        Raises:
+            TypeError: If geometry is not a BoardGeometry.
+            TypeError: If alignLength is not an integer.
+            ValueError: If alignLength is less than or equal to 0.
+            TypeError: If playerMasks is not a list of integers.
+            TypeError: If blockedMask is not an integer.
+        
+        Returns:
+            None
+        """
+
+        # Check if geometry is a BoardGeometry
+        if not isinstance(geometry, BoardGeometry):
+            raise TypeError("geometry must be a BoardGeometry")
+
+        # Check if alignLength is an integer greater than 0
+        if not isinstance(alignLength, int):
+            raise TypeError("alignLength must be an integer")
+
+        if alignLength <= 0:
+            raise ValueError("alignLength must be greater than 0")
+
+        # Check if playerMasks is a list of integers
+        if not isinstance(playerMasks, list) or not all(isinstance(playerMask, int) for playerMask in playerMasks):
+            raise TypeError("playerMasks must be a list of integers")
+
+        # Check if blockedMask is an integer
+        if not isinstance(blockedMask, int):
+            raise TypeError("blockedMask must be an integer")
+
+        # Get the lines passing through each case
+        lineMasks : list[int] = geometry.getAlignmentLineMasks(alignLength)
+        self.__lineMasks__ : list[int] = lineMasks
+        self.__caseLineIndexes__ : list[list[int]] = geometry.getCaseLineIndexes(alignLength)
+
+        # Get the strength of a line owned by a player, for each amount of pieces of the player in it
+        self.__lineStrengths__ : list[int] = getLineStrengths(alignLength)
+
+        # Count the pieces of each player in each line, the blocked cases being the pieces of the last one
+        layerMasks : list[int] = playerMasks + [blockedMask]
+        self.__playerCount__ : int = len(playerMasks)
+        self.__playerPieceCounts__ : list[list[int]] = [[(lineMask & layerMask).bit_count() for lineMask in lineMasks] for layerMask in layerMasks]
+        self.__pieceCounts__ : list[int] = [sum(layerPieceCounts) for layerPieceCounts in zip(*self.__playerPieceCounts__)]
+
+        # Get the owner of each line and the strength of each player from the counts
+        self.__lineOwners__ : list[int] = [NO_OWNER] * len(lineMasks)
+        self.__strengths__ : list[int] = [0] * len(layerMasks)
+
+        for lineIndex, pieceCount in enumerate(self.__pieceCounts__) :
+
+            if pieceCount == 0 : continue
+
+            for layerIndex, layerPieceCounts in enumerate(self.__playerPieceCounts__) :
+
+                if layerPieceCounts[lineIndex] == pieceCount :
+
+                    self.__lineOwners__[lineIndex] = layerIndex
+                    self.__strengths__[layerIndex] += self.__lineStrengths__[pieceCount]
+                    break
+
+                if layerPieceCounts[lineIndex] != 0 :
+
+                    self.__lineOwners__[lineIndex] = SEVERAL_OWNERS
+                    break
+
+        # Count the lines holding pieces of several players or blocked cases
+        self.__closedLineCount__ : int = sum(1 for lineOwner in self.__lineOwners__ if lineOwner == SEVERAL_OWNERS or lineOwner == self.__playerCount__)
+
+        return None
+
+    def addPiece(self, playerIndex : int, bitPosition : int) -> bool:
+        
+        """
+        Updates the lines passing through a case when a piece of a player is added on it.
+        
+        Parameters:
+            playerIndex (int): The index of the player.
+            bitPosition (int): The bit position of the case.
+        
+        Returns:
+            bool: True if the lines are updated.
+        """
+
+        playerPieceCounts : list[int] = self.__playerPieceCounts__[playerIndex]
+        lineStrengths : list[int] = self.__lineStrengths__
+
+        for lineIndex in self.__caseLineIndexes__[bitPosition] :
+
+            pieceCount : int = self.__pieceCounts__[lineIndex]
+            lineOwner : int = self.__lineOwners__[lineIndex]
+
+            # The line stays owned by the player, or becomes owned by it if it was empty, a blocked case closing it
+            if lineOwner == playerIndex or lineOwner == NO_OWNER :
+
+                self.__lineOwners__[lineIndex] = playerIndex
+                self.__strengths__[playerIndex] += lineStrengths[pieceCount + 1] - lineStrengths[pieceCount]
+                if lineOwner == NO_OWNER and playerIndex == self.__playerCount__ : self.__closedLineCount__ += 1
+
+            # The line is no longer open for its owner
+            elif lineOwner != SEVERAL_OWNERS :
+
+                self.__lineOwners__[lineIndex] = SEVERAL_OWNERS
+                self.__strengths__[lineOwner] -= lineStrengths[pieceCount]
+                if lineOwner != self.__playerCount__ : self.__closedLineCount__ += 1
+
+            playerPieceCounts[lineIndex] += 1
+            self.__pieceCounts__[lineIndex] = pieceCount + 1
+
+        return True
+
+    def removePiece(self, playerIndex : int, bitPosition : int) -> bool:
+        
+        """
+        Updates the lines passing through a case when a piece of a player is removed from it.
+        
+        Parameters:
+            playerIndex (int): The index of the player.
+            bitPosition (int): The bit position of the case.
+        
+        Returns:
+            bool: True if the lines are updated.
+        """
+
+        playerPieceCounts : list[int] = self.__playerPieceCounts__[playerIndex]
+        lineStrengths : list[int] = self.__lineStrengths__
+
+        for lineIndex in self.__caseLineIndexes__[bitPosition] :
+
+            pieceCount : int = self.__pieceCounts__[lineIndex] - 1
+            lineOwner : int = self.__lineOwners__[lineIndex]
+
+            playerPieceCounts[lineIndex] -= 1
+            self.__pieceCounts__[lineIndex] = pieceCount
+
+            # The line stays owned by the player, or becomes empty
+            if lineOwner == playerIndex :
+
+                self.__strengths__[playerIndex] += lineStrengths[pieceCount] - lineStrengths[pieceCount + 1]
+
+                if pieceCount == 0 :
+                    self.__lineOwners__[lineIndex] = NO_OWNER
+                    if playerIndex == self.__playerCount__ : self.__closedLineCount__ -= 1
+
+            # The line opens again if a single player has pieces left in it
+            elif lineOwner == SEVERAL_OWNERS :
+
+                for otherPlayerIndex, otherPlayerPieceCounts in enumerate(self.__playerPieceCounts__) :
+
+                    if otherPlayerPieceCounts[lineIndex] == pieceCount :
+
+                        self.__lineOwners__[lineIndex] = otherPlayerIndex
+                        self.__strengths__[otherPlayerIndex] += lineStrengths[pieceCount]
+                        if otherPlayerIndex != self.__playerCount__ : self.__closedLineCount__ -= 1
+                        break
+
+        return True
+
+    def blockCase(self, bitPosition : int) -> bool:
+        
+        """
+        Updates the lines passing through a case when it is blocked.
+        
+        Parameters:
+            bitPosition (int): The bit position of the case.
+        
+        Returns:
+            bool: True if the lines are updated.
+        """
+
+        return self.addPiece(self.__playerCount__, bitPosition)
+
+    def unblockCase(self, bitPosition : int) -> bool:
+        
+        """
+        Updates the lines passing through a case when it is unblocked.
+        
+        Parameters:
+            bitPosition (int): The bit position of the case.
+        
+        Returns:
+            bool: True if the lines are updated.
+        """
+
+        return self.removePiece(self.__playerCount__, bitPosition)
+
+    def getStrengths(self) -> list[int]:
+        
+        """
+        Returns the alignment strength of each player.
+        
+        Returns:
+            list[int]: The alignment strength of each player, indexed by player index.
+        """
+
+        return self.__strengths__[:self.__playerCount__]
+
+    def isLineOpen(self, lineIndex : int, playerIndex : int) -> bool:
+        
+        """
+        Returns whether a line holds no piece of the opponents of a player.
+        
+        Parameters:
+            lineIndex (int): The index of the line, as given by BoardGeometry.getCaseLineIndexes.
+            playerIndex (int): The index of the player.
+        
+        Returns:
+            bool: True if the line is open for the player.
+        """
+
+        return self.__lineOwners__[lineIndex] == NO_OWNER or self.__lineOwners__[lineIndex] == playerIndex
+
+    def hasOpenLine(self) -> bool:
+        
+        """
+        Returns whether a line can still be completed by a player, that is a line holding no blocked case and pieces of at most one player.
+        
+        Returns:
+            bool: True if a line is open for a player.
+        """
+
+        return self.__closedLineCount__ < len(self.__lineOwners__)
+
+    def getOpenLineCasesMask(self) -> int:
+        
+        """
+        Returns the mask of the cases lying on at least one line that a player can still complete.
+        
+        Returns:
+            int: The mask of the cases of the open lines.
+        """
+
+        openLineCases : int = 0
+
+        for lineMask, lineOwner in zip(self.__lineMasks__, self.__lineOwners__) :
+            if lineOwner != SEVERAL_OWNERS and lineOwner != self.__playerCount__ : openLineCases |= lineMask
+
+        return openLineCases
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import random
+
+# ************************************************
+# Class ZobristKeys
+# ************************************************
+# ROLE : This module holds the random keys used to hash a bitboard based board
+# ************************************************
+# VERSION : 1.0
+# AUTHOR : Nathan PINHEIRO
+# DATE : 13/01/2025
+# ************************************************
+
+ZOBRIST_SEED = 0x5A0B5157
+ZOBRIST_KEY_BITS = 64
+
+class ZobristKeys:
+    
+    """
+    Holds one random key per (case, player) and one random key per blocked case.
+    The hash of a board is the XOR of the keys of its occupied and blocked cases,
+    so it can be updated in constant time each time a case changes.
+    """
+
+    __cache__ : dict[tuple[int, int, int], ZobristKeys] = {}
+
+    def __init__(self, width : int, height : int, playerCount : int) -> None:
+        
+        """
+        Initializes the keys for a given board size and player count.
+        The keys are drawn from a seeded generator, so that they are the same from one process to another.
+        
+        Parameters:
+            width (int): The width of the board.
+            height (int): The height of the board.
+            playerCount (int): The amount of players.
+        
+        Raises:
+            TypeError: If width, height or playerCount is not an integer.
+            ValueError: If width, height or playerCount is less than or equal to 0.
+        
+        Returns:
+            None
+        """
+
+        # Check if width, height and playerCount are integers greater than 0
+        if not isinstance(width, int) or not isinstance(height, int) or not isinstance(playerCount, int):
+            raise TypeError("width, height and playerCount must be integers")
+
+        if width <= 0 or height <= 0 or playerCount <= 0:
+            raise ValueError("width, height and playerCount must be greater than 0")
+
+        # Draw the keys from a generator seeded with the board specifications
+        generator : random.Random = random.Random(hash((ZOBRIST_SEED, width, height, playerCount)))
+        caseCount : int = width * height
+
+        self.__playerKeys__ : list[list[int]] = [[generator.getrandbits(ZOBRIST_KEY_BITS) for _ in range(caseCount)] for _ in range(playerCount)]
+        self.__blockedKeys__ : list[int] = [generator.getrandbits(ZOBRIST_KEY_BITS) for _ in range(caseCount)]
+
+        return None
+
+    @classmethod
+    def getKeys(cls, width : int, height : int, playerCount : int) -> ZobristKeys:
+        
+        """
+        Returns the keys for a given board size and player count.
+        The keys are only generated once and then shared by every board with the same specifications.
+        
+        Parameters:
+            width (int): The width of the board.
+            height (int): The height of the board.
+            playerCount (int): The amount of players.
+        
+        Returns:
+            ZobristKeys: The keys for the given specifications.
+        """
+
+        # Generate the keys if they were never asked for these specifications
+        specifications : tuple[int, int, int] = (width, height, playerCount)
+        if specifications not in cls.__cache__ : cls.__cache__[specifications] = ZobristKeys(width, height, playerCount)
+
+        return cls.__cache__[specifications]
+
+    def getPlayerKey(self, playerIndex : int, bitPosition : int) -> int:
+        
+        """
+        Returns the key of a player piece on a given case.
+        
+        Parameters:
+            playerIndex (int): The index of the player.
+            bitPosition (int): The bit position of the case.
+        
+        Returns:
+            int: The key of the piece.
+        """
+
+        return self.__playerKeys__[playerIndex][bitPosition]
+
+    def getBlockedKey(self, bitPosition : int) -> int:
+        
+        """
+        Returns the key of a blocked case.
+        
+        Parameters:
+            bitPosition (int): The bit position of the case.
+        
+        Returns:
+            int: The key of the blocked case.
+        """
+
+        return self.__blockedKeys__[bitPosition]
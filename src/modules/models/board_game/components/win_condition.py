@@ -48,14 +48,17 @@ class WinCondition(ABC) :
         pass
     
     @abstractmethod
-    def checkWinForPlayer(self, playerIndex : int, board : Board) -> GameOutcome:
+    def checkWinForPlayer(self, playerIndex : int, board : Board, line : int | None = None, column : int | None = None) -> GameOutcome:
         
         """
         Check if a player has won the game.
+        When the case of the last piece played by the player is given, only the lines passing through this case may be checked.
         
         Parameters:
             playerIndex (int): The index of the player to check.
             board (Board): The board to check.
+            line (int | None): The line of the last piece played by the player (default is None, to check the whole board).
+            column (int | None): The column of the last piece played by the player (default is None, to check the whole board).
             
         Raises:
             TypeError: If board is not a Board object.
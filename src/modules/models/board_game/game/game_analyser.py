@@ -2,6 +2,8 @@ from modules.models.board_game.components.move import Move
 from modules.models.board_game.game.game_state import GameState
 from abc import ABC, abstractmethod
 
+import time
+
 # ************************************************
 # CLASS GameAnalyser
 # ************************************************
@@ -12,12 +14,15 @@ from abc import ABC, abstractmethod
 # DATE : 10/01/2025
 # ************************************************
 
+NODES_BETWEEN_TIME_CHECKS = 256
+
 class GameAnalyser(ABC):
 
     """
     A generic abstract class for analyzing game states and moves. 
     Subclasses are expected to provide specific implementations 
     for analyzing moves and determining the best move for a particular game.
+    It also holds what the time limited searches share: the explored node count, the deadline and whether the search is aborted.
     """    
 
     def __init__(self, depth : int, isDebugOn : bool = False) -> None:
@@ -49,6 +54,12 @@ class GameAnalyser(ABC):
         self.__depth__ : bool = depth
         self.__isDebugOn__ : bool = isDebugOn
         
+        # Initialize the explored node count and the search deadline, only used by time limited searches
+        self.__nodeExplored__ : int = 0
+        self.__nextTimeCheck__ : int = NODES_BETWEEN_TIME_CHECKS
+        self.__deadline__ : float | None = None
+        self.__isSearchAborted__ : bool = False
+        
         return None
         
     @abstractmethod
@@ -86,3 +97,74 @@ class GameAnalyser(ABC):
         """
 
         pass
+
+    def getMaximumRemainingPlies(self, gameState: GameState) -> int:
+        
+        """
+        Returns an upper bound of the amount of plies that can still be played from the given game state.
+        Each ply either fills an availlable case or uses a power-up, which can at most free the whole board.
+        
+        Parameters:
+            gameState (GameState): The current game state.
+        
+        Raises:
+            TypeError: If gameState is not a GameState instance.
+        
+        Returns:
+            int: The maximum amount of remaining plies.
+        """
+        
+        # Check if gameState is a GameState instance
+        if not isinstance(gameState, GameState):
+            raise TypeError("gameState must be a GameState instance")
+        
+        # Count the power-ups still availlable
+        powerUpCount : int = sum(len(gameState.getPlayerData(playerIndex).getPowerUpMoves()) for playerIndex in range(gameState.getPlayerCount()))
+        caseCount : int = gameState.getBoard().getWidth() * gameState.getBoard().getHeight()
+        
+        return gameState.getBoard().getCountCaseAvaillable() + powerUpCount * (caseCount + 1)
+
+    def __startSearch__(self) -> bool:
+        
+        """
+        Prepares a new search: the explored node count is reset and the search has no deadline until one is set.
+        
+        Returns:
+            bool: True if the search is ready.
+        """
+
+        self.__nodeExplored__ = 0
+        self.__nextTimeCheck__ = NODES_BETWEEN_TIME_CHECKS
+        self.__deadline__ = None
+        self.__isSearchAborted__ = False
+
+        return True
+
+    def __isSearchStopped__(self) -> bool:
+        
+        """
+        Tells whether the search must stop, that is whether its deadline is passed.
+        
+        Returns:
+            bool: True if the search must stop, False otherwise.
+        """
+
+        return self.__deadline__ is not None and time.perf_counter() >= self.__deadline__
+
+    def __checkSearchStop__(self) -> bool:
+        
+        """
+        Aborts the search if it must stop.
+        Whether it must stop is only asked once NODES_BETWEEN_TIME_CHECKS nodes have been explored since it was last asked,
+        the positions evaluated all at once on the last level being counted as explored nodes too.
+        
+        Returns:
+            bool: True if the search is aborted, False otherwise.
+        """
+
+        if self.__nodeExplored__ >= self.__nextTimeCheck__ :
+
+            self.__nextTimeCheck__ = self.__nodeExplored__ + NODES_BETWEEN_TIME_CHECKS
+            if self.__isSearchStopped__() : self.__isSearchAborted__ = True
+
+        return self.__isSearchAborted__
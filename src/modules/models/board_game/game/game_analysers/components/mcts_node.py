@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Optional
+
+# ************************************************
+# CLASS MCTSNode
+# ************************************************
+# ROLE : This class is used to represent a position of a Monte Carlo search tree
+# ************************************************
+# VERSION : 1.0
+# AUTHOR : Nathan PINHEIRO
+# DATE : 13/01/2025
+# ************************************************
+
+class MCTSNode:
+    
+    """
+    A node of a Monte Carlo search tree, that is a position reached by playing an encoded move from its parent.
+    The statistics of the node are seen from the player who played the move, as it is the one choosing this node among its siblings.
+    Its attributes are read and written straight by the search, as it runs once for each node of each playout.
+    """
+
+    def __init__(self, positionKey: int, untriedMoves: list[int], move: Optional[int] = None, parent: Optional[MCTSNode] = None, playerIndex: Optional[int] = None, winner: Optional[int] = None, isTerminal: bool = False) -> None:
+        
+        """
+        Initializes a node that was never visited.
+        
+        Parameters:
+            positionKey (int): The key of the position of the node, used to find it again when the tree is reused.
+            untriedMoves (list[int]): The encoded moves of the position that have no child node yet.
+            move (Optional[int]): The encoded move leading from the parent to this node (default is None, for the root).
+            parent (Optional[MCTSNode]): The parent node (default is None, for the root).
+            playerIndex (Optional[int]): The index of the player who played the move (default is None, for the root).
+            winner (Optional[int]): The index of the winner, if the game is won on this node (default is None).
+            isTerminal (bool): Whether the game is finished on this node (default is False).
+        
+        Raises:
+            TypeError: If positionKey is not an integer.
+            TypeError: If untriedMoves is not a list.
+            TypeError: If isTerminal is not a boolean.
+        
+        Returns:
+            None
+        """
+
+        # Check if positionKey is an integer
+        if not isinstance(positionKey, int):
+            raise TypeError("positionKey must be an integer")
+
+        # Check if untriedMoves is a list
+        if not isinstance(untriedMoves, list):
+            raise TypeError("untriedMoves must be a list")
+
+        # Check if isTerminal is a boolean
+        if not isinstance(isTerminal, bool):
+            raise TypeError("isTerminal must be a boolean")
+
+        # Initialize the position of the node in the tree
+        self.positionKey : int = positionKey
+        self.move : Optional[int] = move
+        self.parent : Optional[MCTSNode] = parent
+        self.playerIndex : Optional[int] = playerIndex
+        self.children : list[MCTSNode] = []
+        self.untriedMoves : list[int] = untriedMoves
+
+        # Initialize the outcome of the game on the node
+        self.winner : Optional[int] = winner
+        self.isTerminal : bool = isTerminal
+
+        # Initialize the statistics of the node
+        self.visitCount : int = 0
+        self.totalReward : float = 0.0
+
+        return None
+
+    def getMeanReward(self) -> float:
+        
+        """
+        Returns the mean reward of the playouts that went through the node, between -1 (always lost) and 1 (always won).
+        
+        Returns:
+            float: The mean reward, 0 if the node was never visited.
+        """
+
+        if self.visitCount == 0 : return 0.0
+
+        return self.totalReward / self.visitCount
+
+    def getMostVisitedChild(self) -> Optional[MCTSNode]:
+        
+        """
+        Returns the child the search went through the most, which is the most reliable choice.
+        
+        Returns:
+            Optional[MCTSNode]: The most visited child, or None if the node has no child.
+        """
+
+        if len(self.children) == 0 : return None
+
+        return max(self.children, key=lambda child: (child.visitCount, child.getMeanReward()))
@@ -0,0 +1,232 @@
+from typing import Optional
+
+from modules.utils.trusted_mode import isTrustedModeOn
+
+# ************************************************
+# CLASS MoveOrderer
+# ************************************************
+# ROLE : This class is used to order the encoded moves of a search, learning from the cutoffs it produces
+# ************************************************
+# VERSION : 1.0
+# AUTHOR : Nathan PINHEIRO
+# DATE : 13/01/2025
+# ************************************************
+
+KILLER_MOVES_PER_PLY = 2
+
+class MoveOrderer:
+    
+    """
+    Orders the encoded moves of a node for an alpha-beta search.
+    The moves are tried in this order:
+        - the best move stored in the transposition table for the position,
+        - the killer moves of the ply, that is the last moves that produced a cutoff on a sibling node,
+        - the other moves, by decreasing history score, that is how often and how deep they produced cutoffs for the player,
+        - on equal history scores, from the nearest from the center of the board to the farther, then by column and by line.
+    Encoded moves hold their case and their type, so the history is kept per (player, case, move type).
+    """
+
+    def __init__(self, moveTypeBits: int) -> None:
+        
+        """
+        Initializes an empty move orderer.
+        
+        Parameters:
+            moveTypeBits (int): The amount of low bits of an encoded move holding the move type, the other bits holding the case.
+        
+        Raises:
+            TypeError: If moveTypeBits is not an integer.
+            ValueError: If moveTypeBits is less than 0.
+        
+        Returns:
+            None
+        """
+
+        # Check if moveTypeBits is a positive integer
+        if not isinstance(moveTypeBits, int):
+            raise TypeError("moveTypeBits must be an integer")
+
+        if moveTypeBits < 0:
+            raise ValueError("moveTypeBits must be greater than or equal to 0")
+
+        # Define the layout of the encoded moves
+        self.__moveTypeBits__ : int = moveTypeBits
+        self.__moveTypeMask__ : int = (1 << moveTypeBits) - 1
+
+        # Initialize the killer moves of each ply and the history scores of each (player, encoded move)
+        self.__killerMoves__ : list[list[int]] = []
+        self.__historyScores__ : dict[tuple[int, int], int] = {}
+
+        # Initialize the rank of each case from the center, for each board size
+        self.__caseRanks__ : dict[tuple[int, int], list[int]] = {}
+
+        return None
+
+    def orderMoves(self, encodedMoves: list[int], boardWidth: int, boardHeight: int, playerIndex: int, ply: int, transpositionMove: Optional[int] = None) -> list[int]:
+        
+        """
+        Orders the encoded moves of a node, the most promising first.
+        
+        Parameters:
+            encodedMoves (list[int]): The encoded moves of the node.
+            boardWidth (int): The board width.
+            boardHeight (int): The board height.
+            playerIndex (int): The index of the player to play on the node.
+            ply (int): The distance of the node from the root of the search.
+            transpositionMove (Optional[int]): The best move stored in the transposition table for the node (default is None).
+        
+        Raises:
+            TypeError: If playerIndex or ply is not an integer.
+            ValueError: If ply is less than 0.
+        
+        Returns:
+            list[int]: The ordered encoded moves.
+        """
+
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+
+            # Check if playerIndex and ply are integers and ply is greater than or equal to 0
+            if not isinstance(playerIndex, int) or not isinstance(ply, int):
+                raise TypeError("playerIndex and ply must be integers")
+
+            if ply < 0:
+                raise ValueError("ply must be greater than or equal to 0")
+
+        # Get the killer moves of the ply, the static rank of each case and the history scores
+        killerMoves : list[int] = self.__killerMoves__[ply] if ply < len(self.__killerMoves__) else []
+        caseRanks : list[int] = self.__getCaseRanks__(boardWidth, boardHeight)
+        historyScores : dict[tuple[int, int], int] = self.__historyScores__
+        moveTypeBits : int = self.__moveTypeBits__
+        moveTypeMask : int = self.__moveTypeMask__
+
+        def getMovePriority(encodedMove: int) -> tuple[int, int, int]:
+            
+            """
+            Returns the sort key of an encoded move, the lowest key being tried first.
+            
+            Parameters:
+                encodedMove (int): The encoded move.
+            
+            Returns:
+                tuple[int, int, int]: The kind of move (transposition move, killer move or other move), the opposite of its history score and its static rank.
+            """
+
+            if encodedMove == transpositionMove : return (0, 0, 0)
+            if encodedMove in killerMoves : return (1, killerMoves.index(encodedMove), 0)
+
+            return (2, - historyScores.get((playerIndex, encodedMove), 0), (caseRanks[encodedMove >> moveTypeBits] << moveTypeBits) | (encodedMove & moveTypeMask))
+
+        return sorted(encodedMoves, key=getMovePriority)
+
+    def orderMovesFromCenter(self, encodedMoves: list[int], boardWidth: int, boardHeight: int) -> list[int]:
+        
+        """
+        Orders the encoded moves from the nearest from the center to the farther, then by column and by line,
+        simple moves coming before power-ups on the same case. Nothing learned from the cutoffs is used.
+        
+        Parameters:
+            encodedMoves (list[int]): The encoded moves.
+            boardWidth (int): The board width.
+            boardHeight (int): The board height.
+        
+        Returns:
+            list[int]: The ordered encoded moves.
+        """
+
+        caseRanks : list[int] = self.__getCaseRanks__(boardWidth, boardHeight)
+
+        return sorted(encodedMoves, key=lambda encodedMove: (caseRanks[encodedMove >> self.__moveTypeBits__] << self.__moveTypeBits__) | (encodedMove & self.__moveTypeMask__))
+
+    def recordCutoff(self, encodedMove: int, playerIndex: int, ply: int, depth: int) -> bool:
+        
+        """
+        Learns from a move that produced a cutoff: it becomes the first killer move of its ply
+        and its history score for the player grows with the square of the remaining depth,
+        as a cutoff near the root saves more nodes than one near the leaves.
+        
+        Parameters:
+            encodedMove (int): The encoded move that produced the cutoff.
+            playerIndex (int): The index of the player who played the move.
+            ply (int): The distance of the node from the root of the search.
+            depth (int): The remaining depth of the node.
+        
+        Returns:
+            bool: True if the cutoff is recorded.
+        """
+
+        # Add the killer move slots of the missing plies
+        while len(self.__killerMoves__) <= ply : self.__killerMoves__.append([])
+
+        # Put the move at the head of the killer moves of the ply
+        killerMoves : list[int] = self.__killerMoves__[ply]
+
+        if encodedMove in killerMoves : killerMoves.remove(encodedMove)
+        killerMoves.insert(0, encodedMove)
+        del killerMoves[KILLER_MOVES_PER_PLY:]
+
+        # Increase the history score of the move
+        historyKey : tuple[int, int] = (playerIndex, encodedMove)
+        self.__historyScores__[historyKey] = self.__historyScores__.get(historyKey, 0) + depth * depth
+
+        return True
+
+    def startSearch(self) -> bool:
+        
+        """
+        Prepares the orderer for the search of a new root position.
+        The killer moves, only relevant to the previous tree, are forgotten,
+        while the history scores are halved so that recent cutoffs weigh more than old ones.
+        
+        Returns:
+            bool: True if the orderer is ready.
+        """
+
+        # Forget the killer moves
+        self.__killerMoves__ = []
+
+        # Halve the history scores, dropping the ones that reach 0
+        self.__historyScores__ = {historyKey: historyScore // 2 for historyKey, historyScore in self.__historyScores__.items() if historyScore > 1}
+
+        return True
+
+    def __getCaseRanks__(self, boardWidth: int, boardHeight: int) -> list[int]:
+        
+        """
+        Returns the rank of each case, from the nearest from the center to the farther, then by column and by line.
+        The ranks are only computed once for each board size.
+        
+        Parameters:
+            boardWidth (int): The board width.
+            boardHeight (int): The board height.
+        
+        Raises:
+            TypeError: If boardWidth or boardHeight is not an integer.
+            ValueError: If boardWidth or boardHeight is not a positive integer.
+        
+        Returns:
+            list[int]: The rank of each case, indexed by bit position.
+        """
+
+        # Compute the rank of each case if it was never done for this board size
+        if (boardWidth, boardHeight) not in self.__caseRanks__ :
+
+            # Check if boardWidth and boardHeight are integers and greater than 0
+            if not isinstance(boardWidth, int) or not isinstance(boardHeight, int):
+                raise TypeError("boardWidth and boardHeight must be integers")
+
+            if boardWidth <= 0 or boardHeight <= 0:
+                raise ValueError("boardWidth and boardHeight must be positive integers")
+
+            centerColumn = boardWidth // 2
+            centerLine = boardHeight // 2
+
+            # Sort the bit positions by the distance from the center, then by column, and finally by line
+            orderedPositions : list[int] = sorted(range(boardWidth * boardHeight), key=lambda bitPosition: (abs(centerColumn - bitPosition % boardWidth) + abs(centerLine - bitPosition // boardWidth), bitPosition % boardWidth, bitPosition // boardWidth))
+
+            caseRanks : list[int] = [0] * (boardWidth * boardHeight)
+            for rank, bitPosition in enumerate(orderedPositions) : caseRanks[bitPosition] = rank
+
+            self.__caseRanks__[(boardWidth, boardHeight)] = caseRanks
+
+        return self.__caseRanks__[(boardWidth, boardHeight)]
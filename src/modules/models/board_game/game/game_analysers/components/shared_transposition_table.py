@@ -0,0 +1,340 @@
+from typing import Optional
+from multiprocessing import shared_memory
+import struct
+
+import numpy as np
+
+from modules.models.board_game.game.game_analysers.components.transposition_table import TranspositionTable, TranspositionTableEntry, TranspositionTableFlag, DEFAULT_TRANSPOSITION_TABLE_SIZE
+from modules.utils.decorator import override
+
+# ************************************************
+# CLASS SharedTranspositionTable
+# ************************************************
+# ROLE : This class is used to share the cached evaluations of explored positions between several processes
+# ************************************************
+# VERSION : 1.0
+# AUTHOR : Nathan PINHEIRO
+# DATE : 13/01/2025
+# ************************************************
+
+# The layout of a slot of the table. The key field holds the position key xored with the checksum of the other fields,
+# and the move field holds the encoded move plus one, 0 standing for no move.
+SHARED_ENTRY_DTYPE = np.dtype([("key", np.uint64), ("depth", np.int32), ("flag", np.int8), ("score", np.float64), ("move", np.int32)])
+
+KEY_MASK = (1 << 64) - 1
+
+class SharedTranspositionTable(TranspositionTable):
+    
+    """
+    A transposition table of fixed size, stored in a shared memory block so that several processes can read and write it at once.
+    The block is viewed as a structured NumPy array of slots (key, depth, flag, score, move), one slot per index.
+    
+    Writes take no lock. Instead, the key of a slot is stored xored with a checksum of the rest of the slot:
+    when two processes write the same slot at the same time, the slot may mix their entries,
+    but its key then no longer matches the checksum and the slot is read as empty.
+    
+    The process creating the table owns the shared memory block and must unlink it once done.
+    The other processes attach to it by its name, either explicitly or by unpickling the table.
+    """
+
+    def __init__(self, size: int = DEFAULT_TRANSPOSITION_TABLE_SIZE, name: Optional[str] = None) -> None:
+        
+        """
+        Creates a new shared table, or attaches to an existing one.
+        
+        Parameters:
+            size (int): The amount of slots of the table, the same in every process.
+            name (Optional[str]): The name of the shared memory block of an existing table (default is None, for a new table).
+        
+        Raises:
+            TypeError: If size is not an integer.
+            ValueError: If size is less than or equal to 0.
+            TypeError: If name is not a string.
+            ValueError: If the shared memory block is too small for the table.
+        
+        Returns:
+            None
+        """
+
+        # Check if name is a string
+        if name is not None and not isinstance(name, str):
+            raise TypeError("name must be a string")
+
+        # Call the parent constructor, checking the size
+        super().__init__(size)
+
+        # Create or attach the shared memory block
+        self.__isOwner__ : bool = name is None
+        self.__memory__ : shared_memory.SharedMemory = shared_memory.SharedMemory(name=name, create=self.__isOwner__, size=size * SHARED_ENTRY_DTYPE.itemsize)
+
+        # Check if the block can hold the table
+        if self.__memory__.size < size * SHARED_ENTRY_DTYPE.itemsize:
+            self.__memory__.close()
+            raise ValueError("the shared memory block is too small for the table")
+
+        # View the block as the slots of the table, a new block being filled with zeros
+        self.table : np.ndarray = np.ndarray((size,), dtype=SHARED_ENTRY_DTYPE, buffer=self.__memory__.buf)
+
+        return None
+
+    @override
+    def put(self, key: int, depth: int, score: int | float, flag: TranspositionTableFlag, move: Optional[int] = None) -> bool:
+        
+        """
+        Stores an entry in the table.
+        
+        An entry already stored on the same slot is only replaced if it describes another position,
+        or if the new entry comes from a search at least as deep.
+        
+        Parameters:
+            key (int): The hashed key representing the game state.
+            depth (int): The depth of the search.
+            score (int | float): The signed evaluation score.
+            flag (TranspositionTableFlag): The kind of bound the score represents.
+            move (Optional[int]): The best encoded move for this state.
+        
+        Raises:
+            TypeError: If key or depth is not an integer.
+            ValueError: If depth is less than 0.
+            TypeError: If score is not an integer or a float.
+            TypeError: If flag is not a TranspositionTableFlag.
+            TypeError: If move is not an integer.
+        
+        Returns:
+            bool: True if the entry is stored, False if a deeper entry was kept.
+        """
+
+        # Check if key and depth are integers and depth greater than or equal to 0
+        if not isinstance(key, int) or not isinstance(depth, int):
+            raise TypeError("key and depth must be integers")
+
+        if depth < 0:
+            raise ValueError("depth must be greater than or equal to 0")
+
+        # Check if score is an integer or a float
+        if not isinstance(score, (int, float)):
+            raise TypeError("score must be an integer or a float")
+
+        # Check if flag is a TranspositionTableFlag
+        if not isinstance(flag, TranspositionTableFlag):
+            raise TypeError("flag must be a TranspositionTableFlag")
+
+        # Check if move is an encoded move
+        if move is not None and not isinstance(move, int):
+            raise TypeError("move must be an integer")
+
+        # Calculate the entry index
+        key &= KEY_MASK
+        entryIndex : int = key % self.size
+
+        # Store the entry if the slot is empty, used by another position or if the new depth is greater or equal
+        existingSlot : Optional[tuple] = self.__readSlot__(entryIndex, key)
+        if existingSlot is not None and depth < existingSlot[0]:
+            return False
+
+        storedMove : int = 0 if move is None else move + 1
+        self.table[entryIndex] = (key ^ self.__getChecksum__(depth, flag.value, float(score), storedMove), depth, flag.value, score, storedMove)
+
+        return True
+
+    @override
+    def get(self, key: int, depth: int) -> Optional[TranspositionTableEntry]:
+        
+        """
+        Retrieves an entry if it matches or exceeds the specified depth.
+        
+        Parameters:
+            key (int): The hashed key representing the game state.
+            depth (int): The minimum depth required for retrieval.
+        
+        Raises:
+            TypeError: If key or depth is not an integer.
+            ValueError: If depth is less than 0.
+        
+        Returns:
+            Optional[TranspositionTableEntry]: The stored entry or None if not found.
+        """
+
+        # Check if key and depth are integers and greater than or equal to 0
+        if not isinstance(key, int) or not isinstance(depth, int):
+            raise TypeError("key and depth must be integers")
+
+        if depth < 0:
+            raise ValueError("depth must be greater than or equal to 0")
+
+        # Retrieve the slot if it describes the same position and matches or exceeds the specified depth
+        key &= KEY_MASK
+        slot : Optional[tuple] = self.__readSlot__(key % self.size, key)
+        if slot is None or slot[0] < depth:
+            return None
+
+        slotDepth, slotFlag, slotScore, slotMove = slot
+
+        # Give back integer scores as integers, as the searches compare their bounds exactly
+        score : int | float = int(slotScore) if slotScore.is_integer() else slotScore
+
+        return TranspositionTableEntry(key, slotDepth, score, TranspositionTableFlag(slotFlag), None if slotMove == 0 else slotMove - 1)
+
+    @override
+    def getMove(self, key: int) -> Optional[int]:
+        
+        """
+        Retrieves the best move stored for a position, whatever the depth it was searched with.
+        Even a shallow result gives a good first move to try.
+        
+        Parameters:
+            key (int): The hashed key representing the game state.
+        
+        Raises:
+            TypeError: If key is not an integer.
+        
+        Returns:
+            Optional[int]: The stored best encoded move or None if not found.
+        """
+
+        # Check if key is an integer
+        if not isinstance(key, int):
+            raise TypeError("key must be an integer")
+
+        # Retrieve the slot if it describes the same position
+        key &= KEY_MASK
+        slot : Optional[tuple] = self.__readSlot__(key % self.size, key)
+        if slot is None or slot[3] == 0:
+            return None
+
+        return slot[3] - 1
+
+    @override
+    def clear(self) -> bool:
+        
+        """
+        Removes all the entries of the table, for every process sharing it.
+        
+        Returns:
+            bool: True if the table is cleared.
+        """
+
+        self.table.view(np.uint8)[:] = 0
+
+        return True
+
+    @override
+    def getEntryCount(self) -> int:
+        
+        """
+        Returns the amount of slots holding an entry.
+        
+        Returns:
+            int: The amount of entries stored in the table.
+        """
+
+        return int(np.count_nonzero(self.table["key"]))
+
+    def getName(self) -> str:
+        
+        """
+        Returns the name of the shared memory block, used by the other processes to attach to the table.
+        
+        Returns:
+            str: The name of the shared memory block.
+        """
+
+        return self.__memory__.name
+
+    def close(self) -> bool:
+        
+        """
+        Detaches this process from the table. The table must not be used by this process anymore.
+        
+        Returns:
+            bool: True if the table is detached.
+        """
+
+        # Drop the view before closing the block it points to
+        self.table = None
+        self.__memory__.close()
+
+        return True
+
+    def unlink(self) -> bool:
+        
+        """
+        Detaches this process from the table and frees the shared memory block, if this process created it.
+        The other processes must have closed the table before.
+        
+        Returns:
+            bool: True if the block is freed, False if this process does not own it.
+        """
+
+        self.close()
+
+        if not self.__isOwner__ : return False
+
+        self.__memory__.unlink()
+
+        return True
+
+    def __getstate__(self) -> tuple[int, str]:
+        
+        """
+        Returns what is needed to attach to the table from another process.
+        
+        Returns:
+            tuple[int, str]: The size of the table and the name of its shared memory block.
+        """
+
+        return (self.size, self.getName())
+
+    def __setstate__(self, state: tuple[int, str]) -> None:
+        
+        """
+        Attaches to the table described by the state, in the process unpickling it.
+        
+        Parameters:
+            state (tuple[int, str]): The size of the table and the name of its shared memory block.
+        
+        Returns:
+            None
+        """
+
+        self.__init__(state[0], state[1])
+
+        return None
+
+    def __readSlot__(self, entryIndex: int, key: int) -> Optional[tuple[int, int, float, int]]:
+        
+        """
+        Reads a slot of the table, checking that it holds an entry of the position and that it was not torn by concurrent writes.
+        
+        Parameters:
+            entryIndex (int): The index of the slot.
+            key (int): The key of the position, on 64 bits.
+        
+        Returns:
+            Optional[tuple[int, int, float, int]]: The depth, flag, score and stored move of the entry, or None if the slot does not hold one.
+        """
+
+        slotKey, depth, flag, score, storedMove = self.table[entryIndex].item()
+
+        if slotKey ^ self.__getChecksum__(depth, flag, score, storedMove) != key : return None
+
+        return depth, flag, score, storedMove
+
+    def __getChecksum__(self, depth: int, flag: int, score: float, storedMove: int) -> int:
+        
+        """
+        Mixes the fields of a slot, other than the key, into a 64 bits checksum.
+        
+        Parameters:
+            depth (int): The depth of the entry.
+            flag (int): The value of the flag of the entry.
+            score (float): The score of the entry.
+            storedMove (int): The stored move of the entry.
+        
+        Returns:
+            int: The checksum of the fields.
+        """
+
+        scoreBits : int = struct.unpack("<Q", struct.pack("<d", score))[0]
+
+        return scoreBits ^ ((depth & 0xFFFF) << 48) ^ ((flag & 0xFF) << 40) ^ (storedMove & 0xFFFFFFFF)
@@ -1,47 +1,88 @@
-from modules.models.board_game.components.move import Move
 from typing import Optional
+from enum import Enum
+
+# ************************************************
+# CLASS TranspositionTable
+# ************************************************
+# ROLE : This class is used to cache the evaluation of already explored positions
+# ************************************************
+# VERSION : 1.0
+# AUTHOR : Nathan PINHEIRO
+# DATE : 13/01/2025
+# ************************************************
+
+DEFAULT_TRANSPOSITION_TABLE_SIZE = 1 << 20
+
+class TranspositionTableFlag(Enum):
+    
+    """
+    An enumeration that describe how the score of an entry must be understood by the alpha-beta search.
+    
+    Values:
+        EXACT (int): The score is the exact value of the position. (0)
+        LOWER_BOUND (int): The search failed high, the real value is greater or equals to the score. (1)
+        UPPER_BOUND (int): The search failed low, the real value is lower or equals to the score. (2)
+    """
+
+    EXACT = 0
+    LOWER_BOUND = 1
+    UPPER_BOUND = 2
 
 class TranspositionTableEntry:
 
     """
     A final immutable class to represent an entry in the transposition table.
     """
-    
-    def __init__(self, depth: int, score: int, move: Optional[Move] = None) -> None:
+
+    def __init__(self, key: int, depth: int, score: int | float, flag: TranspositionTableFlag, move: Optional[int] = None) -> None:
         
         """
         Initializes the entry.
         
         Parameters:
+            key (int): The full key of the position, used to detect index collisions.
             depth (int): The depth of the search.
-            score (int): The evaluation score.
-            move (Optional[Move]): The best move for this state.
-            
+            score (int | float): The signed evaluation score.
+            flag (TranspositionTableFlag): The kind of bound the score represents.
+            move (Optional[int]): The best encoded move for this state.
+        
         Raises:
-            TypeError: If depth or score is not an integer.
-            ValueError: If depth or score is less than 0.
-            TypeError: If move is not a Move object.
+            TypeError: If key or depth is not an integer.
+            ValueError: If depth is less than 0.
+            TypeError: If score is not an integer or a float.
+            TypeError: If flag is not a TranspositionTableFlag.
+            TypeError: If move is not an integer.
         
         Returns:
             None
         """
-        
-        # Check if depth and score are integers and greater than or equal to 0
-        if not isinstance(depth, int) or not isinstance(score, int):
-            raise TypeError("depth and score must be integers")
-        
-        if depth < 0 or score < 0:
-            raise ValueError("depth and score must be greater than or equal to 0")
-        
-        # Check if move is a Move object
-        if move is not None and not isinstance(move, Move):
-            raise TypeError("move must be a Move object")
-        
+
+        # Check if key and depth are integers and depth greater than or equal to 0
+        if not isinstance(key, int) or not isinstance(depth, int):
+            raise TypeError("key and depth must be integers")
+
+        if depth < 0:
+            raise ValueError("depth must be greater than or equal to 0")
+
+        # Check if score is an integer or a float
+        if not isinstance(score, (int, float)):
+            raise TypeError("score must be an integer or a float")
+
+        # Check if flag is a TranspositionTableFlag
+        if not isinstance(flag, TranspositionTableFlag):
+            raise TypeError("flag must be a TranspositionTableFlag")
+
+        # Check if move is an encoded move
+        if move is not None and not isinstance(move, int):
+            raise TypeError("move must be an integer")
+
         # Initialize the attributes
+        self.key: int = key
         self.depth: int = depth
-        self.score: int = score
-        self.move: Optional[Move] = move
-        
+        self.score: int | float = score
+        self.flag: TranspositionTableFlag = flag
+        self.move: Optional[int] = move
+
         return None
 
 class TranspositionTable:
@@ -51,14 +92,14 @@ class TranspositionTable:
     Implements efficient storage and retrieval using Python's dictionary.
     """
 
-    def __init__(self, size: int) -> None:
+    def __init__(self, size: int = DEFAULT_TRANSPOSITION_TABLE_SIZE) -> None:
         
         """
         Initializes the transposition table.
         
         Parameters:
-            size (int): The size of the table.
-            
+            size (int): The maximum amount of entries of the table.
+        
         Raises:
             TypeError: If size is not an integer.
             ValueError: If size is less than or equal to 0.
@@ -66,59 +107,75 @@ class TranspositionTable:
         Returns:
             None
         """
-        
+
         # Check if size is an integer and greater than 0
         if not isinstance(size, int):
             raise TypeError("size must be an integer")
-        
+
         if size <= 0:
             raise ValueError("size must be greater than 0")
-        
+
         # Initialize the table and size
-        self.table = {}
-        self.size = size
-        
+        self.table: dict[int, TranspositionTableEntry] = {}
+        self.size: int = size
+
         return None
 
-    def put(self, key: int, depth: int, score: int, move: Optional[Move] = None) -> bool:
+    def put(self, key: int, depth: int, score: int | float, flag: TranspositionTableFlag, move: Optional[int] = None) -> bool:
         
         """
         Stores an entry in the table.
+        
+        An entry already stored on the same slot is only replaced if it describes another position,
+        or if the new entry comes from a search at least as deep.
 
         Parameters:
             key (int): The hashed key representing the game state.
             depth (int): The depth of the search.
-            score (int): The evaluation score.
-            move (Optional[Move]): The best move for this state.
-            
+            score (int | float): The signed evaluation score.
+            flag (TranspositionTableFlag): The kind of bound the score represents.
+            move (Optional[int]): The best encoded move for this state.
+        
         Raises:
-            TypeError: If key, depth, or score is not an integer.
-            ValueError: If depth or score is less than 0.
-            TypeError: If move is not a Move object.
+            TypeError: If key or depth is not an integer.
+            ValueError: If depth is less than 0.
+            TypeError: If score is not an integer or a float.
+            TypeError: If flag is not a TranspositionTableFlag.
+            TypeError: If move is not an integer.
 
         Returns:
-            bool: True if the entry is stored successfully.
+            bool: True if the entry is stored, False if a deeper entry was kept.
         """
-        
-        # Check if key, depth, and score are integers and greater than or equal to 0
-        if not isinstance(key, int) or not isinstance(depth, int) or not isinstance(score, int):
-            raise TypeError("key, depth, and score must be integers")
-        
-        if depth < 0 or score < 0:
-            raise ValueError("depth and score must be greater than or equal to 0")
-        
-        # Check if move is a Move object
-        if move is not None and not isinstance(move, Move):
-            raise TypeError("move must be a Move object")
-        
+
+        # Check if key and depth are integers and depth greater than or equal to 0
+        if not isinstance(key, int) or not isinstance(depth, int):
+            raise TypeError("key and depth must be integers")
+
+        if depth < 0:
+            raise ValueError("depth must be greater than or equal to 0")
+
+        # Check if score is an integer or a float
+        if not isinstance(score, (int, float)):
+            raise TypeError("score must be an integer or a float")
+
+        # Check if flag is a TranspositionTableFlag
+        if not isinstance(flag, TranspositionTableFlag):
+            raise TypeError("flag must be a TranspositionTableFlag")
+
+        # Check if move is an encoded move
+        if move is not None and not isinstance(move, int):
+            raise TypeError("move must be an integer")
+
         # Calculate the entry index
         entryIndex: int = key % self.size
-        
-        # Store the entry if it does not exist or if the new depth is greater
-        existing_entry = self.table.get(entryIndex)
-        if existing_entry is None or depth > existing_entry.depth:
-            self.table[entryIndex] = TranspositionTableEntry(depth, score, move)
-        
+
+        # Store the entry if the slot is empty, used by another position or if the new depth is greater or equal
+        existingEntry: Optional[TranspositionTableEntry] = self.table.get(entryIndex)
+        if existingEntry is not None and existingEntry.key == key and depth < existingEntry.depth:
+            return False
+
+        self.table[entryIndex] = TranspositionTableEntry(key, depth, score, flag, move)
+
         return True
 
     def get(self, key: int, depth: int) -> Optional[TranspositionTableEntry]:
@@ -129,7 +186,7 @@ class TranspositionTable:
         Parameters:
             key (int): The hashed key representing the game state.
             depth (int): The minimum depth required for retrieval.
-            
+        
         Raises:
             TypeError: If key or depth is not an integer.
             ValueError: If depth is less than 0.
@@ -137,20 +194,71 @@ class TranspositionTable:
         Returns:
             Optional[TranspositionTableEntry]: The stored entry or None if not found.
         """
-        
+
         # Check if key and depth are integers and greater than or equal to 0
         if not isinstance(key, int) or not isinstance(depth, int):
             raise TypeError("key and depth must be integers")
-        
+
         if depth < 0:
             raise ValueError("depth must be greater than or equal to 0")
-        
+
         # Calculate the entry index
         entryIndex: int = key % self.size
-        
-        # Retrieve the entry if it matches or exceeds the specified depth
-        entry: TranspositionTableEntry = self.table.get(entryIndex)
-        if entry and entry.depth >= depth:
+
+        # Retrieve the entry if it describes the same position and matches or exceeds the specified depth
+        entry: Optional[TranspositionTableEntry] = self.table.get(entryIndex)
+        if entry is not None and entry.key == key and entry.depth >= depth:
             return entry
+
+        return None
+
+    def getMove(self, key: int) -> Optional[int]:
+        
+        """
+        Retrieves the best move stored for a position, whatever the depth it was searched with.
+        Even a shallow result gives a good first move to try.
         
-        return None
\ No newline at end of file
+        Parameters:
+            key (int): The hashed key representing the game state.
+        
+        Raises:
+            TypeError: If key is not an integer.
+        
+        Returns:
+            Optional[int]: The stored best encoded move or None if not found.
+        """
+
+        # Check if key is an integer
+        if not isinstance(key, int):
+            raise TypeError("key must be an integer")
+
+        # Retrieve the entry if it describes the same position
+        entry: Optional[TranspositionTableEntry] = self.table.get(key % self.size)
+        if entry is not None and entry.key == key:
+            return entry.move
+
+        return None
+
+    def clear(self) -> bool:
+        
+        """
+        Removes all the entries of the table.
+        
+        Returns:
+            bool: True if the table is cleared.
+        """
+
+        self.table.clear()
+
+        return True
+
+    def getEntryCount(self) -> int:
+        
+        """
+        Returns the amount of entries stored in the table.
+        
+        Returns:
+            int: The amount of entries stored in the table.
+        """
+
+        return len(self.table)
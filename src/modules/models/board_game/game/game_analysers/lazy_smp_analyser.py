@@ -0,0 +1,322 @@
+from modules.models.tic_tac_toe.tic_tac_toe_game_state import TicTacToeGameState
+from modules.models.board_game.components.move import Move
+from modules.models.board_game.game.game_state import GameState
+from modules.models.board_game.game.game_analyser import GameAnalyser
+from modules.models.board_game.game.game_analysers.principal_variation_search_analyser import PrincipalVariationSearchAnalyser
+from modules.models.board_game.game.game_analysers.components.transposition_table import DEFAULT_TRANSPOSITION_TABLE_SIZE
+from modules.models.board_game.game.game_analysers.components.shared_transposition_table import SharedTranspositionTable
+from modules.utils.decorator import override
+
+from concurrent.futures import ProcessPoolExecutor, Future
+from multiprocessing import shared_memory
+import os
+
+import numpy as np
+
+# ************************************************
+# CLASS LazySmpAnalyser
+# ************************************************
+# ROLE : This class is used to search a game state with several processes at once, sharing one transposition table
+# ************************************************
+# VERSION : 1.0
+# AUTHOR : Nathan PINHEIRO
+# DATE : 13/01/2025
+# ************************************************
+
+# The helpers of the current worker process, one for each shared transposition table, kept from one search to another
+__workerHelpers__ : dict[str, "LazySmpHelperAnalyser"] = {}
+
+def runHelperSearch(transpositionTable: SharedTranspositionTable, searchSignalName: str, searchId: int, compactState: tuple, depth: int, timeLimitMs: int | None) -> bool:
+    
+    """
+    Searches a game state as a helper of a Lazy SMP search, only to fill the shared transposition table.
+    This function runs in the worker processes.
+    
+    Parameters:
+        transpositionTable (SharedTranspositionTable): The shared transposition table, attached to when unpickled.
+        searchSignalName (str): The name of the shared memory block holding the id of the running search.
+        searchId (int): The id of the search this helper takes part in.
+        compactState (tuple): The compact description of the game state.
+        depth (int): The depth of the search.
+        timeLimitMs (int | None): The time budget of the search in milliseconds (None for a fixed depth search).
+    
+    Returns:
+        bool: True once the helper stopped.
+    """
+
+    # Get the helper of this process for the shared table, built with the table attached the first time
+    if transpositionTable.getName() not in __workerHelpers__ : __workerHelpers__[transpositionTable.getName()] = LazySmpHelperAnalyser(transpositionTable, searchSignalName)
+    else : transpositionTable.close()
+
+    # Search the game state until the search is done or stopped by the main process
+    helper : LazySmpHelperAnalyser = __workerHelpers__[transpositionTable.getName()]
+    helper.startHelping(searchId, depth)
+    helper.getBestMove(TicTacToeGameState.fromCompactState(compactState), timeLimitMs)
+
+    return True
+
+class LazySmpHelperAnalyser(PrincipalVariationSearchAnalyser):
+    
+    """
+    A principal variation search run by a worker process of a Lazy SMP search.
+    Its own result is thrown away: it only fills the shared transposition table, and stops as soon as the main search is done.
+    """
+
+    def __init__(self, transpositionTable: SharedTranspositionTable, searchSignalName: str) -> None:
+        
+        """
+        Initializes the helper on a shared transposition table.
+        
+        Parameters:
+            transpositionTable (SharedTranspositionTable): The shared transposition table.
+            searchSignalName (str): The name of the shared memory block holding the id of the running search.
+        
+        Raises:
+            TypeError: If transpositionTable is not a SharedTranspositionTable instance.
+            TypeError: If searchSignalName is not a string.
+        
+        Returns:
+            None
+        """
+
+        # Check if transpositionTable is a SharedTranspositionTable instance
+        if not isinstance(transpositionTable, SharedTranspositionTable):
+            raise TypeError("transpositionTable must be a SharedTranspositionTable instance")
+
+        # Check if searchSignalName is a string
+        if not isinstance(searchSignalName, str):
+            raise TypeError("searchSignalName must be a string")
+
+        # Call the parent constructor, the depth being set by each search
+        super().__init__(1, transpositionTable=transpositionTable)
+
+        # Attach the search signal, and define the id of the search being helped
+        self.__searchSignalMemory__ : shared_memory.SharedMemory = shared_memory.SharedMemory(name=searchSignalName)
+        self.__searchSignal__ : np.ndarray = np.ndarray((1,), dtype=np.int64, buffer=self.__searchSignalMemory__.buf)
+        self.__searchId__ : int = 0
+
+        return None
+
+    def startHelping(self, searchId: int, depth: int) -> bool:
+        
+        """
+        Prepares the helper for a new search.
+        
+        Parameters:
+            searchId (int): The id of the search to help.
+            depth (int): The depth of the search.
+        
+        Returns:
+            bool: True if the helper is ready.
+        """
+
+        self.__searchId__ = searchId
+        self.__depth__ = depth
+
+        return True
+
+    @override
+    def __isSearchStopped__(self) -> bool:
+        
+        """
+        Tells whether the search must stop, that is whether its deadline is passed or the main search is done.
+        
+        Returns:
+            bool: True if the search must stop, False otherwise.
+        """
+
+        return self.__searchSignal__[0] != self.__searchId__ or super().__isSearchStopped__()
+
+class LazySmpAnalyser(GameAnalyser):
+    
+    """
+    A class that implements the Lazy SMP parallel search: the main process and some helper processes all search the same game state,
+    sharing one transposition table. Every process profits from the positions already solved by the others, and as they do not
+    reach the positions at the same time, they quickly spread over different parts of the tree. Half of the helpers search one ply deeper,
+    which spreads them even more and leaves deeper entries in the table. The result is the one of the main process search.
+    
+    Unlike splitting the root moves, no process is left idle while another one is searching the last long subtree.
+    """
+
+    def __init__(self, maxDepth: int, debugOn: bool = False, helperCount: int | None = None, transpositionTableSize: int = DEFAULT_TRANSPOSITION_TABLE_SIZE) -> None:
+        
+        """
+        Initializes the LazySmpAnalyser instance.
+        
+        Parameters:
+            maxDepth (int): The maximum depth of the search tree, when the search is not time limited.
+            debugOn (bool): Optional flag to enable debugging output (default is False).
+            helperCount (int | None): The amount of helper processes (default is None, for one process per core besides the main one).
+            transpositionTableSize (int): The amount of slots of the shared transposition table.
+        
+        Raises:
+            ValueError: If maxDepth is not a positive integer.
+            TypeError: If debugOn is not a boolean value.
+            TypeError: If helperCount is not an integer.
+            ValueError: If helperCount is less than 0.
+            TypeError: If transpositionTableSize is not an integer.
+            ValueError: If transpositionTableSize is less than or equal to 0.
+        
+        Returns:
+            None
+        """
+
+        # Check if maxDepth is a positive integer
+        if not isinstance(maxDepth, int) or maxDepth <= 0:
+            raise ValueError("maxDepth must be a positive integer")
+
+        # Check if debugOn is a boolean value
+        if not isinstance(debugOn, bool):
+            raise TypeError("debugOn must be a boolean value")
+
+        # Check if helperCount is a positive integer
+        if helperCount is not None and not isinstance(helperCount, int):
+            raise TypeError("helperCount must be an integer")
+
+        if helperCount is not None and helperCount < 0:
+            raise ValueError("helperCount must be greater than or equal to 0")
+
+        # Call the parent constructor
+        super().__init__(maxDepth, debugOn)
+
+        # Create the shared transposition table and the main search using it
+        self.__transpositionTable__ : SharedTranspositionTable = SharedTranspositionTable(transpositionTableSize)
+        self.__mainAnalyser__ : PrincipalVariationSearchAnalyser = PrincipalVariationSearchAnalyser(maxDepth, debugOn, transpositionTable=self.__transpositionTable__)
+
+        # Create the search signal, holding the id of the running search, the helpers stopping once it changes
+        self.__searchSignalMemory__ : shared_memory.SharedMemory = shared_memory.SharedMemory(create=True, size=np.dtype(np.int64).itemsize)
+        self.__searchSignal__ : np.ndarray = np.ndarray((1,), dtype=np.int64, buffer=self.__searchSignalMemory__.buf)
+        self.__searchSignal__[0] = 0
+
+        # Define the pool settings, the pool itself being only started by the first search
+        self.__helperCount__ : int = helperCount if helperCount is not None else max((os.cpu_count() or 1) - 1, 0)
+        self.__pool__ : ProcessPoolExecutor | None = None
+
+        return None
+
+    def getMovesScores(self, gameState: GameState, margin: int | None = None) -> dict[Move, int]:
+        
+        """
+        Scores all possible moves with the main search, the helpers searching the game state at the same time.
+        
+        Parameters:
+            gameState (TicTacToeGameState): The current state of the game.
+            margin (int | None): How far below the best score a move still gets an exact score (default is None, for exact scores only).
+        
+        Raises:
+            TypeError: If gameState is not a TicTacToeGameState instance.
+        
+        Returns:
+            dict[Move, int]: A dictionary mapping each possible move to its score.
+        """
+
+        # Check if gameState is a TicTacToeGameState instance
+        if not isinstance(gameState, TicTacToeGameState):
+            raise TypeError("gameState must be a TicTacToeGameState instance")
+
+        # Run the main search along with the helpers
+        helperSearches : list[Future] = self.__startHelpers__(gameState, None)
+
+        try : moveScores : dict[Move, int] = self.__mainAnalyser__.getMovesScores(gameState, margin)
+        finally : self.__stopHelpers__(helperSearches)
+
+        return moveScores
+
+    def getBestMove(self, gameState: GameState, timeLimitMs: int | None = None) -> Move:
+        
+        """
+        Determines the best move with the main search, the helpers searching the game state at the same time.
+        
+        Parameters:
+            gameState (TicTacToeGameState): The current state of the game.
+            timeLimitMs (int | None): The time budget of the search in milliseconds (default is None, for a fixed depth search).
+        
+        Raises:
+            TypeError: If gameState is not a TicTacToeGameState instance.
+        
+        Returns:
+            Move: The best move found, or None if there is no move to play.
+        """
+
+        # Check if gameState is a TicTacToeGameState instance
+        if not isinstance(gameState, TicTacToeGameState):
+            raise TypeError("gameState must be a TicTacToeGameState instance")
+
+        # Run the main search along with the helpers
+        helperSearches : list[Future] = self.__startHelpers__(gameState, timeLimitMs)
+
+        try : bestMove : Move = self.__mainAnalyser__.getBestMove(gameState, timeLimitMs)
+        finally : self.__stopHelpers__(helperSearches)
+
+        return bestMove
+
+    def close(self) -> bool:
+        
+        """
+        Stops the helper processes and frees the shared memory. The analyser must not be used anymore.
+        
+        Returns:
+            bool: True if the analyser is closed.
+        """
+
+        # Stop the pool if it was started
+        if self.__pool__ is not None :
+
+            self.__pool__.shutdown()
+            self.__pool__ = None
+
+        # Free the shared transposition table and the search signal
+        self.__transpositionTable__.unlink()
+
+        self.__searchSignal__ = None
+        self.__searchSignalMemory__.close()
+        self.__searchSignalMemory__.unlink()
+
+        return True
+
+    def __startHelpers__(self, gameState: TicTacToeGameState, timeLimitMs: int | None) -> list[Future]:
+        
+        """
+        Starts a new search id and sends the game state to the helpers, every other helper searching one ply deeper.
+        
+        Parameters:
+            gameState (TicTacToeGameState): The game state to search.
+            timeLimitMs (int | None): The time budget of the search in milliseconds.
+        
+        Returns:
+            list[Future]: The searches of the helpers.
+        """
+
+        if self.__helperCount__ == 0 : return []
+
+        # Start the pool on the first search
+        if self.__pool__ is None : self.__pool__ = ProcessPoolExecutor(max_workers=self.__helperCount__)
+
+        # Start a new search id, stopping the helpers still searching an older one
+        searchId : int = int(self.__searchSignal__[0]) + 1
+        self.__searchSignal__[0] = searchId
+
+        compactState : tuple = gameState.getCompactState()
+
+        return [self.__pool__.submit(runHelperSearch, self.__transpositionTable__, self.__searchSignalMemory__.name, searchId, compactState, self.__depth__ + helperIndex % 2, timeLimitMs) for helperIndex in range(self.__helperCount__)]
+
+    def __stopHelpers__(self, helperSearches: list[Future]) -> bool:
+        
+        """
+        Tells the helpers that the main search is done, and waits for them to stop.
+        
+        Parameters:
+            helperSearches (list[Future]): The searches of the helpers.
+        
+        Returns:
+            bool: True once every helper stopped.
+        """
+
+        if len(helperSearches) == 0 : return True
+
+        # Change the search id, which makes the helpers stop at their next check
+        self.__searchSignal__[0] += 1
+
+        for helperSearch in helperSearches : helperSearch.result()
+
+        return True
@@ -0,0 +1,384 @@
+from modules.models.tic_tac_toe.tic_tac_toe_game_state import MOVE_TYPE_BITS
+from modules.models.board_game.components.move import Move
+from modules.models.board_game.game.game_state import GameState
+from modules.models.board_game.game.game_outcome import GameOutcomeStatus, GameOutcome
+from modules.models.board_game.game.game_analyser import GameAnalyser
+from modules.models.board_game.game.game_analysers.components.mcts_node import MCTSNode
+from typing import Optional
+
+import math
+import random
+import time
+
+# ************************************************
+# CLASS MCTSAnalyser
+# ************************************************
+# ROLE : This class is used to find the best move of a game state with a Monte Carlo tree search
+# ************************************************
+# VERSION : 1.0
+# AUTHOR : Nathan PINHEIRO
+# DATE : 13/01/2025
+# ************************************************
+
+DEFAULT_PLAYOUT_COUNT = 2000
+DEFAULT_EXPLORATION_CONSTANT = math.sqrt(2)
+TREE_REUSE_MAX_PLIES = 2
+
+class MCTSAnalyser(GameAnalyser):
+    
+    """
+    A class that implements the Monte Carlo tree search with the UCT selection. Each iteration of the search:
+        - selects a path from the root, going to the child with the best upper confidence bound on each node,
+        - expands the last node of the path with one of its untried moves,
+        - plays the game randomly from the new node until it is finished (the playout),
+        - gives back the result of the playout to every node of the path.
+    Playouts only play simple moves, picked straight from the mask of the availlable cases, power-ups being kept for the tree.
+    The cost of a search only depends on its budget, given in playouts and/or in milliseconds, not on the branching factor,
+    so the analyser stays responsive on large boards where a fixed depth search is too slow.
+    
+    The tree is kept from one search to another: if the new game state is found in the first plies of the previous tree,
+    the search starts from that subtree with its statistics.
+    As with the other analysers, the game is expected to be a two players zero-sum game.
+    """
+
+    def __init__(self, playoutCount: int | None = DEFAULT_PLAYOUT_COUNT, timeLimitMs: int | None = None, explorationConstant: float = DEFAULT_EXPLORATION_CONSTANT, debugOn: bool = False, isTreeReused: bool = True, seed: int | None = None) -> None:
+        
+        """
+        Initializes the MCTSAnalyser instance with its budget.
+        
+        Parameters:
+            playoutCount (int | None): The amount of playouts of a search (default is DEFAULT_PLAYOUT_COUNT, None for no playout limit).
+            timeLimitMs (int | None): The time budget of a search in milliseconds (default is None, for no time limit).
+            explorationConstant (float): How much the selection favors the least visited moves (default is DEFAULT_EXPLORATION_CONSTANT).
+            debugOn (bool): Optional flag to enable debugging output (default is False).
+            isTreeReused (bool): Whether the tree of a search is reused by the next one (default is True).
+            seed (int | None): The seed of the random playouts (default is None, for a random seed).
+        
+        Raises:
+            TypeError: If playoutCount or timeLimitMs is not an integer.
+            ValueError: If playoutCount or timeLimitMs is less than or equal to 0.
+            ValueError: If both playoutCount and timeLimitMs are None.
+            TypeError: If explorationConstant is not an integer or a float.
+            ValueError: If explorationConstant is less than 0.
+            TypeError: If debugOn or isTreeReused is not a boolean value.
+            TypeError: If seed is not an integer.
+        
+        Returns:
+            None
+        """
+
+        # Check if playoutCount and timeLimitMs are positive integers, at least one of them being given
+        if (playoutCount is not None and not isinstance(playoutCount, int)) or (timeLimitMs is not None and not isinstance(timeLimitMs, int)):
+            raise TypeError("playoutCount and timeLimitMs must be integers")
+
+        if (playoutCount is not None and playoutCount <= 0) or (timeLimitMs is not None and timeLimitMs <= 0):
+            raise ValueError("playoutCount and timeLimitMs must be greater than 0")
+
+        if playoutCount is None and timeLimitMs is None:
+            raise ValueError("playoutCount or timeLimitMs must be given")
+
+        # Check if explorationConstant is a positive number
+        if not isinstance(explorationConstant, (int, float)):
+            raise TypeError("explorationConstant must be an integer or a float")
+
+        if explorationConstant < 0:
+            raise ValueError("explorationConstant must be greater than or equal to 0")
+
+        # Check if debugOn and isTreeReused are boolean values
+        if not isinstance(debugOn, bool) or not isinstance(isTreeReused, bool):
+            raise TypeError("debugOn and isTreeReused must be boolean values")
+
+        # Check if seed is an integer
+        if seed is not None and not isinstance(seed, int):
+            raise TypeError("seed must be an integer")
+
+        # Call the parent constructor, the search having no fixed depth
+        super().__init__(0, debugOn)
+
+        # Define the budget and the selection settings
+        self.__playoutCount__ : int | None = playoutCount
+        self.__timeLimitMs__ : int | None = timeLimitMs
+        self.__explorationConstant__ : float = explorationConstant
+
+        # Initialize the tree kept between searches and the random generator of the playouts
+        self.__isTreeReused__ : bool = isTreeReused
+        self.__root__ : Optional[MCTSNode] = None
+        self.__random__ : random.Random = random.Random(seed)
+
+        return None
+
+    def getMovesScores(self, gameState: GameState, margin: int | float | None = None) -> dict[Move, float]:
+        
+        """
+        Searches the game state and scores each possible move with the mean reward of its playouts, between -1 and 1.
+        The margin is accepted as for the other analysers, but every score is an estimate, so it is not used.
+        
+        Parameters:
+            gameState (GameState): The current state of the game.
+            margin (int | float | None): Not used (default is None).
+        
+        Raises:
+            TypeError: If gameState is not a GameState instance.
+        
+        Returns:
+            dict[Move, float]: A dictionary mapping each possible move to its mean reward, moves left unexplored by a too small budget scoring 0.
+        """
+
+        # Check if gameState is a GameState instance
+        if not isinstance(gameState, GameState):
+            raise TypeError("gameState must be a GameState instance")
+
+        # Search the game state
+        root : MCTSNode = self.__search__(gameState, self.__timeLimitMs__)
+
+        # Score the explored moves with their mean reward, and the unexplored ones with a neutral score
+        moveScores : dict[Move, float] = {gameState.decodeMove(child.move): child.getMeanReward() for child in root.children}
+        for move in root.untriedMoves : moveScores[gameState.decodeMove(move)] = 0.0
+
+        # Print the moves and scores if debugging is enabled
+        if self.__isDebugOn__:
+            for child in root.children : print(f"Move : {gameState.decodeMove(child.move)}, Visits : {child.visitCount}, Score : {child.getMeanReward()}")
+
+        return moveScores
+
+    def getBestMove(self, gameState: GameState, timeLimitMs: int | None = None) -> Move:
+        
+        """
+        Searches the game state and returns the most visited move of the root.
+        
+        Parameters:
+            gameState (GameState): The current state of the game.
+            timeLimitMs (int | None): The time budget of the search in milliseconds (default is None, for the time budget of the analyser).
+        
+        Raises:
+            TypeError: If gameState is not a GameState instance.
+            TypeError: If timeLimitMs is not an integer.
+            ValueError: If timeLimitMs is less than or equal to 0.
+        
+        Returns:
+            Move: The best move found, or None if there is no move to play.
+        """
+
+        # Check if gameState is a GameState instance
+        if not isinstance(gameState, GameState):
+            raise TypeError("gameState must be a GameState instance")
+
+        # Check if timeLimitMs is a positive integer
+        if timeLimitMs is not None and not isinstance(timeLimitMs, int):
+            raise TypeError("timeLimitMs must be an integer")
+
+        if timeLimitMs is not None and timeLimitMs <= 0:
+            raise ValueError("timeLimitMs must be greater than 0")
+
+        # Search the game state and keep the most visited move
+        root : MCTSNode = self.__search__(gameState, self.__timeLimitMs__ if timeLimitMs is None else timeLimitMs)
+        bestChild : Optional[MCTSNode] = root.getMostVisitedChild()
+
+        if bestChild is None : return None
+
+        # Print the statistics of the best move if debugging is enabled
+        if self.__isDebugOn__ : print(f"Playouts : {root.visitCount}, best move : {gameState.decodeMove(bestChild.move)}, visits : {bestChild.visitCount}, score : {bestChild.getMeanReward()}")
+
+        return gameState.decodeMove(bestChild.move)
+
+    def __search__(self, gameState: GameState, timeLimitMs: int | None) -> MCTSNode:
+        
+        """
+        Runs the iterations of the search until the budget is spent. The game state is left as it was given.
+        
+        Parameters:
+            gameState (GameState): The game state to search.
+            timeLimitMs (int | None): The time budget of the search in milliseconds (None for no time limit).
+        
+        Returns:
+            MCTSNode: The root of the searched tree.
+        """
+
+        # Get the root of the tree, from the previous tree if possible
+        root : MCTSNode = self.__getRoot__(gameState)
+        self.__root__ = root if self.__isTreeReused__ else None
+
+        deadline : float | None = None if timeLimitMs is None else time.perf_counter() + timeLimitMs / 1000
+        playoutCount : int = 0
+
+        while (self.__playoutCount__ is None or playoutCount < self.__playoutCount__) and (deadline is None or time.perf_counter() < deadline) :
+
+            # Select a node, expand it and play a playout from the new node
+            playedMoves : list[int] = []
+            node : MCTSNode = self.__select__(root, gameState, playedMoves)
+            node = self.__expand__(node, gameState, playedMoves)
+            winner : Optional[int] = node.winner if node.isTerminal else self.__playout__(gameState, playedMoves)
+
+            # Restore the game state
+            for move in reversed(playedMoves) : gameState.undoEncoded(move)
+
+            # Give the result back to the nodes of the path
+            self.__backpropagate__(node, winner)
+            playoutCount += 1
+
+            # Stop if the root is finished as there is nothing to search
+            if root.isTerminal : break
+
+        return root
+
+    def __getRoot__(self, gameState: GameState) -> MCTSNode:
+        
+        """
+        Returns the root node of a search: the node of the game state in the first plies of the previous tree if there is one, a new node otherwise.
+        
+        Parameters:
+            gameState (GameState): The game state to search.
+        
+        Returns:
+            MCTSNode: The root node, without parent.
+        """
+
+        positionKey : int = gameState.getPositionKey()
+
+        # Look for the game state in the first plies of the previous tree
+        nodes : list[MCTSNode] = [] if self.__root__ is None else [self.__root__]
+
+        for _ in range(TREE_REUSE_MAX_PLIES + 1) :
+
+            for node in nodes :
+
+                if node.positionKey == positionKey :
+
+                    node.parent = None
+                    node.move = None
+                    return node
+
+            nodes = [child for node in nodes for child in node.children]
+
+        # Otherwise start a new tree, a game state with no move to play being finished
+        possibleMoves : list[int] = gameState.getPossibleEncodedMoves()
+
+        return MCTSNode(positionKey, possibleMoves, isTerminal=len(possibleMoves) == 0)
+
+    def __select__(self, root: MCTSNode, gameState: GameState, playedMoves: list[int]) -> MCTSNode:
+        
+        """
+        Goes down the tree from the root, to the child with the best upper confidence bound, until reaching a node with untried moves or a finished game.
+        The moves of the path are played on the game state.
+        
+        Parameters:
+            root (MCTSNode): The root of the tree.
+            gameState (GameState): The game state of the root.
+            playedMoves (list[int]): The moves played on the game state, completed by the selection.
+        
+        Returns:
+            MCTSNode: The selected node.
+        """
+
+        node : MCTSNode = root
+        explorationConstant : float = self.__explorationConstant__
+
+        while not node.isTerminal and len(node.untriedMoves) == 0 and len(node.children) > 0 :
+
+            # Pick the child with the best upper confidence bound
+            logVisitCount : float = math.log(node.visitCount)
+            node = max(node.children, key=lambda child: child.totalReward / child.visitCount + explorationConstant * math.sqrt(logVisitCount / child.visitCount))
+
+            gameState.playEncoded(node.move)
+            playedMoves.append(node.move)
+
+        return node
+
+    def __expand__(self, node: MCTSNode, gameState: GameState, playedMoves: list[int]) -> MCTSNode:
+        
+        """
+        Adds a child to the node for one of its untried moves, picked randomly, and plays it on the game state.
+        
+        Parameters:
+            node (MCTSNode): The node to expand.
+            gameState (GameState): The game state of the node.
+            playedMoves (list[int]): The moves played on the game state, completed by the expansion.
+        
+        Returns:
+            MCTSNode: The new child, or the node itself if it can not be expanded.
+        """
+
+        if node.isTerminal or len(node.untriedMoves) == 0 : return node
+
+        # Take a random untried move
+        moveIndex : int = self.__random__.randrange(len(node.untriedMoves))
+        node.untriedMoves[moveIndex], node.untriedMoves[-1] = node.untriedMoves[-1], node.untriedMoves[moveIndex]
+        move : int = node.untriedMoves.pop()
+
+        # Play it and create the child for the reached position
+        playerIndex : int = gameState.getPlayerToPlayIndex()
+        gameOutcome : GameOutcome = gameState.playEncoded(move)
+        playedMoves.append(move)
+
+        isTerminal : bool = gameOutcome.getGameStatus() != GameOutcomeStatus.UNFINISHED
+        child : MCTSNode = MCTSNode(gameState.getPositionKey(), [] if isTerminal else gameState.getPossibleEncodedMoves(), move, node, playerIndex, gameOutcome.getWinner(), isTerminal)
+
+        # A position with no move to play ends the game as a draw
+        if len(child.untriedMoves) == 0 : child.isTerminal = True
+
+        node.children.append(child)
+
+        return child
+
+    def __playout__(self, gameState: GameState, playedMoves: list[int]) -> Optional[int]:
+        
+        """
+        Plays random simple moves on the game state until the game is finished.
+        Power-ups are only played when no simple move is left.
+        
+        Parameters:
+            gameState (GameState): The game state to play on.
+            playedMoves (list[int]): The moves played on the game state, completed by the playout.
+        
+        Returns:
+            Optional[int]: The index of the winner, or None for a draw.
+        """
+
+        board = gameState.getBoard()
+        randomGenerator : random.Random = self.__random__
+
+        while True :
+
+            # Pick a random availlable case, straight from the mask of the availlable cases
+            availlableCases : int = board.getAvaillableCasesMask()
+            move : int
+
+            if availlableCases :
+
+                for _ in range(randomGenerator.randrange(availlableCases.bit_count())) : availlableCases &= availlableCases - 1
+                move = ((availlableCases & -availlableCases).bit_length() - 1) << MOVE_TYPE_BITS
+
+            else :
+
+                possibleMoves : list[int] = gameState.getPossibleEncodedMoves()
+                if len(possibleMoves) == 0 : return None
+                move = randomGenerator.choice(possibleMoves)
+
+            # Play the move and stop once the game is finished
+            gameOutcome : GameOutcome = gameState.playEncoded(move)
+            playedMoves.append(move)
+
+            if gameOutcome.getGameStatus() != GameOutcomeStatus.UNFINISHED : return gameOutcome.getWinner()
+
+    def __backpropagate__(self, node: MCTSNode, winner: Optional[int]) -> bool:
+        
+        """
+        Gives the result of a playout back to the node and its ancestors, each node being rewarded from the point of view of the player who played its move.
+        
+        Parameters:
+            node (MCTSNode): The node the playout started from.
+            winner (Optional[int]): The index of the winner, or None for a draw.
+        
+        Returns:
+            bool: True once every node is updated.
+        """
+
+        while node is not None :
+
+            node.visitCount += 1
+
+            if winner is not None and node.playerIndex is not None : node.totalReward += 1.0 if node.playerIndex == winner else -1.0
+
+            node = node.parent
+
+        return True
@@ -1,7 +1,12 @@
-from modules.models.tic_tac_toe.tic_tac_toe_game_state import GameState
+from modules.models.tic_tac_toe.tic_tac_toe_game_state import GameState, MOVE_TYPE_BITS
 from modules.models.board_game.components.move import Move
 from modules.models.board_game.game.game_outcome import GameOutcomeStatus, GameOutcome
 from modules.models.board_game.game.game_analyser import GameAnalyser
+from modules.models.board_game.game.game_analysers.components.transposition_table import TranspositionTable, TranspositionTableEntry, TranspositionTableFlag, DEFAULT_TRANSPOSITION_TABLE_SIZE
+from modules.models.board_game.game.game_analysers.components.move_orderer import MoveOrderer
+from modules.utils.trusted_mode import isTrustedModeOn
+
+import time
 
 class AlphaBetaPruningAnalyser(GameAnalyser):
     
@@ -12,7 +17,7 @@ class AlphaBetaPruningAnalyser(GameAnalyser):
     with improved performance using alpha-beta pruning.
     """
 
-    def __init__(self, maxDepth: int, debugOn: bool = False) -> None:
+    def __init__(self, maxDepth: int, debugOn: bool = False, transpositionTableSize: int = DEFAULT_TRANSPOSITION_TABLE_SIZE, transpositionTable: TranspositionTable | None = None) -> None:
         
         """
         Initializes the AlphaBetaPruningAnalyser instance with the given depth and debugging flag.
@@ -20,10 +25,15 @@ class AlphaBetaPruningAnalyser(GameAnalyser):
         Parameters:
             maxDepth (int): The maximum depth of the search tree for the alpha-beta algorithm.
             debugOn (bool): Optional flag to enable debugging output (default is False).
+            transpositionTableSize (int): The maximum amount of positions kept in the transposition table.
+            transpositionTable (TranspositionTable | None): The transposition table to use, for example one shared with other analysers (default is None, for a new table of transpositionTableSize entries).
             
         Raises:
             ValueError: If maxDepth is not a positive integer.
             TypeError: If debugOn is not a boolean value.
+            TypeError: If transpositionTableSize is not an integer.
+            ValueError: If transpositionTableSize is less than or equal to 0.
+            TypeError: If transpositionTable is not a TranspositionTable instance.
             
         Returns:
             None
@@ -37,21 +47,51 @@ class AlphaBetaPruningAnalyser(GameAnalyser):
         if not isinstance(debugOn, bool):
             raise TypeError("debugOn must be a boolean value")
         
+        # Check if transpositionTableSize is a positive integer
+        if not isinstance(transpositionTableSize, int):
+            raise TypeError("transpositionTableSize must be an integer")
+        
+        if transpositionTableSize <= 0:
+            raise ValueError("transpositionTableSize must be greater than 0")
+
+        # Check if transpositionTable is a TranspositionTable instance
+        if transpositionTable is not None and not isinstance(transpositionTable, TranspositionTable):
+            raise TypeError("transpositionTable must be a TranspositionTable instance")
+        
         # Call the parent constructor
         super().__init__(maxDepth, debugOn)
         
+        # Initialize the transposition table, kept between two analyses as its entries do not depend on the root position
+        self.__transpositionTable__ : TranspositionTable = TranspositionTable(transpositionTableSize) if transpositionTable is None else transpositionTable
+        
+        # Initialize the move orderer, learning from the cutoffs of the searches
+        self.__moveOrderer__ : MoveOrderer = MoveOrderer(MOVE_TYPE_BITS)
+        
         return None
 
-    def getMovesScores(self, gameState: GameState) -> dict[Move, int]:
+    def getMovesScores(self, gameState: GameState, margin: int | float | None = None, encodedMoves: list[int] | None = None) -> dict[Move, int]:
         
         """
         Evaluates all possible moves and returns their corresponding alpha-beta pruning scores.
 
+        All the root moves are scored in one search: they are ordered as in the tree, and they share the transposition table.
+        With a margin, the search works as a multi principal variation search: once a move is scored, the following moves are
+        searched with a window starting at the best score minus the margin. Moves scoring inside that window get their exact
+        score, while the other ones are given the best score minus the margin, an upper bound of their score already too low to be
+        worth an exact value. As this bound only depends on the best score, the scores do not depend on the order of the moves.
+        Without a margin, every move is searched with a full window and gets its exact score.
+        The root moves can be restricted to some encoded moves, for example to share them between several analysers.
+        
         Parameters:
             gameState (TicTacToeGameState): The current state of the game.
+            margin (int | float | None): How far below the best score a move still gets an exact score (default is None, for exact scores only).
+            encodedMoves (list[int] | None): The encoded root moves to score (default is None, for every possible move).
             
         Raises:
             TypeError: If gameState is not a TicTacToeGameState instance.
+            TypeError: If margin is not an integer or a float.
+            ValueError: If margin is less than 0.
+            TypeError: If encodedMoves is not a list of integers.
 
         Returns:
             dict[Move, int]: A dictionary mapping each possible move to its alpha-beta pruning score.
@@ -61,18 +101,40 @@ class AlphaBetaPruningAnalyser(GameAnalyser):
         if not isinstance(gameState, GameState):
             raise TypeError("gameState must be a GameState instance")
         
-        # Reset the node explored count
-        self.__nodeExplored__ = 0
+        # Check if margin is a positive integer or float
+        if margin is not None and not isinstance(margin, (int, float)):
+            raise TypeError("margin must be an integer or a float")
+        
+        if margin is not None and margin < 0:
+            raise ValueError("margin must be greater than or equal to 0")
+        
+        # Check if encodedMoves is a list of integers
+        if encodedMoves is not None and (not isinstance(encodedMoves, list) or not all(isinstance(encodedMove, int) for encodedMove in encodedMoves)):
+            raise TypeError("encodedMoves must be a list of integers")
+        
+        # Start a new search, resetting the node explored count
+        self.__startSearch__()
 
         # Get the index of the maximizing player
         maximizingPlayerIndex = gameState.getPlayerToPlayIndex()
         moveScores = {}
+        bestScore : int | float = float('-inf')
+
+        # Order the moves as in the tree, the best move found by a previous search being tried first
+        self.__moveOrderer__.startSearch()
+        possibleMoves : list[int] = self.__moveOrderer__.orderMoves(gameState.getPossibleEncodedMoves() if encodedMoves is None else encodedMoves, gameState.getBoard().getWidth(), gameState.getBoard().getHeight(), maximizingPlayerIndex, 0, self.__transpositionTable__.getMove(gameState.getPositionKey()))
+
+        # Only search one move among the symmetric ones
+        representatives : dict[int, int] = gameState.getSymmetricMoveRepresentatives(possibleMoves)
+        encodedMoveScores : dict[int, int] = {}
 
         # Iterate over all possible moves
-        for moveIndex, move in enumerate(gameState.getPossibleMoves()):
+        for moveIndex, move in enumerate(possibleMoves):
+
+            if representatives[move] != move : continue
             
             # Play the move and get the game outcome
-            gameOutcome : GameOutcome = gameState.play(move)
+            gameOutcome : GameOutcome = gameState.playEncoded(move)
 
             # Check if the game is finished
             if(gameOutcome.getGameStatus() != GameOutcomeStatus.UNFINISHED) : 
@@ -85,20 +147,31 @@ class AlphaBetaPruningAnalyser(GameAnalyser):
                 else : score = - self.getWinReward(gameState)
 
                 # Undo the move and return the score
-                gameState.undo(move)
+                gameState.undoEncoded(move)
                 
             else :
                 
+                # Only look for an exact score if the move can be within the margin of the best one
+                alpha : int | float = float('-inf') if margin is None else bestScore - margin
+
                 # Recursively evaluate the game state
-                score, _ = self.__minimax__(gameState, self.__depth__ - 1, maximizingPlayerIndex, float('-inf'), float('inf'))
-                gameState.undo(move)
+                score, _ = self.__minimax__(gameState, self.__depth__ - 1, maximizingPlayerIndex, alpha, float('inf'), 1)
+                gameState.undoEncoded(move)
 
-            # Store the move score in the dictionary
-            moveScores[move] = score
+            # Store the score of the move and update the best score
+            encodedMoveScores[move] = score
+            bestScore = max(bestScore, score)
 
             # Print the move and score if debugging is enabled
             if self.__isDebugOn__:
-                print(f"Move {moveIndex}: {move}, Score: {score}")
+                print(f"Move {moveIndex}: {gameState.decodeMove(move)}, Score: {score}")
+
+        # Give the moves scoring below the window of the best move the lowest score of the window
+        if margin is not None :
+            for move, score in encodedMoveScores.items() : encodedMoveScores[move] = max(score, bestScore - margin)
+
+        # Give each move the score of its representative, the symmetric moves sharing the same score
+        for move in possibleMoves : moveScores[gameState.decodeMove(move)] = encodedMoveScores[representatives[move]]
 
         # Print the number of nodes explored if debugging is enabled
         if self.__isDebugOn__:
@@ -106,19 +179,25 @@ class AlphaBetaPruningAnalyser(GameAnalyser):
 
         return moveScores
 
-
-    def getBestMove(self, gameState: GameState) -> Move:
+    def getBestMove(self, gameState: GameState, timeLimitMs: int | None = None) -> Move:
         
         """
         Determines the best move for the current game state based on the alpha-beta pruning algorithm.
 
-        The method finds the move with the highest score for the maximizing player and returns it.
+        The search is iteratively deepened one ply at a time. Each iteration leaves its principal variation
+        in the transposition table, which is then used to order the moves of the next, deeper, iteration.
+        As the scores are plain minimax scores, the order only changes how much of the tree is searched, not the score of a depth.
+        Without a time limit, the search stops at the analyser depth. With a time limit, the search goes as deep 
+        as it can and the move of the last fully searched depth is returned (the first ply is always fully searched).
 
         Parameters:
             gameState (TicTacToeGameState): The current state of the Tic-Tac-Toe game.
+            timeLimitMs (int | None): The time budget of the search in milliseconds (default is None, for a fixed depth search).
             
         Raises:
             TypeError: If gameState is not a TicTacToeGameState instance.
+            TypeError: If timeLimitMs is not an integer.
+            ValueError: If timeLimitMs is less than or equal to 0.
 
         Returns:
             Move: The best move determined by the alpha-beta pruning algorithm.
@@ -128,20 +207,54 @@ class AlphaBetaPruningAnalyser(GameAnalyser):
         if not isinstance(gameState, GameState):
             raise TypeError("gameState must be a GameState instance")
         
-        # Reset the node explored count
-        self.__nodeExplored__ = 0
+        # Check if timeLimitMs is a positive integer
+        if timeLimitMs is not None and not isinstance(timeLimitMs, int):
+            raise TypeError("timeLimitMs must be an integer")
+        
+        if timeLimitMs is not None and timeLimitMs <= 0:
+            raise ValueError("timeLimitMs must be greater than 0")
+        
+        # Start a new search, resetting the node explored count
+        self.__startSearch__()
+        
+        # Get the depth at which the deepening stops
+        maxDepth : int = self.__depth__ if timeLimitMs is None else self.getMaximumRemainingPlies(gameState)
         
-        # Get the best score and move using the minimax algorithm
-        bestScore, bestMove = self.__minimax__(gameState, self.__depth__, gameState.getPlayerToPlayIndex())
+        # Deepen the search one ply at a time, the first one being always fully searched
+        self.__moveOrderer__.startSearch()
+        startTime : float = time.perf_counter()
+        
+        bestScore : int | float = None
+        bestMove : int = None
+        depth : int = 1
+        
+        while depth <= max(maxDepth, 1) and not self.__isSearchAborted__ and not self.__isSearchStopped__():
+            
+            # Search the current depth
+            score, move = self.__minimax__(gameState, depth, gameState.getPlayerToPlayIndex())
+            
+            # Keep the result only if the depth was fully searched
+            if not self.__isSearchAborted__ :
+                
+                bestScore, bestMove = score, move
+                if self.__isDebugOn__ : print(f"Iteration depth : {depth}, best score : {bestScore}, best move : {gameState.decodeMove(bestMove)}")
+                
+            # Arm the deadline once the first ply is searched
+            if timeLimitMs is not None : self.__deadline__ = startTime + timeLimitMs / 1000
+            
+            depth += 1
         
         # Print the number of nodes explored and the best score if debugging is enabled
         if self.__isDebugOn__:
             print("Explored : ", self.__nodeExplored__)
             print("Best score : ", bestScore)
 
-        return bestMove
+        # Build the move object only once the search is done
+        if bestMove is None : return None
+
+        return gameState.decodeMove(bestMove)
 
-    def __minimax__(self, gameState: GameState, depth: int, playerIndex: int, alpha: int | float = float('-inf'), beta: int | float = float('inf')) -> tuple[int, Move | None]:
+    def __minimax__(self, gameState: GameState, depth: int, playerIndex: int, alpha: int | float = float('-inf'), beta: int | float = float('inf'), ply: int = 0) -> tuple[int, int | None]:
         
         """
         Recursively evaluates the game state using the Minimax algorithm.
@@ -150,6 +263,9 @@ class AlphaBetaPruningAnalyser(GameAnalyser):
             gameState : Current game state.
             depth : Remaining search depth.
             playerIndex : The index of the maximizing player.
+            alpha : The lowest score the maximizing player is already assured of.
+            beta : The highest score the minimizing player is already assured of.
+            ply : The distance of the node from the root of the search.
             
         Raises :
             TypeError : If gameState is not a TicTacToeGameState instance.
@@ -160,177 +276,237 @@ class AlphaBetaPruningAnalyser(GameAnalyser):
             TypeError : If beta is not an integer or float.
             
         Return : 
-            A tuple (score, move), where `score` is the evaluation of the board, and `move` is the best move to play.
+            A tuple (score, move), where `score` is the evaluation of the board, and `move` is the best encoded move to play.
         """
         
-        # Check if gameState is a TicTacToeGameState instance
-        if not isinstance(gameState, GameState):
-            raise TypeError("gameState must be a GameState instance")
-        
-        # Check if depth is a positive integer
-        if not isinstance(depth, int) or depth < 0:
-            raise ValueError("depth must be a positive integer")
-        
-        # Check if playerIndex is an integer
-        if not isinstance(playerIndex, int):
-            raise TypeError("playerIndex must be an integer")
-        
-        # Check if playerIndex is a valid player index
-        if playerIndex < 0 or playerIndex >= gameState.getPlayerCount():
-            raise ValueError("playerIndex is out of range")
-        
-        # Check if alpha and beta are integers or floats
-        if not isinstance(alpha, int) and not isinstance(alpha, float):
-            raise TypeError("alpha must be an integer or float")
-        
-        if not isinstance(beta, int) and not isinstance(beta, float):
-            raise TypeError("beta must be an integer or float")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if gameState is a TicTacToeGameState instance
+            if not isinstance(gameState, GameState):
+                raise TypeError("gameState must be a GameState instance")
+
+            # Check if depth is a positive integer
+            if not isinstance(depth, int) or depth < 0:
+                raise ValueError("depth must be a positive integer")
+
+            # Check if playerIndex is an integer
+            if not isinstance(playerIndex, int):
+                raise TypeError("playerIndex must be an integer")
+
+            # Check if playerIndex is a valid player index
+            if playerIndex < 0 or playerIndex >= gameState.getPlayerCount():
+                raise ValueError("playerIndex is out of range")
+
+            # Check if alpha and beta are integers or floats
+            if not isinstance(alpha, int) and not isinstance(alpha, float):
+                raise TypeError("alpha must be an integer or float")
+
+            if not isinstance(beta, int) and not isinstance(beta, float):
+                raise TypeError("beta must be an integer or float")
 
         # Increment the node explored count
         self.__nodeExplored__ += 1
 
+        # Abort the search if the deadline is passed, the result will then be ignored
+        if self.__checkSearchStop__() : return 0, None
+
+        # Keep the original window to know which kind of bound the result will be
+        originalAlpha : int | float = alpha
+        originalBeta : int | float = beta
+
+        # Probe the transposition table for this position
+        positionKey : int = gameState.getPositionKey()
+        isMaximizing : bool = playerIndex == gameState.getPlayerToPlayIndex()
+        entry : TranspositionTableEntry = self.__transpositionTable__.get(positionKey, depth)
+
+        if entry is not None :
+
+            # Bring the stored score back to the point of view of the maximizing player
+            entryScore, entryFlag = self.__switchPointOfView__(entry.score, entry.flag, isMaximizing)
+
+            # Use the stored score if it is exact, or narrow the window if it is a bound
+            if entryFlag == TranspositionTableFlag.EXACT : return entryScore, entry.move
+            elif entryFlag == TranspositionTableFlag.LOWER_BOUND : alpha = max(alpha, entryScore)
+            else : beta = min(beta, entryScore)
+
+            if alpha >= beta : return entryScore, entry.move
+
         # Check if the search depth is 0
-        if depth == 0 : return gameState.evaluateForPlayer(playerIndex), None
+        if depth == 0 : 
+            
+            # Evaluate the position and store it
+            score : int = gameState.evaluateForPlayer(playerIndex)
+            self.__storeInTranspositionTable__(positionKey, depth, score, TranspositionTableFlag.EXACT, None, isMaximizing)
+            
+            return score, None
 
         # Initialize the best score and move
         bestScore : int = None
-        bestMove : Move = None
-        e : int = 0
+        bestMove : int = None
+
+        # Get the possible moves and order them, the best move found by a previous search being tried first, then the killer moves
+        # The moves symmetric to a move ordered before them are left out, as they lead to the same score
+        possibleMoves : list[int] = gameState.removeSymmetricMoves(self.__moveOrderer__.orderMoves(gameState.getPossibleEncodedMoves(), gameState.getBoard().getWidth(), gameState.getBoard().getHeight(), gameState.getPlayerToPlayIndex(), ply, self.__transpositionTable__.getMove(positionKey)))
 
-        # Get the possible moves and order them
-        possibleMoves : list[int] = gameState.getPossibleMoves()
-        possibleMoves = self.orderMoves(possibleMoves, gameState.getBoard().getWidth(), gameState.getBoard().getHeight())
+        # On the last level, evaluate the positions reached by the moves all at once instead of playing them one by one
+        childEvaluations : list[float | None] = gameState.evaluateEncodedMoves(possibleMoves, playerIndex) if depth == 1 else [None] * len(possibleMoves)
+
+        # Count the evaluated positions as explored nodes, and check the deadline again as they may be many
+        self.__nodeExplored__ += len(childEvaluations) - childEvaluations.count(None)
+        if self.__checkSearchStop__() : return 0, None
 
         # Iterate over the possible moves
         moveIndex  : int = 0
         while moveIndex < len(possibleMoves) and alpha < beta:
             
-            # Get the current move and play it to get the game outcome
+            # Get the current move
             currentMove = possibleMoves[moveIndex]
 
-            gameOutcome = gameState.play(currentMove)
-            
-            # Check if the game is finished
-            if(gameOutcome.getGameStatus() != GameOutcomeStatus.UNFINISHED) : 
-                
-                score : int
-                
-                # Calculate the score based on the game outcome
-                if gameOutcome.getGameStatus() == GameOutcomeStatus.DRAW : score = 0                 
-                elif gameOutcome.getWinner() == playerIndex : score : int = self.getWinReward(gameState)
-                else : score : int = - self.getWinReward(gameState)
+            nextScore : int | float
 
-                # Undo the move and return the score and move
-                gameState.undo(currentMove)
-                
-                return score, currentMove
+            # Use the evaluation of the reached position if it is already known
+            if childEvaluations[moveIndex] is not None : nextScore = childEvaluations[moveIndex]
 
             else :
+
+                # Play the move, and score the game outcome if the game is finished or recursively evaluate the game state
+                gameOutcome : GameOutcome = gameState.playEncoded(currentMove)
+
+                if gameOutcome.getGameStatus() == GameOutcomeStatus.UNFINISHED : nextScore, _ = self.__minimax__(gameState, depth - 1, playerIndex, alpha, beta, ply + 1)
+                elif gameOutcome.getGameStatus() == GameOutcomeStatus.DRAW : nextScore = 0
+                elif gameOutcome.getWinner() == playerIndex : nextScore = self.getWinReward(gameState)
+                else : nextScore = - self.getWinReward(gameState)
+
+                # Undo the move
+                gameState.undoEncoded(currentMove)
+
+                # Stop without storing anything if the search is aborted
+                if self.__isSearchAborted__ : return 0, None
+
+            # Update the best score and move based on the player
+            if playerIndex == gameState.getPlayerToPlayIndex():
+
+                # Maximizing player
+                if bestScore == None or nextScore > bestScore:
+                    
+                    # Update the best score and move
+                    bestScore = nextScore
+                    bestMove = currentMove
+                    
+                # Update alpha
+                alpha = max(alpha, bestScore)
                 
-                # Recursively evaluate the game state
-                nextScore, _ = self.__minimax__(gameState, depth - 1, playerIndex, alpha, beta)
-
-                # Undo the move and update the best score and move
-                gameState.undo(currentMove)
-
-                # Update the best score and move based on the player
-                if playerIndex == gameState.getPlayerToPlayIndex():
-
-                    # Maximizing player
-                    if bestScore == None or nextScore > bestScore:
-                        
-                        # Update the best score and move
-                        if(bestScore is not None) : e += self.getMoveStrengthToAdd(bestScore) 
-                        bestScore = nextScore
-                        bestMove = currentMove
-
-                    else : e += self.getMoveStrengthToAdd(nextScore)
-                        
-                    # Update alpha
-                    alpha = max(alpha, bestScore)
+            else :
+                
+                # Minimizing player
+                if bestScore == None or nextScore < bestScore:
                     
-                else :
+                    # Update the best score and move
+                    bestScore = nextScore
+                    bestMove = currentMove
                     
-                    # Minimizing player
-                    if bestScore == None or nextScore < bestScore:
-                        
-                        # Update the best score and move
-                        if(bestScore is not None) : e += self.getMoveStrengthToAdd(bestScore)
-                        bestScore = nextScore
-                        bestMove = currentMove
-                        
-                    else : e += self.getMoveStrengthToAdd(nextScore)
-                        
-                    # Update beta
-                    beta = min(beta, bestScore)
-
-                # Increment the move index
-                moveIndex += 1
+                # Update beta
+                beta = min(beta, bestScore)
+
+            # Learn from the move if it produced a cutoff
+            if alpha >= beta : self.__moveOrderer__.recordCutoff(currentMove, gameState.getPlayerToPlayIndex(), ply, depth)
+
+            # Increment the move index
+            moveIndex += 1
 
         # Print the depth, best score, and best move if debugging is enabled
-        if(self.__isDebugOn__): print(f"depth : {depth}, bestScore : {bestScore}, bestMove : {bestMove}")
+        if(self.__isDebugOn__): print(f"depth : {depth}, bestScore : {bestScore}, bestMove : {gameState.decodeMove(bestMove)}")
 
-        return bestScore + e, bestMove
+        # Deduce the kind of bound the best score is from the original window and store it
+        flag : TranspositionTableFlag
+        if bestScore <= originalAlpha : flag = TranspositionTableFlag.UPPER_BOUND
+        elif bestScore >= originalBeta : flag = TranspositionTableFlag.LOWER_BOUND
+        else : flag = TranspositionTableFlag.EXACT
 
-    def orderMoves(self, moves : list[Move], boardWidth : int, boardHeight : int) -> list[Move] :
+        self.__storeInTranspositionTable__(positionKey, depth, bestScore, flag, bestMove, isMaximizing)
+
+        return bestScore, bestMove
+
+    def __storeInTranspositionTable__(self, positionKey : int, depth : int, score : int | float, flag : TranspositionTableFlag, move : int | None, isMaximizing : bool) -> bool :
         
         """
-        Order moves from the nearest from the center to the farther
-
+        Stores a search result in the transposition table.
+        As the same position can be reached with a different maximizing player from one analysis to another, 
+        scores are stored from the point of view of the player to play on the position.
+        
         Parameters:
-            moves (list[Moves]) : the list of moves
-            boardWidth int : the board width
-            boardHeight int : the board width
-            
-        Raises:
-            TypeError: If moves is not a list of Move objects
-            TypeError: If boardWidth or boardHeight is not an integer
-            ValueError: If boardWidth or boardHeight is not a positive integer
+            positionKey (int): The key of the position.
+            depth (int): The remaining depth the position was searched with.
+            score (int | float): The score, from the point of view of the maximizing player.
+            flag (TranspositionTableFlag): The kind of bound the score is, from the point of view of the maximizing player.
+            move (int | None): The best encoded move found on the position.
+            isMaximizing (bool): True if the player to play is the maximizing player.
+        
+        Returns:
+            bool: True if the entry is stored.
+        """
+        
+        # Bring the score to the point of view of the player to play
+        storedScore, storedFlag = self.__switchPointOfView__(score, flag, isMaximizing)
+        
+        return self.__transpositionTable__.put(positionKey, depth, storedScore, storedFlag, move)
 
+    def __switchPointOfView__(self, score : int | float, flag : TranspositionTableFlag, isMaximizing : bool) -> tuple[int | float, TranspositionTableFlag] :
+        
+        """
+        Converts a score and its bound between the point of view of the maximizing player and the one of the player to play.
+        The conversion is its own inverse: on a maximizing node nothing changes, on a minimizing node the score is negated
+        and a lower bound becomes an upper bound (and conversely). This assumes a two players zero-sum evaluation.
+        
+        Parameters:
+            score (int | float): The score to convert.
+            flag (TranspositionTableFlag): The kind of bound the score is.
+            isMaximizing (bool): True if the player to play is the maximizing player.
+        
         Returns:
-            moves (list[Moves]) : the list of moves ordered
+            tuple[int | float, TranspositionTableFlag]: The converted score and bound.
         """
         
-        # Check if moves is a list of Move objects
-        if not all(isinstance(move, Move) for move in moves):
-            raise TypeError("moves must be a list of Move objects")
+        # Nothing to convert on a maximizing node
+        if isMaximizing : return score, flag
         
-        # Check if boardWidth and boardHeight are integers and greater than 0
-        if not isinstance(boardWidth, int) or not isinstance(boardHeight, int):
-            raise TypeError("boardWidth and boardHeight must be integers")
+        # Negate the score and swap the bounds
+        if flag == TranspositionTableFlag.LOWER_BOUND : return -score, TranspositionTableFlag.UPPER_BOUND
+        elif flag == TranspositionTableFlag.UPPER_BOUND : return -score, TranspositionTableFlag.LOWER_BOUND
+        else : return -score, flag
+
+    def orderEncodedMoves(self, encodedMoves : list[int], boardWidth : int, boardHeight : int) -> list[int] :
         
-        if boardWidth <= 0 or boardHeight <= 0:
-            raise ValueError("boardWidth and boardHeight must be positive integers")
+        """
+        Order encoded moves from the nearest from the center to the farther, 
+        then by column and by line, simple moves coming before power-ups on the same case.
+        The rank of each case is only computed once for each board size.
         
-        # Calculate the center column and line
-        centerColumn = boardWidth // 2
-        centerLine = boardHeight // 2
+        Parameters:
+            encodedMoves (list[int]) : the list of encoded moves
+            boardWidth int : the board width
+            boardHeight int : the board height
         
-        def euclidianDistanceFromCenter(move: Move) -> int: 
-            
-            """
-            Calculate the euclidian distance from the center of the board for a move.
-            
-            Parameters:
-                move (Move): The move to calculate the distance from the center.
-                
-            Raises:
-                TypeError: If move is not a Move object.
-                
-            Returns:
-                int: The euclidian distance from the center of the board.
-            """
-            
-            # Check if move is a Move object
-            if not isinstance(move, Move):
-                raise TypeError("move must be a Move object")
-            
-            return abs(centerColumn - move.getCoordinate().getColumn()) + abs(centerLine - move.getCoordinate().getLine())
+        Raises:
+            TypeError: If boardWidth or boardHeight is not an integer
+            ValueError: If boardWidth or boardHeight is not a positive integer
         
-        # Sort the moves by the euclidian distance from the center, then by column, and finally by line
-        sortedMoves = sorted(moves, key=lambda move: (euclidianDistanceFromCenter(move), move.getCoordinate().getColumn(), move.getCoordinate().getLine()))
+        Returns:
+            encodedMoves (list[int]) : the list of encoded moves ordered
+        """
         
-        return sortedMoves
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if boardWidth and boardHeight are integers and greater than 0
+            if not isinstance(boardWidth, int) or not isinstance(boardHeight, int):
+                raise TypeError("boardWidth and boardHeight must be integers")
+
+            if boardWidth <= 0 or boardHeight <= 0:
+                raise ValueError("boardWidth and boardHeight must be positive integers")
+        
+        return self.__moveOrderer__.orderMovesFromCenter(encodedMoves, boardWidth, boardHeight)
 
     def getWinReward(self, gameState: GameState) -> int:
         
@@ -348,32 +524,15 @@ class AlphaBetaPruningAnalyser(GameAnalyser):
             int: The calculated win reward.
         """
         
-        # Check if gameState is a TicTacToeGameState instance
-        if not isinstance(gameState, GameState):
-            raise TypeError("gameState must be a GameState instance")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if gameState is a TicTacToeGameState instance
+            if not isinstance(gameState, GameState):
+                raise TypeError("gameState must be a GameState instance")
         
         # Calculate the score based on the number of moves left
         maxMoves : int = gameState.getBoard().getHeight() * gameState.getBoard().getWidth()
         score : int = ((maxMoves + 3) - gameState.getBoard().getPieceCount()) // 2
 
         return score
-
-    def getMoveStrengthToAdd(self, score : int) -> int: 
-
-        """
-        Give a small value that represent the move potential
-        
-        Parameters :
-            score (int) : the score of the move
-            
-        Raises :
-            TypeError : If the score is not an integer
-        
-        Returns :
-            strength (int) : a small value that represent the move potential
-        """        
-
-        # Check if the score is an integer
-        if not (isinstance(score, int) or isinstance(score, float)): raise TypeError("score must be an integer")
-
-        return score / 100
@@ -0,0 +1,228 @@
+from modules.models.tic_tac_toe.tic_tac_toe_game_state import TicTacToeGameState
+from modules.models.board_game.components.move import Move
+from modules.models.board_game.game.game_state import GameState
+from modules.models.board_game.game.game_analyser import GameAnalyser
+from modules.models.board_game.game.game_analysers.minmax_alpha_beta_pruning_analyser import AlphaBetaPruningAnalyser
+
+from concurrent.futures import ProcessPoolExecutor, Future
+import os
+
+# ************************************************
+# CLASS ParallelAnalyser
+# ************************************************
+# ROLE : This class is used to score the root moves of a game state in several processes at once
+# ************************************************
+# VERSION : 1.0
+# AUTHOR : Nathan PINHEIRO
+# DATE : 13/01/2025
+# ************************************************
+
+DEFAULT_CHUNK_SIZE = 1
+BEST_MOVE_MARGIN = 1e-6
+
+# The analysers of the current worker process, kept from one task to another so that their transposition tables stay warm,
+# what they searched before only changing how fast they score the moves, not the scores
+__workerAnalysers__ : dict[int, AlphaBetaPruningAnalyser] = {}
+
+def scoreRootMoves(compactState: tuple, depth: int, margin: int | float | None, encodedMoves: list[int]) -> dict[int, int | float]:
+    
+    """
+    Scores some root moves of a game state with an alpha-beta search. This function runs in the worker processes.
+    
+    Parameters:
+        compactState (tuple): The compact description of the game state.
+        depth (int): The depth of the search.
+        margin (int | float | None): How far below the best score of these moves a move still gets an exact score (None for exact scores only).
+        encodedMoves (list[int]): The encoded root moves to score.
+    
+    Returns:
+        dict[int, int | float]: The score of each encoded move.
+    """
+
+    # Get the analyser of this process for the given depth
+    if depth not in __workerAnalysers__ : __workerAnalysers__[depth] = AlphaBetaPruningAnalyser(depth)
+
+    # Rebuild the game state and score the moves
+    gameState : TicTacToeGameState = TicTacToeGameState.fromCompactState(compactState)
+    moveScores : dict[Move, int | float] = __workerAnalysers__[depth].getMovesScores(gameState, margin, encodedMoves)
+
+    return {gameState.encodeMove(move): score for move, score in moveScores.items()}
+
+class ParallelAnalyser(GameAnalyser):
+    
+    """
+    A class that splits the root moves of a game state between the processes of a pool, each process scoring its moves
+    with the alpha-beta pruning analyser. The game state is sent to the processes in its compact form, and the pool
+    is kept from one analysis to another, until the analyser is closed.
+    
+    With a margin, each process only knows the best score among its own moves. Once the scores are gathered, the moves scoring
+    below the best score minus the margin are given that lowest score, as the single process analyser does, so both give the same scores.
+    """
+
+    def __init__(self, maxDepth: int, debugOn: bool = False, workerCount: int | None = None, chunkSize: int = DEFAULT_CHUNK_SIZE) -> None:
+        
+        """
+        Initializes the ParallelAnalyser instance.
+        
+        Parameters:
+            maxDepth (int): The depth of the search tree.
+            debugOn (bool): Optional flag to enable debugging output (default is False).
+            workerCount (int | None): The amount of processes of the pool (default is None, for one process per core).
+            chunkSize (int): The amount of root moves sent to a process at once (default is DEFAULT_CHUNK_SIZE).
+        
+        Raises:
+            ValueError: If maxDepth is not a positive integer.
+            TypeError: If debugOn is not a boolean value.
+            TypeError: If workerCount or chunkSize is not an integer.
+            ValueError: If workerCount or chunkSize is less than or equal to 0.
+        
+        Returns:
+            None
+        """
+
+        # Check if maxDepth is a positive integer
+        if not isinstance(maxDepth, int) or maxDepth <= 0:
+            raise ValueError("maxDepth must be a positive integer")
+
+        # Check if debugOn is a boolean value
+        if not isinstance(debugOn, bool):
+            raise TypeError("debugOn must be a boolean value")
+
+        # Check if workerCount and chunkSize are positive integers
+        if workerCount is not None and not isinstance(workerCount, int):
+            raise TypeError("workerCount must be an integer")
+
+        if workerCount is not None and workerCount <= 0:
+            raise ValueError("workerCount must be greater than 0")
+
+        if not isinstance(chunkSize, int):
+            raise TypeError("chunkSize must be an integer")
+
+        if chunkSize <= 0:
+            raise ValueError("chunkSize must be greater than 0")
+
+        # Call the parent constructor
+        super().__init__(maxDepth, debugOn)
+
+        # Define the pool settings, the pool itself being only started by the first analysis
+        self.__workerCount__ : int = workerCount if workerCount is not None else (os.cpu_count() or 1)
+        self.__chunkSize__ : int = chunkSize
+        self.__pool__ : ProcessPoolExecutor | None = None
+
+        # Define the analyser used to order the root moves before splitting them
+        self.__moveOrderingAnalyser__ : AlphaBetaPruningAnalyser = AlphaBetaPruningAnalyser(maxDepth)
+
+        return None
+
+    def getMovesScores(self, gameState: GameState, margin: int | float | None = None) -> dict[Move, int | float]:
+        
+        """
+        Scores all possible moves, the moves being split in chunks scored by the processes of the pool.
+        
+        Parameters:
+            gameState (TicTacToeGameState): The current state of the game.
+            margin (int | float | None): How far below the best score a move still gets an exact score (default is None, for exact scores only).
+        
+        Raises:
+            TypeError: If gameState is not a TicTacToeGameState instance.
+            TypeError: If margin is not an integer or a float.
+            ValueError: If margin is less than 0.
+        
+        Returns:
+            dict[Move, int | float]: A dictionary mapping each possible move to its score.
+        """
+
+        # Check if gameState is a TicTacToeGameState instance
+        if not isinstance(gameState, TicTacToeGameState):
+            raise TypeError("gameState must be a TicTacToeGameState instance")
+
+        # Check if margin is a positive integer or float
+        if margin is not None and not isinstance(margin, (int, float)):
+            raise TypeError("margin must be an integer or a float")
+
+        if margin is not None and margin < 0:
+            raise ValueError("margin must be greater than or equal to 0")
+
+        # Order the moves from the most to the least promising, so that each chunk starts with its best moves
+        possibleMoves : list[int] = self.__moveOrderingAnalyser__.orderEncodedMoves(gameState.getPossibleEncodedMoves(), gameState.getBoard().getWidth(), gameState.getBoard().getHeight())
+
+        # Only send one move among the symmetric ones
+        representatives : dict[int, int] = gameState.getSymmetricMoveRepresentatives(possibleMoves)
+        searchedMoves : list[int] = [move for move in possibleMoves if representatives[move] == move]
+
+        # Send each chunk of moves to the pool
+        compactState : tuple = gameState.getCompactState()
+        futures : list[Future] = [self.__getPool__().submit(scoreRootMoves, compactState, self.__depth__, margin, searchedMoves[chunkStart:chunkStart + self.__chunkSize__]) for chunkStart in range(0, len(searchedMoves), self.__chunkSize__)]
+
+        # Gather the scores of the moves, in the order of the moves, the symmetric moves sharing the score of their representative
+        encodedMoveScores : dict[int, int | float] = {}
+        for future in futures : encodedMoveScores.update(future.result())
+
+        # Give the moves scoring below the window of the best move of all the chunks the lowest score of the window
+        if margin is not None and encodedMoveScores :
+            
+            bestScore : int | float = max(encodedMoveScores.values())
+            for move, score in encodedMoveScores.items() : encodedMoveScores[move] = max(score, bestScore - margin)
+
+        moveScores : dict[Move, int | float] = {gameState.decodeMove(move): encodedMoveScores[representatives[move]] for move in possibleMoves}
+
+        # Print the moves and scores if debugging is enabled
+        if self.__isDebugOn__:
+            for moveIndex, (move, score) in enumerate(moveScores.items()) : print(f"Move {moveIndex}: {move}, Score: {score}")
+
+        return moveScores
+
+    def getBestMove(self, gameState: GameState) -> Move:
+        
+        """
+        Determines the best move for the current game state, the moves being scored by the processes of the pool.
+        Each chunk is searched with a tiny margin, so that the best move of each chunk gets an exact score
+        while the other moves get an upper bound below it.
+        
+        Parameters:
+            gameState (TicTacToeGameState): The current state of the game.
+        
+        Raises:
+            TypeError: If gameState is not a TicTacToeGameState instance.
+        
+        Returns:
+            Move: The best move found, or None if there is no move to play.
+        """
+
+        # Score the moves and keep the first one with the best score
+        moveScores : dict[Move, int | float] = self.getMovesScores(gameState, BEST_MOVE_MARGIN)
+
+        if len(moveScores) == 0 : return None
+
+        return max(moveScores, key=moveScores.get)
+
+    def close(self) -> bool:
+        
+        """
+        Stops the processes of the pool. The next analysis starts a new pool.
+        
+        Returns:
+            bool: True if the pool is stopped.
+        """
+
+        # Stop the pool if it was started
+        if self.__pool__ is not None :
+
+            self.__pool__.shutdown()
+            self.__pool__ = None
+
+        return True
+
+    def __getPool__(self) -> ProcessPoolExecutor:
+        
+        """
+        Returns the pool of processes, starting it if it is not running yet.
+        
+        Returns:
+            ProcessPoolExecutor: The pool of processes.
+        """
+
+        # Start the pool on the first analysis
+        if self.__pool__ is None : self.__pool__ = ProcessPoolExecutor(max_workers=self.__workerCount__)
+
+        return self.__pool__
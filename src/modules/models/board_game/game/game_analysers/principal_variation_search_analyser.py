@@ -0,0 +1,438 @@
+from modules.models.tic_tac_toe.tic_tac_toe_game_state import GameState, MOVE_TYPE_BITS
+from modules.models.board_game.components.move import Move
+from modules.models.board_game.game.game_outcome import GameOutcomeStatus, GameOutcome
+from modules.models.board_game.game.game_analyser import GameAnalyser
+from modules.models.board_game.game.game_analysers.components.transposition_table import TranspositionTable, TranspositionTableEntry, TranspositionTableFlag, DEFAULT_TRANSPOSITION_TABLE_SIZE
+from modules.models.board_game.game.game_analysers.components.move_orderer import MoveOrderer
+from modules.utils.trusted_mode import isTrustedModeOn
+
+import time
+
+# ************************************************
+# CLASS PrincipalVariationSearchAnalyser
+# ************************************************
+# ROLE : This class is used to find the best move of a two players game with a principal variation search
+# ************************************************
+# VERSION : 1.0
+# AUTHOR : Nathan PINHEIRO
+# DATE : 13/01/2025
+# ************************************************
+
+EVALUATION_SCALE = 1000
+INFINITE_SCORE = 1 << 30
+ASPIRATION_WINDOW = EVALUATION_SCALE // 4
+
+class PrincipalVariationSearchAnalyser(GameAnalyser):
+    
+    """
+    A class that implements the principal variation search (also called NegaScout), a negamax alpha-beta search
+    that expects the first of the ordered moves to be the best one. The first move of a node is searched with the full window,
+    the other ones with a null window, only proving that they are not better. A move failing high on its null window is searched
+    again with the full window. The best move is found by iterative deepening, each depth being searched with an aspiration window
+    centered on the score of the previous depth.
+    
+    Scores are integers, from the point of view of the player to play, so that bounds compare exactly:
+        - a win is worth the win reward of the game state times EVALUATION_SCALE (a faster win being worth more),
+        - a draw is worth 0,
+        - an unfinished position is worth its evaluation, between -1 and 1, times EVALUATION_SCALE.
+    As with the alpha-beta analyser, the game is expected to be a two players zero-sum game.
+    """
+
+    def __init__(self, maxDepth: int, debugOn: bool = False, transpositionTableSize: int = DEFAULT_TRANSPOSITION_TABLE_SIZE, transpositionTable: TranspositionTable | None = None) -> None:
+        
+        """
+        Initializes the PrincipalVariationSearchAnalyser instance with the given depth and debugging flag.
+        
+        Parameters:
+            maxDepth (int): The maximum depth of the search tree, when the search is not time limited.
+            debugOn (bool): Optional flag to enable debugging output (default is False).
+            transpositionTableSize (int): The maximum amount of positions kept in the transposition table.
+            transpositionTable (TranspositionTable | None): The transposition table to use, for example one shared with other analysers (default is None, for a new table of transpositionTableSize entries).
+        
+        Raises:
+            ValueError: If maxDepth is not a positive integer.
+            TypeError: If debugOn is not a boolean value.
+            TypeError: If transpositionTableSize is not an integer.
+            ValueError: If transpositionTableSize is less than or equal to 0.
+            TypeError: If transpositionTable is not a TranspositionTable instance.
+        
+        Returns:
+            None
+        """
+
+        # Check if maxDepth is a positive integer
+        if not isinstance(maxDepth, int) or maxDepth <= 0:
+            raise ValueError("maxDepth must be a positive integer")
+
+        # Check if debugOn is a boolean value
+        if not isinstance(debugOn, bool):
+            raise TypeError("debugOn must be a boolean value")
+
+        # Check if transpositionTableSize is a positive integer
+        if not isinstance(transpositionTableSize, int):
+            raise TypeError("transpositionTableSize must be an integer")
+
+        if transpositionTableSize <= 0:
+            raise ValueError("transpositionTableSize must be greater than 0")
+
+        # Check if transpositionTable is a TranspositionTable instance
+        if transpositionTable is not None and not isinstance(transpositionTable, TranspositionTable):
+            raise TypeError("transpositionTable must be a TranspositionTable instance")
+
+        # Call the parent constructor
+        super().__init__(maxDepth, debugOn)
+
+        # Initialize the transposition table, kept between two analyses as its entries do not depend on the root position
+        self.__transpositionTable__ : TranspositionTable = TranspositionTable(transpositionTableSize) if transpositionTable is None else transpositionTable
+
+        # Initialize the move orderer, learning from the cutoffs of the searches
+        self.__moveOrderer__ : MoveOrderer = MoveOrderer(MOVE_TYPE_BITS)
+
+        return None
+
+    def getMovesScores(self, gameState: GameState, margin: int | None = None) -> dict[Move, int]:
+        
+        """
+        Evaluates all possible moves and returns their scores, from the point of view of the player to play.
+        
+        All the root moves are scored in one search, ordered as in the tree and sharing the transposition table.
+        With a margin, once a move is scored, the following moves are searched with a window starting at the best score minus the margin.
+        Moves scoring inside that window get their exact score, while the other ones get an upper bound of their score.
+        Without a margin, every move is searched with a full window and gets its exact score.
+        
+        Parameters:
+            gameState (GameState): The current state of the game.
+            margin (int | None): How far below the best score a move still gets an exact score (default is None, for exact scores only).
+        
+        Raises:
+            TypeError: If gameState is not a GameState instance.
+            TypeError: If margin is not an integer.
+            ValueError: If margin is less than 0.
+        
+        Returns:
+            dict[Move, int]: A dictionary mapping each possible move to its score.
+        """
+
+        # Check if gameState is a GameState instance
+        if not isinstance(gameState, GameState):
+            raise TypeError("gameState must be a GameState instance")
+
+        # Check if margin is a positive integer
+        if margin is not None and not isinstance(margin, int):
+            raise TypeError("margin must be an integer")
+
+        if margin is not None and margin < 0:
+            raise ValueError("margin must be greater than or equal to 0")
+
+        # Start a new search, resetting the node explored count
+        self.__startSearch__()
+
+        moveScores : dict[Move, int] = {}
+        bestScore : int = - INFINITE_SCORE
+        playerToPlayIndex : int = gameState.getPlayerToPlayIndex()
+
+        # Order the moves as in the tree, the best move found by a previous search being tried first
+        self.__moveOrderer__.startSearch()
+        possibleMoves : list[int] = self.__moveOrderer__.orderMoves(gameState.getPossibleEncodedMoves(), gameState.getBoard().getWidth(), gameState.getBoard().getHeight(), playerToPlayIndex, 0, self.__transpositionTable__.getMove(gameState.getPositionKey()))
+
+        # Only search one move among the symmetric ones
+        representatives : dict[int, int] = gameState.getSymmetricMoveRepresentatives(possibleMoves)
+        encodedMoveScores : dict[int, int] = {}
+
+        for moveIndex, move in enumerate(possibleMoves):
+
+            if representatives[move] != move : continue
+
+            # Only look for an exact score if the move can be within the margin of the best one
+            alpha : int = - INFINITE_SCORE if margin is None else max(bestScore - margin, - INFINITE_SCORE)
+
+            # Play the move and score it
+            gameOutcome : GameOutcome = gameState.playEncoded(move)
+
+            score : int
+            if gameOutcome.getGameStatus() != GameOutcomeStatus.UNFINISHED : score = self.__getOutcomeScore__(gameState, gameOutcome, playerToPlayIndex)
+            else : score = - self.__negamax__(gameState, self.__depth__ - 1, - INFINITE_SCORE, - alpha, 1)[0]
+
+            gameState.undoEncoded(move)
+
+            # Store the score of the decoded move and update the best score
+            moveScores[gameState.decodeMove(move)] = encodedMoveScores[move] = score
+            bestScore = max(bestScore, score)
+
+            # Print the move and score if debugging is enabled
+            if self.__isDebugOn__ : print(f"Move {moveIndex}: {gameState.decodeMove(move)}, Score: {score}")
+
+        # Give the symmetric moves the score of their representative
+        for move, representative in representatives.items():
+            if move != representative : moveScores[gameState.decodeMove(move)] = encodedMoveScores[representative]
+
+        # Print the number of nodes explored if debugging is enabled
+        if self.__isDebugOn__ : print("Explored : ", self.__nodeExplored__)
+
+        return moveScores
+
+    def getBestMove(self, gameState: GameState, timeLimitMs: int | None = None) -> Move:
+        
+        """
+        Determines the best move for the current game state.
+        
+        The search is iteratively deepened one ply at a time. From the second depth on, each depth is first searched
+        with an aspiration window around the score of the previous depth, and searched again with the full window
+        if the score falls outside of it. Without a time limit, the search stops at the analyser depth. With a time limit,
+        the search goes as deep as it can and the move of the last fully searched depth is returned (the first ply is always fully searched).
+        
+        Parameters:
+            gameState (GameState): The current state of the game.
+            timeLimitMs (int | None): The time budget of the search in milliseconds (default is None, for a fixed depth search).
+        
+        Raises:
+            TypeError: If gameState is not a GameState instance.
+            TypeError: If timeLimitMs is not an integer.
+            ValueError: If timeLimitMs is less than or equal to 0.
+        
+        Returns:
+            Move: The best move found, or None if there is no move to play.
+        """
+
+        # Check if gameState is a GameState instance
+        if not isinstance(gameState, GameState):
+            raise TypeError("gameState must be a GameState instance")
+
+        # Check if timeLimitMs is a positive integer
+        if timeLimitMs is not None and not isinstance(timeLimitMs, int):
+            raise TypeError("timeLimitMs must be an integer")
+
+        if timeLimitMs is not None and timeLimitMs <= 0:
+            raise ValueError("timeLimitMs must be greater than 0")
+
+        # Start a new search, resetting the node explored count
+        self.__startSearch__()
+
+        # Get the depth at which the deepening stops
+        maxDepth : int = self.__depth__ if timeLimitMs is None else self.getMaximumRemainingPlies(gameState)
+
+        # Deepen the search one ply at a time, the first one being always fully searched
+        self.__moveOrderer__.startSearch()
+        startTime : float = time.perf_counter()
+
+        bestScore : int | None = None
+        bestMove : int | None = None
+        depth : int = 1
+
+        while depth <= max(maxDepth, 1) and not self.__isSearchAborted__ and not self.__isSearchStopped__():
+
+            # Search the current depth within a window around the previous score
+            alpha : int = - INFINITE_SCORE if bestScore is None else bestScore - ASPIRATION_WINDOW
+            beta : int = INFINITE_SCORE if bestScore is None else bestScore + ASPIRATION_WINDOW
+
+            score, move = self.__negamax__(gameState, depth, alpha, beta, 0)
+
+            # Search again with the full window if the score is outside of the aspiration window
+            if not self.__isSearchAborted__ and (score <= alpha or score >= beta) and (alpha, beta) != (- INFINITE_SCORE, INFINITE_SCORE) :
+                score, move = self.__negamax__(gameState, depth, - INFINITE_SCORE, INFINITE_SCORE, 0)
+
+            # Keep the result only if the depth was fully searched
+            if not self.__isSearchAborted__ and move is not None :
+
+                bestScore, bestMove = score, move
+                if self.__isDebugOn__ : print(f"Iteration depth : {depth}, best score : {bestScore}, best move : {gameState.decodeMove(bestMove)}")
+
+            # Arm the deadline once the first ply is searched
+            if timeLimitMs is not None : self.__deadline__ = startTime + timeLimitMs / 1000
+
+            depth += 1
+
+        # Print the number of nodes explored and the best score if debugging is enabled
+        if self.__isDebugOn__:
+            print("Explored : ", self.__nodeExplored__)
+            print("Best score : ", bestScore)
+
+        # Build the move object only once the search is done
+        if bestMove is None : return None
+
+        return gameState.decodeMove(bestMove)
+
+    def __negamax__(self, gameState: GameState, depth: int, alpha: int, beta: int, ply: int) -> tuple[int, int | None]:
+        
+        """
+        Recursively evaluates the game state with a principal variation search.
+        
+        Parameters:
+            gameState (GameState): The current game state.
+            depth (int): The remaining search depth.
+            alpha (int): The lowest score the player to play is already assured of.
+            beta (int): The highest score the opponent lets the player to play reach.
+            ply (int): The distance of the node from the root of the search.
+        
+        Raises:
+            TypeError: If gameState is not a GameState instance.
+            ValueError: If depth is not a positive integer.
+            TypeError: If alpha or beta is not an integer.
+        
+        Returns:
+            tuple[int, int | None]: The score of the position from the point of view of the player to play, and the best encoded move to play.
+        """
+
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+
+            # Check if gameState is a GameState instance
+            if not isinstance(gameState, GameState):
+                raise TypeError("gameState must be a GameState instance")
+
+            # Check if depth is a positive integer
+            if not isinstance(depth, int) or depth < 0:
+                raise ValueError("depth must be a positive integer")
+
+            # Check if alpha and beta are integers
+            if not isinstance(alpha, int) or not isinstance(beta, int):
+                raise TypeError("alpha and beta must be integers")
+
+        # Increment the node explored count
+        self.__nodeExplored__ += 1
+
+        # Abort the search if it must stop, the result will then be ignored
+        if self.__checkSearchStop__() : return 0, None
+
+        # Keep the original lower bound to know which kind of bound the result will be
+        originalAlpha : int = alpha
+
+        # Probe the transposition table for this position
+        positionKey : int = gameState.getPositionKey()
+        entry : TranspositionTableEntry = self.__transpositionTable__.get(positionKey, depth)
+
+        if entry is not None :
+
+            # Use the stored score if it is exact, or narrow the window if it is a bound
+            if entry.flag == TranspositionTableFlag.EXACT : return entry.score, entry.move
+            elif entry.flag == TranspositionTableFlag.LOWER_BOUND : alpha = max(alpha, entry.score)
+            else : beta = min(beta, entry.score)
+
+            if alpha >= beta : return entry.score, entry.move
+
+        # Evaluate the position and store it if the search depth is reached
+        playerToPlayIndex : int = gameState.getPlayerToPlayIndex()
+
+        if depth == 0 :
+
+            score : int = round(gameState.evaluateForPlayer(playerToPlayIndex) * EVALUATION_SCALE)
+            self.__transpositionTable__.put(positionKey, depth, score, TranspositionTableFlag.EXACT, None)
+
+            return score, None
+
+        # Get the possible moves and order them, the best move found by a previous search being tried first, then the killer moves
+        # The moves symmetric to a move ordered before them are left out, as they lead to the same score
+        possibleMoves : list[int] = gameState.removeSymmetricMoves(self.__moveOrderer__.orderMoves(gameState.getPossibleEncodedMoves(), gameState.getBoard().getWidth(), gameState.getBoard().getHeight(), playerToPlayIndex, ply, self.__transpositionTable__.getMove(positionKey)))
+
+        bestScore : int = - INFINITE_SCORE
+        bestMove : int | None = None
+
+        # On the last level, evaluate the positions reached by the moves all at once instead of playing them one by one
+        childEvaluations : list[float | None] = gameState.evaluateEncodedMoves(possibleMoves, (playerToPlayIndex + 1) % gameState.getPlayerCount()) if depth == 1 else [None] * len(possibleMoves)
+
+        # Count the evaluated positions as explored nodes, and check whether the search must stop again as they may be many
+        self.__nodeExplored__ += len(childEvaluations) - childEvaluations.count(None)
+        if self.__checkSearchStop__() : return 0, None
+
+        for moveIndex, move in enumerate(possibleMoves):
+
+            score : int
+
+            # Score the move from the evaluation of the reached position if it is already known
+            if childEvaluations[moveIndex] is not None :
+
+                score = - round(childEvaluations[moveIndex] * EVALUATION_SCALE)
+
+            else :
+
+                # Play the move and score it
+                gameOutcome : GameOutcome = gameState.playEncoded(move)
+
+                if gameOutcome.getGameStatus() != GameOutcomeStatus.UNFINISHED : score = self.__getOutcomeScore__(gameState, gameOutcome, playerToPlayIndex)
+
+                # Search the first move with the full window
+                elif moveIndex == 0 : score = - self.__negamax__(gameState, depth - 1, - beta, - alpha, ply + 1)[0]
+
+                else :
+
+                    # Prove with a null window that the move is not better than the best one, and search it again with the full window if it is
+                    score = - self.__negamax__(gameState, depth - 1, - alpha - 1, - alpha, ply + 1)[0]
+                    if alpha < score < beta and not self.__isSearchAborted__ : score = - self.__negamax__(gameState, depth - 1, - beta, - score, ply + 1)[0]
+
+                gameState.undoEncoded(move)
+
+            # Stop without storing anything if the search is aborted
+            if self.__isSearchAborted__ : return 0, None
+
+            # Update the best score and move, and the lower bound
+            if score > bestScore : bestScore, bestMove = score, move
+            alpha = max(alpha, score)
+
+            # Learn from the move and stop if it produced a cutoff
+            if alpha >= beta :
+
+                self.__moveOrderer__.recordCutoff(move, playerToPlayIndex, ply, depth)
+                break
+
+        # Print the depth, best score, and best move if debugging is enabled
+        if self.__isDebugOn__ : print(f"depth : {depth}, bestScore : {bestScore}, bestMove : {gameState.decodeMove(bestMove)}")
+
+        # Deduce the kind of bound the best score is from the original window and store it
+        flag : TranspositionTableFlag
+        if bestScore <= originalAlpha : flag = TranspositionTableFlag.UPPER_BOUND
+        elif bestScore >= beta : flag = TranspositionTableFlag.LOWER_BOUND
+        else : flag = TranspositionTableFlag.EXACT
+
+        self.__transpositionTable__.put(positionKey, depth, bestScore, flag, bestMove)
+
+        return bestScore, bestMove
+
+    def __getOutcomeScore__(self, gameState: GameState, gameOutcome: GameOutcome, playerIndex: int) -> int:
+        
+        """
+        Returns the score of a finished game, from the point of view of the player who just played.
+        
+        Parameters:
+            gameState (GameState): The game state, the move ending the game being still played.
+            gameOutcome (GameOutcome): The outcome of the move.
+            playerIndex (int): The index of the player who played the move ending the game.
+        
+        Returns:
+            int: 0 for a draw, the win score for a win and its opposite for a loss.
+        """
+
+        # A draw is worth nothing
+        if gameOutcome.getGameStatus() == GameOutcomeStatus.DRAW : return 0
+
+        # A win of the player who played the move, or of an opponent
+        if gameOutcome.getWinner() == playerIndex : return self.getWinScore(gameState)
+
+        return - self.getWinScore(gameState)
+
+    def getWinScore(self, gameState: GameState) -> int:
+        
+        """
+        Calculates the score of a winning state, prioritizing faster wins by providing higher scores.
+        It is always greater than the score of an unfinished position.
+        
+        Parameters:
+            gameState (GameState): The current game state.
+        
+        Raises:
+            TypeError: If gameState is not a GameState instance.
+        
+        Returns:
+            int: The calculated win score.
+        """
+
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+
+            # Check if gameState is a GameState instance
+            if not isinstance(gameState, GameState):
+                raise TypeError("gameState must be a GameState instance")
+
+        # Calculate the score based on the number of moves left
+        maxMoves : int = gameState.getBoard().getHeight() * gameState.getBoard().getWidth()
+
+        return (((maxMoves + 3) - gameState.getBoard().getPieceCount()) // 2) * EVALUATION_SCALE
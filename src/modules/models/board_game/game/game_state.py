@@ -5,7 +5,7 @@ from modules.models.board_game.board.board import Board
 from modules.models.board_game.components.win_condition import WinCondition
 from modules.models.board_game.components.move import Move
 from modules.models.board_game.components.player_data import PlayerData
-from modules.models.board_game.game.game_outcome import GameOutcome
+from modules.models.board_game.game.game_outcome import GameOutcome, GameOutcomeStatus
 from modules.models.board_game.game.game_history import GameHistory
 
 # ************************************************
@@ -142,6 +142,86 @@ class GameState(ABC):
         
         pass
 
+    @abstractmethod
+    def getPossibleEncodedMoves(self) -> list[int]:
+        
+        """
+        Retrieve all possible moves for the current game state, encoded as integers.
+        Encoded moves are meant for search algorithms, that play and undo a lot of moves without keeping them.
+        
+        Returns:
+            list[int]: A list of valid encoded moves.
+        """
+        
+        pass
+
+    @abstractmethod
+    def playEncoded(self, encodedMove: int) -> GameOutcome:
+        
+        """
+        Execute an encoded move and return the resulting game outcome.
+        Unlike play, the move is not added to the game history.
+        
+        Parameters:
+            encodedMove (int): The encoded move to execute.
+        
+        Returns:
+            GameOutcome: The result after the move.
+        """
+        
+        pass
+
+    @abstractmethod
+    def undoEncoded(self, encodedMove: int) -> bool:
+        
+        """
+        Undo the last encoded move played, restoring the previous game state.
+        
+        Parameters:
+            encodedMove (int): The encoded move to undo.
+        
+        Returns:
+            bool: True if the move was undone.
+        """
+        
+        pass
+
+    @abstractmethod
+    def encodeMove(self, move: Move) -> int:
+        
+        """
+        Encode a move as an integer.
+        
+        Parameters:
+            move (Move): The move to encode.
+        
+        Raises:
+            TypeError: If move is not a Move object.
+        
+        Returns:
+            int: The encoded move.
+        """
+        
+        pass
+
+    @abstractmethod
+    def decodeMove(self, encodedMove: int) -> Move:
+        
+        """
+        Build the move object described by an encoded move.
+        
+        Parameters:
+            encodedMove (int): The encoded move.
+        
+        Raises:
+            TypeError: If encodedMove is not an integer.
+        
+        Returns:
+            Move: The decoded move.
+        """
+        
+        pass
+
     def getPlayerCount(self) -> int:
         
         """
@@ -254,6 +334,17 @@ class GameState(ABC):
         
         return self.__gameHistory__
 
+    def getWinCondition(self) -> WinCondition:
+        
+        """
+        Returns the win condition of the game.
+        
+        Returns:
+            WinCondition: The win condition logic.
+        """
+        
+        return self.__winCondition__
+
     def setWinCondition(self, win_condition: WinCondition) -> bool:
         
         """
@@ -310,16 +401,21 @@ class GameState(ABC):
         
         return self.__winCondition__.checkWinForPlayer(playerIndex, self.__board__)
 
-    def checkWinForCurrentPlayer(self) -> GameOutcome:
+    def checkWinForCurrentPlayer(self, line: int | None = None, column: int | None = None) -> GameOutcome:
         
         """
         Checks if the current player has met the win condition.
+        When the case of the last piece played by the current player is given, the win condition may only check around it.
+        
+        Parameters:
+            line (int | None): The line of the last piece played (default is None, to check the whole board).
+            column (int | None): The column of the last piece played (default is None, to check the whole board).
         
         Returns:
             GameOutcome: The outcome of the game.
         """
         
-        return self.__winCondition__.checkWinForPlayer(self.__playerToPlayIndex__, self.__board__)
+        return self.__winCondition__.checkWinForPlayer(self.__playerToPlayIndex__, self.__board__, line, column)
 
     def evaluateForPlayer(self, playerIndex: int) -> GameOutcome:
         
@@ -342,6 +438,75 @@ class GameState(ABC):
         
         return self.__winCondition__.evaluateForPlayer(playerIndex, self.__board__)
 
+    def evaluateEncodedMoves(self, encodedMoves: list[int], playerIndex: int) -> list[float | None]:
+        
+        """
+        Evaluates the position reached by each encoded move for a player, as evaluateForPlayer would once the move is played.
+        The moves ending the game are not evaluated, their outcome being up to the caller.
+        Each move is played, evaluated and undone in turn, so the game state is left as it was given.
+        
+        Parameters:
+            encodedMoves (list[int]): The encoded moves of the player to play.
+            playerIndex (int): The index of the player to evaluate the positions for.
+        
+        Returns:
+            list[float | None]: The evaluation of the position reached by each move, or None if the move ends the game.
+        """
+        
+        evaluations : list[float | None] = []
+        
+        for encodedMove in encodedMoves :
+            
+            gameOutcome : GameOutcome = self.playEncoded(encodedMove)
+            evaluations.append(self.evaluateForPlayer(playerIndex) if gameOutcome.getGameStatus() == GameOutcomeStatus.UNFINISHED else None)
+            self.undoEncoded(encodedMove)
+        
+        return evaluations
+
+    def getPositionKey(self) -> int:
+        
+        """
+        Returns a key identifying the current position, that is the board and the player to play.
+        Two game states sharing the same key can be considered as the same node by a search algorithm.
+        
+        Returns:
+            int: The key of the current position.
+        """
+
+        return hash((hash(self.__board__), self.__playerToPlayIndex__))
+
+    def getSymmetricMoveRepresentatives(self, encodedMoves: list[int]) -> dict[int, int]:
+        
+        """
+        Maps each encoded move to the representative of its symmetric moves, that is the first of them in the given list.
+        Equivalent moves lead to the same or to symmetric positions, so a search only needs to explore the representatives.
+        A game state knowing nothing of the symmetries of its board makes each move its own representative.
+        
+        Parameters:
+            encodedMoves (list[int]): The encoded moves.
+        
+        Returns:
+            dict[int, int]: The representative of each encoded move.
+        """
+        
+        return {encodedMove: encodedMove for encodedMove in encodedMoves}
+
+    def removeSymmetricMoves(self, encodedMoves: list[int]) -> list[int]:
+        
+        """
+        Removes the encoded moves symmetric to a move coming before them in the list, keeping the order of the other ones.
+        
+        Parameters:
+            encodedMoves (list[int]): The encoded moves.
+        
+        Returns:
+            list[int]: The encoded moves that are their own representative.
+        """
+        
+        representatives : dict[int, int] = self.getSymmetricMoveRepresentatives(encodedMoves)
+        
+        return [encodedMove for encodedMove in encodedMoves if representatives[encodedMove] == encodedMove]
+
     def copy(self) -> GameState:
         
         """
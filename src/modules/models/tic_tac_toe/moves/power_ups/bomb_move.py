@@ -1,8 +1,8 @@
 from modules.models.tic_tac_toe.moves.power_up_move import PowerUpMove
 from modules.models.board_game.components.coordinate import Coordinate
-from modules.models.board_game.components.entity import Entity
 from modules.models.board_game.board.board import Board
 from modules.models.displayer.console_displayer import *
+from modules.utils.trusted_mode import isTrustedModeOn
 
 class BombMove(PowerUpMove):
     
@@ -32,8 +32,8 @@ class BombMove(PowerUpMove):
         # Call the parent constructor
         super().__init__("b", coordinate)
         
-        # The list of deleted entities
-        self.__deletedEntities__ : list[tuple[Entity, bool]] = []
+        # The state of the cases cleared by the bomb, given back by the board to restore them
+        self.__clearedCases__ : tuple = ()
         
         return None
     
@@ -55,36 +55,31 @@ class BombMove(PowerUpMove):
             bool: True if the move was played, False otherwise.
         """
         
-        # Check if the board is a Board object
-        if not isinstance(board, Board):
-            raise TypeError("The board must be a Board object.")
-        
-        # Check if the player index is an integer
-        if not isinstance(playerIndex, int):
-            raise ValueError("The player index must be an integer.")
-        
-        # Check if the player index is a valid index
-        if playerIndex < 0 or playerIndex >= board.getPlayerCount():
-            raise ValueError("The player index must be a valid index.")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if the board is a Board object
+            if not isinstance(board, Board):
+                raise TypeError("The board must be a Board object.")
+
+            # Check if the player index is an integer
+            if not isinstance(playerIndex, int):
+                raise ValueError("The player index must be an integer.")
+
+            # Check if the player index is a valid index
+            if playerIndex < 0 or playerIndex >= board.getPlayerCount():
+                raise ValueError("The player index must be a valid index.")
         
         # Get the line and column of the bomb
         line : int = self.__coordinate__.getLine()
         column : int = self.__coordinate__.getColumn()
 
         # Check if the line and column are valid
-        if(line < 0 or line > board.getHeight()) : return False
-        if(column < 0 or column > board.getWidth()) : return False
-        
-        # Delete the entities around the bomb
-        for currentLine in range(line - 1, line + 2):
-            for currentColumn in range(column - 1, column + 2):
-                
-                if(0 <= currentLine < board.getHeight() and 0 <= currentColumn < board.getWidth()):
-
-                    self.__deletedEntities__.append((board.getEntityAt(currentLine, currentColumn), board.isCaseBlocked(currentLine, currentColumn)))
-
-                    board.setIsCaseBlocked(currentLine, currentColumn, False)
-                    board.removeEntityAt(currentLine, currentColumn)
+        if(line < 0 or line >= board.getHeight()) : return False
+        if(column < 0 or column >= board.getWidth()) : return False
+        
+        # Clear the cases around the bomb, saving them to undo the move
+        self.__clearedCases__ = board.clearSquareAround(line, column)
 
         # The move is done
         self.__isMoveDone__ = True
@@ -109,46 +104,34 @@ class BombMove(PowerUpMove):
             bool: True if the move was undone, False otherwise.
         """
         
-        # Check if the board is a Board object
-        if not isinstance(board, Board):
-            raise TypeError("The board must be a Board object.")
-        
-        # Check if the player index is an integer
-        if not isinstance(playerIndex, int):
-            raise ValueError("The player index must be an integer.")
-        
-        # Check if the player index is a valid index
-        if playerIndex < 0 or playerIndex >= board.getPlayerCount():
-            raise ValueError("The player index must be a valid index.")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if the board is a Board object
+            if not isinstance(board, Board):
+                raise TypeError("The board must be a Board object.")
+
+            # Check if the player index is an integer
+            if not isinstance(playerIndex, int):
+                raise ValueError("The player index must be an integer.")
+
+            # Check if the player index is a valid index
+            if playerIndex < 0 or playerIndex >= board.getPlayerCount():
+                raise ValueError("The player index must be a valid index.")
         
         # Get the line and column of the bomb
         line : int = self.__coordinate__.getLine()
         column : int = self.__coordinate__.getColumn()
 
         # Check if the line and column are valid
-        if(line < 0 or line > board.getHeight()) : return False
-        if(column < 0 or column > board.getWidth()) : return False
-
-        # Add the entities around the bomb
-        deletedEntityIndex : int = 0
-
-        for currentLine in range(line - 1, line + 2):
-            for currentColumn in range(column - 1, column + 2):
-
-                if(0 <= currentLine < board.getHeight() and 0 <= currentColumn < board.getWidth()):
+        if(line < 0 or line >= board.getHeight()) : return False
+        if(column < 0 or column >= board.getWidth()) : return False
 
-                    deletedEntityData : tuple[Entity, bool] = self.__deletedEntities__[deletedEntityIndex]
-                    
-                    entity : Entity = deletedEntityData[0]
-                    wasCaseBlocked : bool = deletedEntityData[1]
-
-                    if(entity != None) : board.addEntityAt(currentLine, currentColumn, entity)
-                    board.setIsCaseBlocked(currentLine, currentColumn, wasCaseBlocked)
-                    
-                    deletedEntityIndex += 1
+        # Put back the cases around the bomb
+        board.restoreSquareAround(line, column, self.__clearedCases__)
 
         # The move is undone
-        self.__deletedEntities__ = []
+        self.__clearedCases__ = ()
         self.__isMoveDone__ = False
         
         return True
@@ -172,16 +155,19 @@ class BombMove(PowerUpMove):
             bool : True if the move can be played, False otherwise.
         """
         
-        # Check if board is a Board object
-        if not isinstance(board, Board):
-            raise TypeError("The board must be a Board object.")
-        
-        # Check if the line and column are valid
-        if not isinstance(line, int) or not isinstance(column, int):
-            raise TypeError("The line and column must be integers.")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if board is a Board object
+            if not isinstance(board, Board):
+                raise TypeError("The board must be a Board object.")
+
+            # Check if the line and column are valid
+            if not isinstance(line, int) or not isinstance(column, int):
+                raise TypeError("The line and column must be integers.")
         
-        if(line < 0 or line > board.getHeight()) : return False
-        if(column < 0 or column > board.getWidth()) : return False
+        if(line < 0 or line >= board.getHeight()) : return False
+        if(column < 0 or column >= board.getWidth()) : return False
         
         return True
     
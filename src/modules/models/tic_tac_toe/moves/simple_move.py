@@ -2,6 +2,7 @@ from enum import Enum
 from modules.models.board_game.components.coordinate import Coordinate
 from modules.models.board_game.board.board import Board
 from modules.models.board_game.components.move import Move
+from modules.utils.trusted_mode import isTrustedModeOn
 
 class SimpleMove(Move) :
     
@@ -51,17 +52,20 @@ class SimpleMove(Move) :
             bool : True if the move was played, False otherwise.
         """
         
-        # Check if the board is a Board object
-        if not isinstance(board, Board):
-            raise TypeError("The board must be a Board object.")
-        
-        # Check if the player index is an integer
-        if not isinstance(playerIndex, int):
-            raise ValueError("The player index must be an integer.")
-        
-        # Check if the player index is a valid index
-        if playerIndex < 0 or playerIndex >= board.getPlayerCount():
-            raise ValueError("The player index must be a valid index.")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if the board is a Board object
+            if not isinstance(board, Board):
+                raise TypeError("The board must be a Board object.")
+
+            # Check if the player index is an integer
+            if not isinstance(playerIndex, int):
+                raise ValueError("The player index must be an integer.")
+
+            # Check if the player index is a valid index
+            if playerIndex < 0 or playerIndex >= board.getPlayerCount():
+                raise ValueError("The player index must be a valid index.")
 
         # Get the line and column
         line : int = self.__coordinate__.getLine()
@@ -101,17 +105,20 @@ class SimpleMove(Move) :
             bool: True if the move was undone.
         """
         
-        # Check if the board is a Board object
-        if not isinstance(board, Board):
-            raise TypeError("The board must be a Board object.")
-        
-        # Check if the player index is an integer
-        if not isinstance(playerIndex, int):
-            raise ValueError("The player index must be an integer.")
-        
-        # Check if the player index is a valid index
-        if playerIndex < 0 or playerIndex >= board.getPlayerCount():
-            raise ValueError("The player index must be a valid index.")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if the board is a Board object
+            if not isinstance(board, Board):
+                raise TypeError("The board must be a Board object.")
+
+            # Check if the player index is an integer
+            if not isinstance(playerIndex, int):
+                raise ValueError("The player index must be an integer.")
+
+            # Check if the player index is a valid index
+            if playerIndex < 0 or playerIndex >= board.getPlayerCount():
+                raise ValueError("The player index must be a valid index.")
         
         # Get the line and column
         line : int = self.__coordinate__.getLine()
@@ -151,13 +158,16 @@ class SimpleMove(Move) :
             bool: True if the move can be played, False otherwise.
         """
         
-        # Check if the board is a Board object
-        if not isinstance(board, Board):
-            raise TypeError("The board must be a Board object.")
-        
-        # Check if the line and column are integers
-        if not isinstance(line, int) or not isinstance(column, int):
-            raise TypeError("The line and column must be integers.")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if the board is a Board object
+            if not isinstance(board, Board):
+                raise TypeError("The board must be a Board object.")
+
+            # Check if the line and column are integers
+            if not isinstance(line, int) or not isinstance(column, int):
+                raise TypeError("The line and column must be integers.")
         
         if(line < 0 or line > board.getHeight()) : return False
         if(column < 0 or column > board.getWidth()) : return False
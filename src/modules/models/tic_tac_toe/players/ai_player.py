@@ -14,6 +14,8 @@ from modules.models.board_game.game.game_analysers.minmax_alpha_beta_pruning_ana
 # DATE : 10/01/2025
 # ************************************************
 
+MULTI_PV_MARGIN = 10
+
 class AIPlayer(Player):
     
     """
@@ -1,4 +1,4 @@
-from modules.models.tic_tac_toe.players.ai_player import AIPlayer
+from modules.models.tic_tac_toe.players.ai_player import AIPlayer, MULTI_PV_MARGIN
 from modules.models.tic_tac_toe.tic_tac_toe_game_state import TicTacToeGameState
 from modules.models.board_game.components.move import Move
 
@@ -75,7 +75,7 @@ class HardAIPlayer(AIPlayer):
             raise TypeError("The game state must be a TicTacToeGameState instance.")
 
         # Get the scores of the moves
-        moveScores : dict[Move, int] = self.__gameAnalyser__.getMovesScores(gameState)
+        moveScores : dict[Move, int] = self.__gameAnalyser__.getMovesScores(gameState, MULTI_PV_MARGIN)
 
         # Check if there are moves to play
         if not moveScores : raise ValueError("Can't play as there is no moves to play")
@@ -1,6 +1,8 @@
 from modules.models.tic_tac_toe.players.ai_player import AIPlayer
 from modules.models.tic_tac_toe.tic_tac_toe_game_state import TicTacToeGameState
 from modules.models.board_game.components.move import Move
+from modules.models.board_game.game.game_analysers.principal_variation_search_analyser import PrincipalVariationSearchAnalyser
+from modules.models.tic_tac_toe.tablebases.tablebase import Tablebase
 
 import numpy as np
 import random
@@ -15,6 +17,8 @@ import random
 # DATE : 10/01/2025
 # ************************************************
 
+TIME_LIMIT_MS = 1000
+
 class ImpossibleAIPlayer(AIPlayer):
     
     """
@@ -44,6 +48,9 @@ class ImpossibleAIPlayer(AIPlayer):
         # Call the parent constructor
         super().__init__(name)
         
+        # Use a principal variation search, the depth being only bounded by the time limit of each move
+        self.__gameAnalyser__ = PrincipalVariationSearchAnalyser(3)
+        
         return None
     
     def getChoice(self, gameState: TicTacToeGameState) -> Move:
@@ -67,4 +74,12 @@ class ImpossibleAIPlayer(AIPlayer):
         if not isinstance(gameState, TicTacToeGameState):
             raise ValueError("The game state must be a TicTacToeGameState instance.")
 
-        return self.__gameAnalyser__.getBestMove(gameState)
\ No newline at end of file
+        # Answer from the tablebase of the game if it was computed, the position being looked up instead of searched
+        tablebase : Tablebase | None = Tablebase.find(gameState)
+        
+        if tablebase is not None :
+            
+            bestMove : Move | None = tablebase.getBestMove(gameState)
+            if bestMove is not None : return bestMove
+        
+        return self.__gameAnalyser__.getBestMove(gameState, TIME_LIMIT_MS)
\ No newline at end of file
@@ -0,0 +1,325 @@
+from __future__ import annotations
+from modules.models.board_game.board.boards.optimized_board import OptimizedBoard
+from modules.models.board_game.components.move import Move
+from modules.models.board_game.components.win_condition import WinCondition
+from modules.models.board_game.game.game_outcome import GameOutcome, GameOutcomeStatus
+from modules.models.tic_tac_toe.tic_tac_toe_game_state import TicTacToeGameState
+from modules.models.tic_tac_toe.moves.power_ups.bomb_move import BombMove
+from modules.models.tic_tac_toe.win_conditions.align_victory import AlignVictory
+from modules.models.tic_tac_toe.win_conditions.unalign_victory import UnalignVictory
+
+from typing import Optional, Type
+import os
+import struct
+
+import numpy as np
+
+# ************************************************
+# CLASS Tablebase
+# ************************************************
+# ROLE : This class is used to read the perfect play values of the positions of a small board from a precomputed file
+# ************************************************
+# VERSION : 1.0
+# AUTHOR : Nathan PINHEIRO
+# DATE : 13/01/2025
+# ************************************************
+
+# The directory of the tablebase files, relative to the src directory the game runs from
+TABLEBASE_DIRECTORY = "./assets/tablebases"
+
+# The layout of a tablebase file: a header, then the sorted position indexes (uint64), then the value of each position (int16)
+TABLEBASE_MAGIC = b"TTTB"
+TABLEBASE_VERSION = 2
+TABLEBASE_HEADER_FORMAT = "<4sHBBBB6xQ"
+TABLEBASE_HEADER_SIZE = struct.calcsize(TABLEBASE_HEADER_FORMAT)
+
+# The win conditions a tablebase can be computed for, with their code in the files
+WIN_CONDITION_CODES : dict[Type[WinCondition], int] = {AlignVictory: 0, UnalignVictory: 1}
+
+def isPositionSupported(gameState: TicTacToeGameState) -> bool:
+    
+    """
+    Tells whether a position can be described by a tablebase index: two players on an optimized board,
+    with no other power-up than a bomb.
+    
+    Parameters:
+        gameState (TicTacToeGameState): The position.
+    
+    Returns:
+        bool: True if the position has a tablebase index, False otherwise.
+    """
+
+    if gameState.getPlayerCount() != 2 or not isinstance(gameState.getBoard(), OptimizedBoard) : return False
+
+    return all(set(gameState.getPlayerData(playerIndex).getPowerUpMoves()) <= {BombMove} and len(gameState.getPlayerData(playerIndex).getPowerUpMoves()) <= 1 for playerIndex in range(2))
+
+def getPositionIndex(gameState: TicTacToeGameState) -> int:
+    
+    """
+    Returns the tablebase index of a position. The cases are described by the canonical key of the board,
+    so that symmetric positions share their index and are only stored once. It is followed by a bit telling
+    whether each player still has its bomb and by the index of the player to play.
+    
+    Parameters:
+        gameState (TicTacToeGameState): The position, supported by the tablebases.
+    
+    Returns:
+        int: The index of the position.
+    """
+
+    # Get the bombs left and the player to play
+    bombFlags : int = (len(gameState.getPlayerData(0).getPowerUpMoves()) << 1) | len(gameState.getPlayerData(1).getPowerUpMoves())
+
+    return (gameState.getBoard().getCanonicalKey() << 3) | (bombFlags << 1) | gameState.getPlayerToPlayIndex()
+
+def getParentValue(childValue: int) -> int:
+    
+    """
+    Converts the value of a position into the value of the move leading to it, for the player who played it.
+    A value is seen from the player to play: 0 for a draw, n for a win in n plies, -n for a loss in n plies.
+    
+    Parameters:
+        childValue (int): The value of the position reached by the move.
+    
+    Returns:
+        int: The value of the move.
+    """
+
+    if childValue > 0 : return - (childValue + 1)
+    if childValue < 0 : return - childValue + 1
+
+    return 0
+
+def getValueRank(value: int) -> tuple[int, int]:
+    
+    """
+    Returns the sort key of a value, the greatest key being the best for the player to play:
+    the fastest win, then a draw, then the slowest loss.
+    
+    Parameters:
+        value (int): The value.
+    
+    Returns:
+        tuple[int, int]: The sort key of the value.
+    """
+
+    if value > 0 : return (2, - value)
+    if value < 0 : return (0, - value)
+
+    return (1, 0)
+
+def getMoveValue(gameOutcome: GameOutcome, playerIndex: int) -> Optional[int]:
+    
+    """
+    Returns the value of a move that finished the game, for the player who played it.
+    
+    Parameters:
+        gameOutcome (GameOutcome): The outcome of the move.
+        playerIndex (int): The index of the player who played the move.
+    
+    Returns:
+        Optional[int]: 0 for a draw, 1 for a win and -1 for a loss, or None if the game is not finished.
+    """
+
+    if gameOutcome.getGameStatus() == GameOutcomeStatus.UNFINISHED : return None
+    if gameOutcome.getGameStatus() == GameOutcomeStatus.DRAW : return 0
+
+    return 1 if gameOutcome.getWinner() == playerIndex else -1
+
+class Tablebase:
+    
+    """
+    A read-only tablebase: the perfect play value of every reachable position of a board size and a win condition,
+    computed once by the TablebaseSolver. The file is memory-mapped, so opening it costs nothing and only
+    the pages that are looked up are read. A lookup is a binary search over the sorted position indexes.
+    """
+
+    # The tablebases already looked for, by file name, None standing for a missing file
+    __tablebases__ : dict[str, Optional[Tablebase]] = {}
+
+    def __init__(self, path: str) -> None:
+        
+        """
+        Opens a tablebase file.
+        
+        Parameters:
+            path (str): The path of the file.
+        
+        Raises:
+            TypeError: If path is not a string.
+            ValueError: If the file is not a tablebase file.
+        
+        Returns:
+            None
+        """
+
+        # Check if path is a string
+        if not isinstance(path, str):
+            raise TypeError("path must be a string")
+
+        # Read the header
+        with open(path, "rb") as tablebaseFile : header : bytes = tablebaseFile.read(TABLEBASE_HEADER_SIZE)
+
+        if len(header) != TABLEBASE_HEADER_SIZE:
+            raise ValueError("the file is not a tablebase file")
+
+        magic, version, self.__width__, self.__height__, self.__alignLength__, self.__winConditionCode__, entryCount = struct.unpack(TABLEBASE_HEADER_FORMAT, header)
+
+        if magic != TABLEBASE_MAGIC or version != TABLEBASE_VERSION:
+            raise ValueError("the file is not a tablebase file")
+
+        # Map the position indexes and their values
+        self.__entryCount__ : int = entryCount
+        self.__positionIndexes__ : np.memmap = np.memmap(path, dtype=np.uint64, mode="r", offset=TABLEBASE_HEADER_SIZE, shape=(entryCount,))
+        self.__values__ : np.memmap = np.memmap(path, dtype=np.int16, mode="r", offset=TABLEBASE_HEADER_SIZE + entryCount * 8, shape=(entryCount,))
+
+        return None
+
+    @staticmethod
+    def getFileName(width: int, height: int, winCondition: WinCondition) -> Optional[str]:
+        
+        """
+        Returns the name of the tablebase file of a board size and a win condition.
+        
+        Parameters:
+            width (int): The board width.
+            height (int): The board height.
+            winCondition (WinCondition): The win condition.
+        
+        Returns:
+            Optional[str]: The file name, or None if no tablebase can be computed for the win condition.
+        """
+
+        if type(winCondition) not in WIN_CONDITION_CODES : return None
+
+        return f"{width}x{height}_{WIN_CONDITION_CODES[type(winCondition)]}_{winCondition.getAlignLength()}.tb"
+
+    @staticmethod
+    def find(gameState: TicTacToeGameState) -> Optional[Tablebase]:
+        
+        """
+        Returns the tablebase of the game, if its file was computed. Each file is only looked for once.
+        
+        Parameters:
+            gameState (TicTacToeGameState): The game state.
+        
+        Returns:
+            Optional[Tablebase]: The tablebase, or None if the game has none.
+        """
+
+        if not isPositionSupported(gameState) : return None
+
+        fileName : Optional[str] = Tablebase.getFileName(gameState.getBoard().getWidth(), gameState.getBoard().getHeight(), gameState.getWinCondition())
+        if fileName is None : return None
+
+        # Open the file the first time it is looked for
+        if fileName not in Tablebase.__tablebases__ :
+
+            path : str = os.path.join(TABLEBASE_DIRECTORY, fileName)
+            Tablebase.__tablebases__[fileName] = Tablebase(path) if os.path.isfile(path) else None
+
+        return Tablebase.__tablebases__[fileName]
+
+    def getValue(self, gameState: TicTacToeGameState) -> Optional[int]:
+        
+        """
+        Returns the perfect play value of a position, from the point of view of the player to play:
+        0 for a draw, n for a win in n plies, -n for a loss in n plies.
+        
+        Parameters:
+            gameState (TicTacToeGameState): The position.
+        
+        Raises:
+            TypeError: If gameState is not a TicTacToeGameState instance.
+        
+        Returns:
+            Optional[int]: The value of the position, or None if it is not in the tablebase.
+        """
+
+        # Check if gameState is a TicTacToeGameState instance
+        if not isinstance(gameState, TicTacToeGameState):
+            raise TypeError("gameState must be a TicTacToeGameState instance")
+
+        if not isPositionSupported(gameState) : return None
+
+        # Look for the index of the position
+        positionIndex : np.uint64 = np.uint64(getPositionIndex(gameState))
+        entryIndex : int = int(np.searchsorted(self.__positionIndexes__, positionIndex))
+
+        if entryIndex == self.__entryCount__ or self.__positionIndexes__[entryIndex] != positionIndex : return None
+
+        return int(self.__values__[entryIndex])
+
+    def getBestMove(self, gameState: TicTacToeGameState) -> Optional[Move]:
+        
+        """
+        Returns the perfect play move of a position: the fastest win, otherwise a draw, otherwise the slowest loss.
+        
+        Parameters:
+            gameState (TicTacToeGameState): The position.
+        
+        Raises:
+            TypeError: If gameState is not a TicTacToeGameState instance.
+        
+        Returns:
+            Optional[Move]: The best move, or None if a position reached by a move is not in the tablebase.
+        """
+
+        # Check if gameState is a TicTacToeGameState instance
+        if not isinstance(gameState, TicTacToeGameState):
+            raise TypeError("gameState must be a TicTacToeGameState instance")
+
+        playerIndex : int = gameState.getPlayerToPlayIndex()
+        bestMove : Optional[int] = None
+        bestValue : int = 0
+
+        # Get the value of each move, from the outcome of the move or from the value of the reached position
+        for move in gameState.getPossibleEncodedMoves():
+
+            gameOutcome : GameOutcome = gameState.playEncoded(move)
+            moveValue : Optional[int] = getMoveValue(gameOutcome, playerIndex)
+
+            if moveValue is None :
+
+                childValue : Optional[int] = self.getValue(gameState)
+                if childValue is not None : moveValue = getParentValue(childValue)
+
+            gameState.undoEncoded(move)
+
+            # Give up if a position is missing, the move could not be compared
+            if moveValue is None : return None
+
+            if bestMove is None or getValueRank(moveValue) > getValueRank(bestValue) : bestMove, bestValue = move, moveValue
+
+        if bestMove is None : return None
+
+        return gameState.decodeMove(bestMove)
+
+    def isMatching(self, width: int, height: int, winCondition: WinCondition) -> bool:
+        
+        """
+        Tells whether the tablebase was computed for a board size and a win condition.
+        
+        Parameters:
+            width (int): The board width.
+            height (int): The board height.
+            winCondition (WinCondition): The win condition.
+        
+        Returns:
+            bool: True if the tablebase matches, False otherwise.
+        """
+
+        if type(winCondition) not in WIN_CONDITION_CODES : return False
+
+        return (self.__width__, self.__height__, self.__winConditionCode__, self.__alignLength__) == (width, height, WIN_CONDITION_CODES[type(winCondition)], winCondition.getAlignLength())
+
+    def getEntryCount(self) -> int:
+        
+        """
+        Returns the amount of positions of the tablebase.
+        
+        Returns:
+            int: The amount of positions.
+        """
+
+        return self.__entryCount__
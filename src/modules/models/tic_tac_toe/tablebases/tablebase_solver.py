@@ -0,0 +1,209 @@
+from modules.models.board_game.board.board_builder import BoardBuilder
+from modules.models.board_game.components.win_condition import WinCondition
+from modules.models.board_game.game.game_outcome import GameOutcome
+from modules.models.entities.circle import Circle
+from modules.models.entities.cross import Cross
+from modules.models.tic_tac_toe.tic_tac_toe_game_state import TicTacToeGameState
+from modules.models.tic_tac_toe.tic_tac_toe_player_data import TicTacToePlayerData
+from modules.models.tic_tac_toe.moves.power_ups.bomb_move import BombMove
+from modules.models.tic_tac_toe.win_conditions.align_victory import AlignVictory
+from modules.models.tic_tac_toe.win_conditions.unalign_victory import UnalignVictory
+from modules.models.tic_tac_toe.tablebases.tablebase import Tablebase, TABLEBASE_DIRECTORY, TABLEBASE_MAGIC, TABLEBASE_VERSION, TABLEBASE_HEADER_FORMAT, WIN_CONDITION_CODES, getPositionIndex, getParentValue, getValueRank, getMoveValue
+
+from typing import Optional
+import argparse
+import os
+import struct
+import sys
+
+import numpy as np
+
+# ************************************************
+# CLASS TablebaseSolver
+# ************************************************
+# ROLE : This class is used to solve every reachable position of a small board and to write them in a tablebase file
+# ************************************************
+# VERSION : 1.0
+# AUTHOR : Nathan PINHEIRO
+# DATE : 13/01/2025
+# ************************************************
+
+class TablebaseSolver:
+    
+    """
+    Solves a game from its empty boards: with and without a bomb for each player, and for each starting player.
+    Every position reachable from them is solved once by a negamax search, its value being remembered by its tablebase index.
+    As symmetric positions share their index, only one of them is searched and stored.
+    The values are then written, sorted by index, in a tablebase file read by the Tablebase class.
+    
+    The amount of positions grows quickly with the board size: 3x3 boards are solved in seconds,
+    4x4 boards are only within reach without bombs, and with some patience.
+    """
+
+    def __init__(self, width: int, height: int, winCondition: WinCondition, withBombs: bool = True) -> None:
+        
+        """
+        Initializes the solver of a board size and a win condition.
+        
+        Parameters:
+            width (int): The board width.
+            height (int): The board height.
+            winCondition (WinCondition): The win condition.
+            withBombs (bool): Whether the games where the players start with a bomb are solved too (default is True).
+        
+        Raises:
+            TypeError: If width or height is not an integer.
+            ValueError: If the board has more than 16 cases, as its indexes would not fit on 64 bits.
+            TypeError: If winCondition is not a win condition a tablebase can be computed for.
+            TypeError: If withBombs is not a boolean.
+        
+        Returns:
+            None
+        """
+
+        # Check if width and height are integers and the board small enough
+        if not isinstance(width, int) or not isinstance(height, int):
+            raise TypeError("width and height must be integers")
+
+        if width <= 0 or height <= 0 or width * height > 16:
+            raise ValueError("the board must have between 1 and 16 cases")
+
+        # Check if winCondition can have a tablebase
+        if type(winCondition) not in WIN_CONDITION_CODES:
+            raise TypeError("winCondition must be an AlignVictory or an UnalignVictory")
+
+        # Check if withBombs is a boolean
+        if not isinstance(withBombs, bool):
+            raise TypeError("withBombs must be a boolean")
+
+        # Define the game to solve
+        self.__width__ : int = width
+        self.__height__ : int = height
+        self.__winCondition__ : WinCondition = winCondition
+        self.__withBombs__ : bool = withBombs
+
+        # Initialize the value of each solved position
+        self.__values__ : dict[int, int] = {}
+
+        return None
+
+    def solve(self) -> int:
+        
+        """
+        Solves every position reachable from the empty boards.
+        
+        Returns:
+            int: The amount of solved positions.
+        """
+
+        for bombCount in ([0, 1] if self.__withBombs__ else [0]):
+            for startingPlayer in range(2):
+
+                # Build the empty board, each player having a bomb or not
+                board = BoardBuilder([Circle(), Cross()]).setWidth(self.__width__).setHeight(self.__height__).buildOptimizedBoard()
+                gameState : TicTacToeGameState = TicTacToeGameState(board, self.__winCondition__, [TicTacToePlayerData([BombMove] * bombCount) for _ in range(2)], startingPlayer)
+
+                self.__solve__(gameState)
+
+        return len(self.__values__)
+
+    def write(self, path: Optional[str] = None) -> str:
+        
+        """
+        Writes the solved positions in a tablebase file: the header, the sorted position indexes, then their values.
+        
+        Parameters:
+            path (Optional[str]): The path of the file (default is None, for its name in the tablebase directory).
+        
+        Raises:
+            TypeError: If path is not a string.
+            ValueError: If no position is solved.
+        
+        Returns:
+            str: The path of the written file.
+        """
+
+        # Check if path is a string
+        if path is not None and not isinstance(path, str):
+            raise TypeError("path must be a string")
+
+        # Check if positions are solved
+        if len(self.__values__) == 0:
+            raise ValueError("no position is solved, solve must be called first")
+
+        # Get the default path, creating the tablebase directory
+        if path is None :
+
+            os.makedirs(TABLEBASE_DIRECTORY, exist_ok=True)
+            path = os.path.join(TABLEBASE_DIRECTORY, Tablebase.getFileName(self.__width__, self.__height__, self.__winCondition__))
+
+        # Sort the positions by index
+        positionIndexes : np.ndarray = np.fromiter(self.__values__.keys(), dtype=np.uint64, count=len(self.__values__))
+        values : np.ndarray = np.fromiter(self.__values__.values(), dtype=np.int16, count=len(self.__values__))
+        order : np.ndarray = np.argsort(positionIndexes)
+
+        # Write the file
+        with open(path, "wb") as tablebaseFile :
+
+            tablebaseFile.write(struct.pack(TABLEBASE_HEADER_FORMAT, TABLEBASE_MAGIC, TABLEBASE_VERSION, self.__width__, self.__height__, self.__winCondition__.getAlignLength(), WIN_CONDITION_CODES[type(self.__winCondition__)], len(self.__values__)))
+            tablebaseFile.write(positionIndexes[order].astype("<u8").tobytes())
+            tablebaseFile.write(values[order].astype("<i2").tobytes())
+
+        return path
+
+    def __solve__(self, gameState: TicTacToeGameState) -> int:
+        
+        """
+        Solves a position and every position reachable from it, by a negamax search over all the moves.
+        
+        Parameters:
+            gameState (TicTacToeGameState): The position, left as it was given.
+        
+        Returns:
+            int: The value of the position, from the point of view of the player to play.
+        """
+
+        positionIndex : int = getPositionIndex(gameState)
+        if positionIndex in self.__values__ : return self.__values__[positionIndex]
+
+        playerIndex : int = gameState.getPlayerToPlayIndex()
+        bestValue : Optional[int] = None
+
+        # Keep the best value of the moves, from their outcome or from the value of the reached position
+        for move in gameState.getPossibleEncodedMoves():
+
+            gameOutcome : GameOutcome = gameState.playEncoded(move)
+            moveValue : Optional[int] = getMoveValue(gameOutcome, playerIndex)
+
+            if moveValue is None : moveValue = getParentValue(self.__solve__(gameState))
+
+            gameState.undoEncoded(move)
+
+            if bestValue is None or getValueRank(moveValue) > getValueRank(bestValue) : bestValue = moveValue
+
+        # A position without any move is a draw
+        if bestValue is None : bestValue = 0
+
+        self.__values__[positionIndex] = bestValue
+
+        return bestValue
+
+if(__name__ == "__main__"):
+
+    # Read the game to solve from the command line, for example "python -m modules.models.tic_tac_toe.tablebases.tablebase_solver 3 3 3"
+    parser = argparse.ArgumentParser(description="Solves every reachable position of a small board and writes its tablebase file.")
+    parser.add_argument("width", type=int)
+    parser.add_argument("height", type=int)
+    parser.add_argument("alignLength", type=int)
+    parser.add_argument("--unalign", action="store_true", help="solve the game where aligning loses")
+    parser.add_argument("--no-bombs", action="store_true", help="only solve the games without bombs")
+    arguments = parser.parse_args()
+
+    # The search is deep, one level of recursion being used by each ply
+    sys.setrecursionlimit(10000)
+
+    winCondition : WinCondition = UnalignVictory(arguments.alignLength) if arguments.unalign else AlignVictory(arguments.alignLength)
+    solver : TablebaseSolver = TablebaseSolver(arguments.width, arguments.height, winCondition, not arguments.no_bombs)
+
+    print(f"Solved positions : {solver.solve()}")
+    print(f"Tablebase written to {solver.write()}")
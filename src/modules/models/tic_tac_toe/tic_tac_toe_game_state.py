@@ -1,14 +1,24 @@
 from __future__ import annotations
 from modules.models.board_game.board.board import Board
+from modules.models.board_game.board.boards.optimized_board import OptimizedBoard
+from modules.models.board_game.board.components.optimized_board_components.board_geometry import BoardGeometry
+from modules.models.board_game.board.components.optimized_board_components.batch_evaluator import BatchEvaluator
 from modules.models.board_game.components.win_condition import WinCondition
 from modules.models.tic_tac_toe.moves.simple_move import SimpleMove
 from modules.models.tic_tac_toe.moves.power_ups.bomb_move import BombMove
 from modules.models.board_game.components.move import Move
 from modules.models.board_game.components.coordinate import Coordinate
-from modules.models.board_game.game.game_outcome import GameOutcome
+from modules.models.board_game.game.game_outcome import GameOutcome, GameOutcomeStatus
 from modules.models.board_game.game.game_state import GameState
 from modules.models.tic_tac_toe.tic_tac_toe_player_data import TicTacToePlayerData
+from modules.models.tic_tac_toe.win_conditions.align_victory import AlignVictory
+from modules.models.tic_tac_toe.win_conditions.unalign_victory import UnalignVictory
 from modules.utils.decorator import override
+from modules.utils.trusted_mode import isTrustedModeOn
+
+from typing import Type
+
+import numpy as np
 
 # ************************************************
 # CLASS GameDirector
@@ -20,6 +30,15 @@ from modules.utils.decorator import override
 # DATE : 10/01/2025
 # ************************************************
 
+MOVE_TYPE_BITS = 2
+MOVE_TYPE_MASK = (1 << MOVE_TYPE_BITS) - 1
+
+SIMPLE_MOVE_TAG = 0
+ENCODED_MOVE_TYPES : list[Type[Move]] = [SimpleMove, BombMove]
+BOMB_MOVE_TAG = ENCODED_MOVE_TYPES.index(BombMove)
+
+# Under this amount of moves, the positions they reach are evaluated one by one rather than by batch
+BATCH_EVALUATION_MIN_MOVES = 8
 
 class TicTacToeGameState(GameState):
     """
@@ -71,6 +90,9 @@ class TicTacToeGameState(GameState):
         # Call the parent constructor
         super().__init__(board, winCondition, playersData, startingPlayer)
         
+        # Initialize the stack of power-up moves played through their encoded form, needed to undo them
+        self.__playedPowerUpMoves__ : list[Move] = []
+        
         return None
 
     def play(self, move: Move) -> GameOutcome:
@@ -88,19 +110,24 @@ class TicTacToeGameState(GameState):
             GameOutcome: The result of the game after the move.
         """
         
-        # Check if the move is a Move object
-        if not isinstance(move, Move):
-            raise TypeError("The move must be a Move object.")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if the move is a Move object
+            if not isinstance(move, Move):
+                raise TypeError("The move must be a Move object.")
         
         # Add the move to the game history
         self.getGameHistory().addMove(move)
         
-        # Play the move and check for a win condition
+        # Play the move and check for a win condition, only around the new piece for a simple move
         move.play(self.getBoard(), self.getPlayerToPlayIndex())
         if move.__class__ != SimpleMove: 
             self.getPlayerData(self.getPlayerToPlayIndex()).getPowerUpMoves().remove(move.__class__) 
 
-        gameOutcome : GameOutcome = self.checkWinForCurrentPlayer()
+        gameOutcome : GameOutcome
+        if move.__class__ == SimpleMove : gameOutcome = self.checkWinForCurrentPlayer(move.getCoordinate().getLine(), move.getCoordinate().getColumn())
+        else : gameOutcome = self.checkWinForCurrentPlayer()
         
         # Pass the turn to the next player
         self.__nextTurn__()
@@ -122,9 +149,12 @@ class TicTacToeGameState(GameState):
             bool: True if the operation was successful, False otherwise.
         """
         
-        # Check if the move is a Move object
-        if not isinstance(move, Move):
-            raise TypeError("The move must be a Move object.")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if the move is a Move object
+            if not isinstance(move, Move):
+                raise TypeError("The move must be a Move object.")
         
         # Check if there are moves to undo
         if self.getGameHistory().getMoveCount() <= 0: return False
@@ -216,6 +246,290 @@ class TicTacToeGameState(GameState):
 
         return possibleMoves
 
+    @override
+    def getPossibleEncodedMoves(self) -> list[int]:
+        
+        """
+        Retrieves all valid moves for the current player, encoded as integers.
+        An encoded move is the bit position of its case shifted by MOVE_TYPE_BITS, plus the tag of its move type.
+        Simple moves are read straight from the mask of the availlable cases, without building any move object.
+        
+        Returns:
+            list[int]: A list of possible encoded moves.
+        """
+        
+        board : Board = self.getBoard()
+        encodedMoves : list[int] = []
+        
+        # Add a simple move on each availlable case, from the lowest bit to the highest
+        availlableCases : int = board.getAvaillableCasesMask()
+        
+        while availlableCases :
+            lowestCase : int = availlableCases & -availlableCases
+            encodedMoves.append((lowestCase.bit_length() - 1) << MOVE_TYPE_BITS)
+            availlableCases ^= lowestCase
+        
+        # Add the power-up moves, each power-up type being considered only once
+        for moveType in dict.fromkeys(self.getPlayerData(self.getPlayerToPlayIndex()).getPowerUpMoves()):
+            
+            moveTag : int = ENCODED_MOVE_TYPES.index(moveType)
+            
+            for bitPosition in range(board.getWidth() * board.getHeight()):
+                line, column = divmod(bitPosition, board.getWidth())
+                if moveType.canPlay(board, line, column) : encodedMoves.append((bitPosition << MOVE_TYPE_BITS) | moveTag)
+        
+        return encodedMoves
+
+    @override
+    def getSymmetricMoveRepresentatives(self, encodedMoves: list[int]) -> dict[int, int]:
+        
+        """
+        Maps each encoded move to the representative of its equivalent moves, that is the first of them in the given list.
+        Two moves are symmetric when a symmetry of the board keeping the current position sends the case of one on the case of the other,
+        both moves being of the same type. As the bomb blast and the alignments are kept by the symmetries, they lead to symmetric positions.
+        Two bombs clearing the same pieces and blocked cases lead to the same position, so they are equivalent too,
+        and all the bombs clearing nothing share a single representative.
+        Once no power-up is left, a case lying on no open line can no longer take part in any alignment, so all the simple moves
+        on such dead cases are equivalent as well.
+        
+        Parameters:
+            encodedMoves (list[int]): The encoded moves.
+        
+        Returns:
+            dict[int, int]: The representative of each encoded move.
+        """
+        
+        board : Board = self.getBoard()
+        positionSymmetries : list[list[int]] = board.getPositionSymmetries()
+        representatives : dict[int, int] = {}
+        
+        # Get the dead cases, that no line can pass through anymore, as long as no power-up can open the lines again
+        winCondition : WinCondition = self.getWinCondition()
+        deadCases : int = 0
+        
+        if isinstance(winCondition, (AlignVictory, UnalignVictory)) and all(len(playerData.getPowerUpMoves()) == 0 for playerData in self.__playersData__) :
+            deadCases = board.getAvaillableCasesMask() & ~board.getOpenLineCasesMask(winCondition.getAlignLength())
+        
+        # Without any symmetry, bomb nor dead case, each move is its own representative
+        hasBombMoves : bool = any(encodedMove & MOVE_TYPE_MASK == BOMB_MOVE_TAG for encodedMove in encodedMoves)
+        if len(positionSymmetries) == 0 and not hasBombMoves and deadCases == 0 : return {encodedMove: encodedMove for encodedMove in encodedMoves}
+        
+        givenMoves : set[int] = set(encodedMoves)
+        
+        # The bombs are told apart by the cases they clear, that is their blast square among the taken cases
+        geometry : BoardGeometry = BoardGeometry.getGeometry(board.getWidth(), board.getHeight())
+        takenCases : int = geometry.getFullMask() & ~board.getAvaillableCasesMask()
+        bombRepresentatives : dict[int, int] = {}
+        deadCaseRepresentative : int | None = None
+        
+        # Give each move not reached yet as its own representative to the images of its case
+        for encodedMove in encodedMoves :
+            
+            if encodedMove in representatives : continue
+            
+            bitPosition : int = encodedMove >> MOVE_TYPE_BITS
+            moveTag : int = encodedMove & MOVE_TYPE_MASK
+            
+            # A bomb clearing the same cases as a previous one is represented by it
+            if moveTag == BOMB_MOVE_TAG :
+                
+                clearedCases : int = geometry.getNeighbourMask(bitPosition) & takenCases
+                
+                if clearedCases in bombRepresentatives :
+                    representatives[encodedMove] = bombRepresentatives[clearedCases]
+                    continue
+                
+                bombRepresentatives[clearedCases] = encodedMove
+            
+            # A simple move on a dead case is represented by the first one
+            elif moveTag == SIMPLE_MOVE_TAG and deadCases >> bitPosition & 1 :
+                
+                if deadCaseRepresentative is not None :
+                    representatives[encodedMove] = deadCaseRepresentative
+                    continue
+                
+                deadCaseRepresentative = encodedMove
+            
+            representatives[encodedMove] = encodedMove
+            
+            for positionMap in positionSymmetries :
+                
+                imageMove : int = (positionMap[bitPosition] << MOVE_TYPE_BITS) | moveTag
+                if imageMove in givenMoves and imageMove not in representatives : representatives[imageMove] = encodedMove
+                
+                # The bombs clearing the image of the cleared cases lead to a symmetric position
+                if moveTag == BOMB_MOVE_TAG : bombRepresentatives.setdefault(geometry.getNeighbourMask(positionMap[bitPosition]) & takenCases, encodedMove)
+        
+        return representatives
+
+    @override
+    def playEncoded(self, encodedMove: int) -> GameOutcome:
+        
+        """
+        Executes an encoded move, updates the game state, and checks for a win condition.
+        The move is not added to the game history. Simple moves are played without building any move object.
+        
+        Parameters:
+            encodedMove (int): The encoded move to execute.
+        
+        Raises:
+            TypeError: If the encoded move is not an integer.
+            ValueError: If the encoded move does not describe a move of this board.
+        
+        Returns:
+            GameOutcome: The result of the game after the move.
+        """
+        
+        # Decode the case and the type of the move
+        bitPosition, moveTag = self.__splitEncodedMove__(encodedMove)
+        line, column = divmod(bitPosition, self.getBoard().getWidth())
+        
+        # Play the move, keeping the power-up moves to be able to undo them, and check for a win condition
+        gameOutcome : GameOutcome
+        
+        if moveTag == SIMPLE_MOVE_TAG :
+            
+            self.getBoard().addPlayerEntityAt(line, column, self.getPlayerToPlayIndex())
+            gameOutcome = self.checkWinForCurrentPlayer(line, column)
+            
+        else :
+            
+            moveType : Type[Move] = ENCODED_MOVE_TYPES[moveTag]
+            move : Move = moveType(Coordinate(line, column))
+            
+            move.play(self.getBoard(), self.getPlayerToPlayIndex())
+            self.getPlayerData(self.getPlayerToPlayIndex()).getPowerUpMoves().remove(moveType)
+            self.__playedPowerUpMoves__.append(move)
+            
+            gameOutcome = self.checkWinForCurrentPlayer()
+        
+        # Pass the turn to the next player
+        self.__nextTurn__()
+        
+        return gameOutcome
+
+    @override
+    def undoEncoded(self, encodedMove: int) -> bool:
+        
+        """
+        Undoes the last encoded move played, reverting the game state.
+        
+        Parameters:
+            encodedMove (int): The encoded move to undo.
+        
+        Raises:
+            TypeError: If the encoded move is not an integer.
+            ValueError: If the encoded move does not describe a move of this board.
+        
+        Returns:
+            bool: True if the operation was successful.
+        """
+        
+        # Decode the case and the type of the move
+        bitPosition, moveTag = self.__splitEncodedMove__(encodedMove)
+        line, column = divmod(bitPosition, self.getBoard().getWidth())
+        
+        # Revert the turn and undo the move
+        self.__previousTurn__()
+        
+        if moveTag == SIMPLE_MOVE_TAG :
+            self.getBoard().removeEntityAt(line, column)
+            
+        else :
+            
+            move : Move = self.__playedPowerUpMoves__.pop()
+            
+            move.undo(self.getBoard(), self.getPlayerToPlayIndex())
+            self.getPlayerData(self.getPlayerToPlayIndex()).getPowerUpMoves().append(move.__class__)
+        
+        return True
+
+    @override
+    def encodeMove(self, move: Move) -> int:
+        
+        """
+        Encodes a move as an integer.
+        
+        Parameters:
+            move (Move): The move to encode.
+        
+        Raises:
+            TypeError: If the move is not a Move object.
+            ValueError: If the move type can't be encoded.
+        
+        Returns:
+            int: The encoded move.
+        """
+        
+        # Check if the move is a Move object
+        if not isinstance(move, Move):
+            raise TypeError("The move must be a Move object.")
+        
+        # Check if the move type can be encoded
+        if move.__class__ not in ENCODED_MOVE_TYPES:
+            raise ValueError(f"Can't encode a move of type {move.__class__.__name__}.")
+        
+        # Get the bit position of the move case
+        bitPosition : int = move.getCoordinate().getLine() * self.getBoard().getWidth() + move.getCoordinate().getColumn()
+        
+        return (bitPosition << MOVE_TYPE_BITS) | ENCODED_MOVE_TYPES.index(move.__class__)
+
+    @override
+    def decodeMove(self, encodedMove: int) -> Move:
+        
+        """
+        Builds the move object described by an encoded move.
+        
+        Parameters:
+            encodedMove (int): The encoded move.
+        
+        Raises:
+            TypeError: If the encoded move is not an integer.
+            ValueError: If the encoded move does not describe a move of this board.
+        
+        Returns:
+            Move: The decoded move.
+        """
+        
+        # Decode the case and the type of the move
+        bitPosition, moveTag = self.__splitEncodedMove__(encodedMove)
+        line, column = divmod(bitPosition, self.getBoard().getWidth())
+        
+        return ENCODED_MOVE_TYPES[moveTag](Coordinate(line, column))
+
+    def __splitEncodedMove__(self, encodedMove: int) -> tuple[int, int]:
+        
+        """
+        Splits an encoded move into the bit position of its case and the tag of its type.
+        
+        Parameters:
+            encodedMove (int): The encoded move.
+        
+        Raises:
+            TypeError: If the encoded move is not an integer.
+            ValueError: If the encoded move does not describe a move of this board.
+        
+        Returns:
+            tuple[int, int]: The bit position and the move type tag.
+        """
+        
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if the encoded move is an integer
+            if not isinstance(encodedMove, int):
+                raise TypeError("The encoded move must be an integer.")
+            
+            # Check if the encoded move describes a move of this board
+            if encodedMove < 0 or (encodedMove >> MOVE_TYPE_BITS) >= self.getBoard().getWidth() * self.getBoard().getHeight() or (encodedMove & MOVE_TYPE_MASK) >= len(ENCODED_MOVE_TYPES):
+                raise ValueError(f"The encoded move <{encodedMove}> does not describe a move of this board.")
+        
+        # Split the encoded move
+        bitPosition : int = encodedMove >> MOVE_TYPE_BITS
+        moveTag : int = encodedMove & MOVE_TYPE_MASK
+        
+        return bitPosition, moveTag
+
     @override
     def getPlayerData(self, playerIndex: int) -> TicTacToePlayerData:
         
@@ -238,6 +552,188 @@ class TicTacToeGameState(GameState):
         
         return self.__playersData__[playerIndex]
 
+    @override
+    def checkWin(self) -> GameOutcome:
+        
+        """
+        Checks if any player has met the win condition.
+        
+        Returns:
+            GameOutcome: The outcome of the game.
+        """
+        
+        return self.__keepGameOpenForPowerUps__(super().checkWin())
+
+    @override
+    def checkWinForPlayer(self, playerIndex: int) -> GameOutcome:
+        
+        """
+        Checks if a specific player has met the win condition.
+        
+        Parameters:
+            playerIndex (int): The index of the player to check.
+            
+        Raises:
+            ValueError: If playerIndex is not a valid player index.
+            
+        Returns:
+            GameOutcome: The outcome of the game.
+        """
+        
+        return self.__keepGameOpenForPowerUps__(super().checkWinForPlayer(playerIndex))
+
+    @override
+    def checkWinForCurrentPlayer(self, line: int | None = None, column: int | None = None) -> GameOutcome:
+        
+        """
+        Checks if the current player has met the win condition.
+        When the case of the last piece played by the current player is given, the win condition may only check around it.
+        
+        Parameters:
+            line (int | None): The line of the last piece played (default is None, to check the whole board).
+            column (int | None): The column of the last piece played (default is None, to check the whole board).
+        
+        Returns:
+            GameOutcome: The outcome of the game.
+        """
+        
+        return self.__keepGameOpenForPowerUps__(super().checkWinForCurrentPlayer(line, column))
+
+    def __keepGameOpenForPowerUps__(self, gameOutcome: GameOutcome) -> GameOutcome:
+        
+        """
+        Keeps the game going when the win condition reports a draw because no line can be completed anymore,
+        while a player still has a power-up: a bomb can clear the cases closing the lines and open them again.
+        A full board stays a draw, as it always was.
+        
+        Parameters:
+            gameOutcome (GameOutcome): The outcome given by the win condition.
+        
+        Returns:
+            GameOutcome: The outcome of the game.
+        """
+        
+        if gameOutcome.getGameStatus() != GameOutcomeStatus.DRAW or self.getBoard().isFull() : return gameOutcome
+        if all(len(playerData.getPowerUpMoves()) == 0 for playerData in self.__playersData__) : return gameOutcome
+        
+        return GameOutcome(GameOutcomeStatus.UNFINISHED)
+
+    @override
+    def evaluateEncodedMoves(self, encodedMoves: list[int], playerIndex: int) -> list[float | None]:
+        
+        """
+        Evaluates the position reached by each encoded move for a player, as evaluateForPlayer would once the move is played.
+        The moves ending the game are not evaluated, their outcome being up to the caller.
+        
+        On an optimized board, with an alignment based win condition, the positions are not played: the masks of the pieces
+        they reach are built as NumPy arrays, a simple move adding its case to the pieces of the player to play
+        and a bomb clearing its case and its neighbours. All the positions are then evaluated at once by a BatchEvaluator.
+        
+        Parameters:
+            encodedMoves (list[int]): The encoded moves of the player to play.
+            playerIndex (int): The index of the player to evaluate the positions for.
+        
+        Returns:
+            list[float | None]: The evaluation of the position reached by each move, or None if the move ends the game.
+        """
+        
+        board : Board = self.getBoard()
+        winCondition : WinCondition = self.getWinCondition()
+        
+        # Evaluate the moves one by one if they are too few, or if their positions can not be evaluated by batch
+        if len(encodedMoves) < BATCH_EVALUATION_MIN_MOVES or not isinstance(board, OptimizedBoard) or not isinstance(winCondition, (AlignVictory, UnalignVictory)) :
+            return super().evaluateEncodedMoves(encodedMoves, playerIndex)
+        
+        geometry : BoardGeometry = BoardGeometry.getGeometry(board.getWidth(), board.getHeight())
+        
+        # Get the case and the type of each move
+        moves : np.ndarray = np.array(encodedMoves, dtype=np.int64)
+        bitPositions : np.ndarray = (moves >> MOVE_TYPE_BITS).astype(np.uint64)
+        isSimpleMove : np.ndarray = (moves & MOVE_TYPE_MASK) == SIMPLE_MOVE_TAG
+        isBombMove : np.ndarray = (moves & MOVE_TYPE_MASK) == BOMB_MOVE_TAG
+        
+        if not np.all(isSimpleMove | isBombMove) : return super().evaluateEncodedMoves(encodedMoves, playerIndex)
+        
+        # Get the cases cleared by each bomb
+        clearedMasks : np.ndarray = np.zeros(len(encodedMoves), dtype=np.uint64)
+        clearedMasks[isBombMove] = [geometry.getNeighbourMask(int(bitPosition)) for bitPosition in bitPositions[isBombMove]]
+        
+        # Build the masks of the positions reached by the moves
+        playerMasks : np.ndarray = np.array([board.getPlayerCasesMask(index) for index in range(self.getPlayerCount())], dtype=np.uint64)[:, np.newaxis] & ~clearedMasks
+        playerMasks[self.getPlayerToPlayIndex()] |= np.where(isSimpleMove, np.left_shift(np.uint64(1), bitPositions), np.uint64(0))
+        blockedMasks : np.ndarray = np.uint64(board.getBlockedCasesMask()) & ~clearedMasks
+        
+        # Evaluate them, a position where a player has a line or where the board is full ending the game
+        isAligned, strengths, hasOpenLine = BatchEvaluator.getEvaluator(geometry, winCondition.getAlignLength()).evaluate(playerMasks, blockedMasks)
+        isFull : np.ndarray = (np.bitwise_or.reduce(playerMasks, axis=0) | blockedMasks) == np.uint64(geometry.getFullMask())
+        
+        # A position where no line is open is a draw too, once no power-up is left to open one again
+        powerUpCount : int = sum(len(playerData.getPowerUpMoves()) for playerData in self.__playersData__)
+        isDeadDraw : np.ndarray = ~hasOpenLine & (powerUpCount - isBombMove == 0)
+        
+        isGameOver : list[bool] = (isAligned.any(axis=0) | isFull | isDeadDraw).tolist()
+        
+        return [None if isGameOver[moveIndex] else winCondition.evaluateStrengthsForPlayer(playerIndex, positionStrengths) for moveIndex, positionStrengths in enumerate(strengths.T.tolist())]
+
+    @override
+    def getPositionKey(self) -> int:
+        
+        """
+        Returns a key identifying the current position.
+        On top of the board and the player to play, the power-ups still availlable for each player are part of the position.
+        The power-ups are described by their encoded move type, so that the key of a position is the same in every process.
+        
+        Returns:
+            int: The key of the current position.
+        """
+
+        # Get the encoded move type of the power-ups still availlable for each player
+        powerUpMoves : tuple = tuple(tuple(ENCODED_MOVE_TYPES.index(powerUpMove) for powerUpMove in playerData.getPowerUpMoves()) for playerData in self.__playersData__)
+
+        return hash((hash(self.getBoard()), self.getPlayerToPlayIndex(), powerUpMoves))
+
+    def getCompactState(self) -> tuple:
+        
+        """
+        Returns a compact description of the game state, made to be sent to another process and rebuilt there with fromCompactState.
+        The game history is not part of it.
+        
+        Returns:
+            tuple: The compact description of the board, the win condition, the power-ups of each player and the player to play.
+        """
+        
+        powerUpMoves : tuple = tuple(tuple(playerData.getPowerUpMoves()) for playerData in self.__playersData__)
+        
+        return (self.getBoard().getCompactState(), self.__winCondition__, powerUpMoves, self.getPlayerToPlayIndex())
+
+    @staticmethod
+    def fromCompactState(compactState: tuple) -> TicTacToeGameState:
+        
+        """
+        Rebuilds a game state from the compact description returned by getCompactState.
+        
+        Parameters:
+            compactState (tuple): The compact description of the game state.
+        
+        Raises:
+            TypeError: If compactState is not a tuple.
+            ValueError: If compactState does not describe a game state.
+        
+        Returns:
+            TicTacToeGameState: The rebuilt game state, with an empty history.
+        """
+        
+        # Check if compactState is a tuple describing a game state
+        if not isinstance(compactState, tuple):
+            raise TypeError("compactState must be a tuple")
+        
+        if len(compactState) != 4:
+            raise ValueError("compactState must describe a game state")
+        
+        boardState, winCondition, powerUpMoves, playerToPlayIndex = compactState
+        
+        return TicTacToeGameState(Board.fromCompactState(boardState), winCondition, [TicTacToePlayerData(list(playerPowerUpMoves)) for playerPowerUpMoves in powerUpMoves], playerToPlayIndex)
+
     def copy(self) -> TicTacToeGameState :
         
         """
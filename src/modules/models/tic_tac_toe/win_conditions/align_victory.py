@@ -1,6 +1,7 @@
 from modules.models.board_game.board.board import Board
 from modules.models.board_game.components.win_condition import WinCondition
 from modules.models.board_game.game.game_outcome import GameOutcome, GameOutcomeStatus
+from modules.utils.trusted_mode import isTrustedModeOn
 
 MIN_ENTITY_TO_ALIGN = 3
 
@@ -39,6 +40,17 @@ class AlignVictory(WinCondition) :
         
         return None
 
+    def getAlignLength(self) -> int:
+        
+        """
+        Returns the number of consecutive entities of the alignment.
+        
+        Returns:
+            int: The alignment length.
+        """
+        
+        return self.__alignLength__
+    
     def checkWin(self, board : Board) -> GameOutcome:
 
         """
@@ -51,7 +63,7 @@ class AlignVictory(WinCondition) :
             TypeError: If the board is not a Board object.
         
         Returns:
-            GameOutcome: VICTORY if a player wins, DRAW if the board is full, or UNFINISHED if the game continues.
+            GameOutcome: VICTORY if a player wins, DRAW if the board is full or no line can be completed anymore, or UNFINISHED if the game continues.
         """
         
         # Check if the board is a Board object
@@ -63,10 +75,10 @@ class AlignVictory(WinCondition) :
 
         # Return the game outcome
         if(winnerIndex != -1) : return GameOutcome(GameOutcomeStatus.VICTORY, winnerIndex)
-        elif(board.isFull()) : return GameOutcome(GameOutcomeStatus.DRAW)
+        elif(board.isFull() or not board.hasOpenLine(self.__alignLength__)) : return GameOutcome(GameOutcomeStatus.DRAW)
         else : return GameOutcome(GameOutcomeStatus.UNFINISHED)
     
-    def checkWinForPlayer(self, playerIndex : int, board : Board) -> GameOutcome:
+    def checkWinForPlayer(self, playerIndex : int, board : Board, line : int | None = None, column : int | None = None) -> GameOutcome:
 
         """
         Checks if a specific player has achieved the alignment required to win.
@@ -74,29 +86,43 @@ class AlignVictory(WinCondition) :
         Parameters:
             playerIndex (int): The index of the player to check.
             board (Board): The current game board.
+            line (int | None): The line of the last piece played by the player (default is None, to check the whole board).
+            column (int | None): The column of the last piece played by the player (default is None, to check the whole board).
             
         Raises:
             TypeError: If the board is not a Board object.
             ValueError: If the player index is not an integer or is out of bounds.
         
         Returns:
-            GameOutcome: VICTORY if the player wins, DRAW if the board is full, or UNFINISHED if the game continues.
+            GameOutcome: VICTORY if the player wins, DRAW if the board is full or no line can be completed anymore, or UNFINISHED if the game continues.
         """
         
-        # Check if the board is a Board object
-        if not isinstance(board, Board):
-            raise TypeError("The board must be a Board object.")
-        
-        # Check if the player index is an integer and in bounds
-        if not isinstance(playerIndex, int):
-            raise ValueError("The player index must be an integer.")
-        
-        if playerIndex < 0 or playerIndex >= board.getPlayerCount():
-            raise ValueError("The player index must be a valid index.")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if the board is a Board object
+            if not isinstance(board, Board):
+                raise TypeError("The board must be a Board object.")
+
+            # Check if the player index is an integer and in bounds
+            if not isinstance(playerIndex, int):
+                raise ValueError("The player index must be an integer.")
+
+            if playerIndex < 0 or playerIndex >= board.getPlayerCount():
+                raise ValueError("The player index must be a valid index.")
+
+            # Check if the line and column are both given or both missing
+            if (line is None) != (column is None):
+                raise ValueError("The line and the column must be both given or both missing.")
 
         # Check if the player has achieved the required alignment length to win or if the board is full and return the game outcome
-        if(board.checkAlignmentForPlayer(playerIndex, self.__alignLength__)) : return GameOutcome(GameOutcomeStatus.VICTORY, playerIndex)
-        elif(board.isFull()) : return GameOutcome(GameOutcomeStatus.DRAW)
+        # As the player had no alignment before its last piece, only the lines passing through this piece need to be checked
+        isAligned : bool
+        if line is not None : isAligned = board.checkAlignmentOnCaseForPlayer(line, column, playerIndex, self.__alignLength__)
+        else : isAligned = board.checkAlignmentForPlayer(playerIndex, self.__alignLength__)
+
+        if(isAligned) : return GameOutcome(GameOutcomeStatus.VICTORY, playerIndex)
+        elif(board.isFull() or not board.hasOpenLine(self.__alignLength__)) : return GameOutcome(GameOutcomeStatus.DRAW)
         else : return GameOutcome(GameOutcomeStatus.UNFINISHED)
 
     def evaluateForPlayer(self, playerToEvaluateIndex : int, board : Board) -> int:
@@ -117,28 +143,39 @@ class AlignVictory(WinCondition) :
             int: A normalized score representing the player's advantage.
         """
         
-        # Check if the board is a Board object
-        if not isinstance(board, Board):
-            raise TypeError("The board must be a Board object.")
+        # Check the arguments, unless the caller is trusted
+        if not isTrustedModeOn() :
+            
+            # Check if the board is a Board object
+            if not isinstance(board, Board):
+                raise TypeError("The board must be a Board object.")
+
+            # Check if the player index is an integer and in bounds
+            if not isinstance(playerToEvaluateIndex, int):
+                raise ValueError("The player index must be an integer.")
+
+            if playerToEvaluateIndex < 0 or playerToEvaluateIndex >= board.getPlayerCount():
+                raise ValueError("The player index must be a valid index.")
+        
+        return self.evaluateStrengthsForPlayer(playerToEvaluateIndex, board.getAlignmentStrengths(self.__alignLength__))
+
+    def evaluateStrengthsForPlayer(self, playerToEvaluateIndex : int, alignStrengths : list[int]) -> float:
+        
+        """
+        Evaluates a board for a specific player from the alignment strength of each player on it, as given by Board.getAlignmentStrengths.
+        It lets positions whose strengths are computed together, without building their boards, be evaluated as evaluateForPlayer would.
         
-        # Check if the player index is an integer and in bounds
-        if not isinstance(playerToEvaluateIndex, int):
-            raise ValueError("The player index must be an integer.")
+        Parameters:
+            playerToEvaluateIndex (int): The index of the player to evaluate.
+            alignStrengths (list[int]): The alignment strength of each player.
         
-        if playerToEvaluateIndex < 0 or playerToEvaluateIndex >= board.getPlayerCount():
-            raise ValueError("The player index must be a valid index.")
+        Returns:
+            float: A normalized score representing the player's advantage.
+        """
         
-        # Initialize the alignment strength for the player and the opponents
-        playerAlignStrength : int = 0
-        oponentsAlignStrength : int = 0
-
-        # Check the alignment strength for each player
-        for pieceCount in range(2, self.__alignLength__) :
-            for playerIndex in range(0, len(board.getPlayerEntities())):
-                
-                # Check if the player is the one to evaluate or an opponent and update the alignment strength
-                if(playerIndex == playerToEvaluateIndex): playerAlignStrength += 2 * pieceCount * board.countAvaillableLineOfAtLeastGivenPiece(playerIndex, self.__alignLength__, pieceCount)
-                else : oponentsAlignStrength += 2 * pieceCount * board.countAvaillableLineOfAtLeastGivenPiece(playerIndex, self.__alignLength__, pieceCount)
+        # Get the alignment strength of the player and of its opponents
+        playerAlignStrength : int = alignStrengths[playerToEvaluateIndex]
+        oponentsAlignStrength : int = sum(alignStrengths) - playerAlignStrength
 
         # Calculate the total strength
         totalStrength = playerAlignStrength + oponentsAlignStrength
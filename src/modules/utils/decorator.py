@@ -6,32 +6,23 @@ def privatemethod(func: Callable) -> Callable:
     
     """
     Decorator to mark a method as private.
+    The name of the method is checked once, when the method is decorated, and the method itself is returned,
+    so calling it costs nothing more than calling an undecorated method.
     
     Parameters:
         func (function): The method to be marked as private.
         
+    Raises:
+        AttributeError: If the name of the method does not start with an underscore.
+    
     Returns:
-        function: The wrapped method.
+        function: The method.
     """
     
-    def wrapper(*args: tuple, **kwargs: dict) -> Any:
-        
-        """
-        Verifies if the method is private and raises an error if it is accessed directly.
-
-        Parameters:
-            *args (tuple): The arguments of the method.
-            **kwargs (dict): The keyword arguments of the method.
-
-        Returns:
-            Any: The result of the method.
-        """
-        
-        if not func.__name__.startswith("_"): 
-            raise AttributeError(f"Method {func.__name__} is private and cannot be accessed directly.")
-        return func(*args, **kwargs)
+    if not func.__name__.startswith("_"): 
+        raise AttributeError(f"Method {func.__name__} is marked as private but its name does not start with an underscore.")
     
-    return wrapper
+    return func
 
 def deprecated_class(cls: classmethod) -> Callable:
     
@@ -70,36 +61,81 @@ def deprecated_class(cls: classmethod) -> Callable:
     
     return wrapper
 
-def override(method: Callable) -> Callable:
+class OverrideChecker:
     
     """
-    A decorator to ensure that a method overrides a method in the superclass.
+    Holds a method marked with the override decorator until its class is created.
+    Once the class is created, it checks that the method overrides a method of a superclass
+    and puts the method itself back in the class in its place.
+    """
     
-    Parameters:
-        method (function): The method to be checked.
+    def __init__(self, method: Callable) -> None:
         
-    Returns:
-        function: The wrapped method.
-    """
+        """
+        Initializes the checker with the method to check.
+        
+        Parameters:
+            method (function): The method to be checked.
+        
+        Returns:
+            None
+        """
+        
+        self.__method__: Callable = method
+        self.__isabstractmethod__: bool = getattr(method, "__isabstractmethod__", False)
+        
+        return None
     
-    def wrapper(self, *args: tuple, **kwargs: dict) -> Any:
+    def __set_name__(self, owner: type, name: str) -> None:
         
         """
-        Verifies if the method overrides a method in the superclass.
+        Verifies that the method overrides a method in a superclass of its class, then replaces the checker by the method.
         
         Parameters:
-            self (object): The object that contains the method.
-            *args (tuple): The arguments of the method.
-            **kwargs (dict): The keyword arguments of the method.
-            
+            owner (type): The class that contains the method.
+            name (str): The name of the method in the class.
+        
+        Raises:
+            NotImplementedError: If no superclass has a method with this name.
+        
         Returns:
-            Any: The result of the method.
+            None
         """
         
-        for base_class in self.__class__.__bases__:
-            
-            if hasattr(base_class, method.__name__) : return method(self, *args, **kwargs)
-            
-        raise NotImplementedError(f"Method '{method.__name__}' does not override any method in superclass.")
+        if not any(hasattr(baseClass, name) for baseClass in owner.__mro__[1:]):
+            raise NotImplementedError(f"Method '{name}' does not override any method in superclass.")
+        
+        setattr(owner, name, self.__method__)
+        
+        return None
+    
+    def __get__(self, instance: object, owner: type = None) -> Any:
+        
+        """
+        Returns the method bound to the instance, for a checker that was not put in a class at its creation.
+        
+        Parameters:
+            instance (object): The object the method is accessed from.
+            owner (type): The class the method is accessed from.
+        
+        Returns:
+            Any: The bound method.
+        """
+        
+        return self.__method__.__get__(instance, owner)
+
+def override(method: Callable) -> Callable:
+    
+    """
+    A decorator to ensure that a method overrides a method in the superclass.
+    The check is done once, when the class containing the method is created, and the method itself is then put in the class,
+    so calling it costs nothing more than calling an undecorated method.
+    
+    Parameters:
+        method (function): The method to be checked.
+        
+    Returns:
+        function: The checker standing for the method until its class is created.
+    """
     
-    return wrapper
\ No newline at end of file
+    return OverrideChecker(method)
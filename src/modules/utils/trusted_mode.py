@@ -0,0 +1,57 @@
+import os
+
+# ************************************************
+# Trusted mode
+# ************************************************
+# ROLE : This module tells the hot paths of the game (boards, moves, game states and analysers)
+#        whether they can skip the checks of their arguments
+# ************************************************
+# VERSION : 1.0
+# AUTHOR : Nathan PINHEIRO
+# DATE : 13/01/2025
+# ************************************************
+
+# The trusted mode is off by default. It is turned on when python runs with -O,
+# when this environment variable is set to 1, true, yes or on, or by calling setTrustedMode.
+# In trusted mode, the internal calls skip the isinstance and range checks of their arguments,
+# so a wrong argument is no longer reported and may corrupt the game.
+# The public entry points (game directors, GUI and human players) always check what they are given.
+TRUSTED_MODE_ENVIRONMENT_VARIABLE = "TIC_TAC_TOE_TRUSTED_MODE"
+
+__isTrustedModeOn__ : bool = not __debug__ or os.environ.get(TRUSTED_MODE_ENVIRONMENT_VARIABLE, "").lower() in ("1", "true", "yes", "on")
+
+def isTrustedModeOn() -> bool:
+    
+    """
+    Tells whether the internal calls can skip the checks of their arguments.
+    
+    Returns:
+        bool: True if the trusted mode is on, False otherwise.
+    """
+
+    return __isTrustedModeOn__
+
+def setTrustedMode(isOn: bool) -> bool:
+    
+    """
+    Turns the trusted mode on or off.
+    
+    Parameters:
+        isOn (bool): True to skip the checks of the internal calls, False to run them.
+    
+    Raises:
+        TypeError: If isOn is not a boolean.
+    
+    Returns:
+        bool: True if the trusted mode is set.
+    """
+
+    global __isTrustedModeOn__
+
+    # Check if isOn is a boolean
+    if not isinstance(isOn, bool):
+        raise TypeError("isOn must be a boolean")
+
+    __isTrustedModeOn__ = isOn
+
+    return True